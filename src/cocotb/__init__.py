@@ -35,13 +35,15 @@ import time
 import warnings
 from collections.abc import Coroutine
 from enum import auto
-from types import SimpleNamespace
-from typing import Any, Dict, List, Union, cast
+from types import CoroutineType, SimpleNamespace
+from typing import Any, Dict, List, Optional, Union, cast
 
+import cocotb._import_cache
 import cocotb._profiling
 import cocotb.handle
 import cocotb.task
 import cocotb.triggers
+import cocotb.utils
 from cocotb._scheduler import Scheduler
 from cocotb._utils import DocEnum
 from cocotb.logging import default_config
@@ -57,7 +59,9 @@ from cocotb._decorators import (  # isort: skip # noqa: F401
     test,
     parametrize,
 )
-from cocotb.logging import _filter_from_c, _log_from_c  # isort: skip # noqa: F401
+from cocotb._process_pool import run_in_process  # isort: skip # noqa: F401
+from cocotb._asyncio_bridge import from_asyncio, to_asyncio  # isort: skip # noqa: F401
+from cocotb.logging import _log_from_c, _log_threshold_from_c  # isort: skip # noqa: F401
 
 
 log: py_logging.Logger
@@ -83,6 +87,7 @@ packages: SimpleNamespace
 
 This will be populated with handles at test time if packages can be discovered
 via the GPI.
+The packages are discovered when this is first accessed.
 
 .. versionadded:: 2.0
 """
@@ -142,14 +147,14 @@ def _task_done_callback(task: "cocotb.task.Task[Any]") -> None:
     # if cancelled, do nothing
     if task.cancelled():
         return
-    # if there's a Task awaiting this one, don't fail
-    join = cocotb.triggers._Join(task)
-    if join in cocotb._scheduler_inst._trigger2tasks:
-        return
     # if no failure, do nothing
     e = task.exception()
     if e is None:
         return
+    # if there's a Task awaiting this one, don't fail
+    join = cocotb.triggers._Join(task)
+    if join in cocotb._scheduler_inst._trigger2tasks:
+        return
     # there was a failure and no one is watching, fail test
     elif isinstance(e, (TestSuccess, AssertionError)):
         task.log.info("Test stopped by this task")
@@ -161,6 +166,8 @@ def _task_done_callback(task: "cocotb.task.Task[Any]") -> None:
 
 def start_soon(
     coro: "Union[cocotb.task.Task[cocotb.task.ResultType], Coroutine[Any, Any, cocotb.task.ResultType]]",
+    *,
+    priority: Optional[int] = None,
 ) -> "cocotb.task.Task[cocotb.task.ResultType]":
     """
     Schedule a coroutine to be run concurrently.
@@ -170,13 +177,17 @@ def start_soon(
 
     Args:
         coro: A task or coroutine to be run.
+        priority: Set the :attr:`~cocotb.task.Task.priority` of the task.
 
     Returns:
         The :class:`~cocotb.task.Task` that is scheduled to be run.
 
     .. versionadded:: 1.6.0
+
+    .. versionchanged:: 2.0
+        Added the *priority* argument.
     """
-    task = create_task(coro)
+    task = create_task(coro, priority=priority)
     task._add_done_callback(_task_done_callback)
     cocotb._scheduler_inst._schedule_task(task)
     return task
@@ -184,6 +195,8 @@ def start_soon(
 
 async def start(
     coro: "Union[cocotb.task.Task[cocotb.task.ResultType], Coroutine[Any, Any, cocotb.task.ResultType]]",
+    *,
+    priority: Optional[int] = None,
 ) -> "cocotb.task.Task[cocotb.task.ResultType]":
     """
     Schedule a coroutine to be run concurrently, then yield control to allow pending tasks to execute.
@@ -195,19 +208,25 @@ async def start(
 
     Args:
         coro: A task or coroutine to be run.
+        priority: Set the :attr:`~cocotb.task.Task.priority` of the task.
 
     Returns:
         The :class:`~cocotb.task.Task` that has been scheduled and allowed to execute.
 
     .. versionadded:: 1.6.0
+
+    .. versionchanged:: 2.0
+        Added the *priority* argument.
     """
-    task = start_soon(coro)
+    task = start_soon(coro, priority=priority)
     await cocotb.triggers.NullTrigger()
     return task
 
 
 def create_task(
     coro: "Union[cocotb.task.Task[cocotb.task.ResultType], Coroutine[Any, Any, cocotb.task.ResultType]]",
+    *,
+    priority: Optional[int] = None,
 ) -> "cocotb.task.Task[cocotb.task.ResultType]":
     """
     Construct a coroutine into a :class:`~cocotb.task.Task` without scheduling the task.
@@ -216,16 +235,23 @@ def create_task(
 
     Args:
         coro: An existing task or a coroutine to be wrapped.
+        priority: Set the :attr:`~cocotb.task.Task.priority` of the task.
 
     Returns:
         Either the provided :class:`~cocotb.task.Task` or a new Task wrapping the coroutine.
 
     .. versionadded:: 1.6.0
+
+    .. versionchanged:: 2.0
+        Added the *priority* argument.
     """
-    if isinstance(coro, cocotb.task.Task):
-        return coro
+    # checking the exact type first, as isinstance against the Coroutine ABC is slow
+    if type(coro) is CoroutineType:
+        task = cocotb.task.Task(coro)
+    elif isinstance(coro, cocotb.task.Task):
+        task = coro
     elif isinstance(coro, Coroutine):
-        return cocotb.task.Task(coro)
+        task = cocotb.task.Task(coro)
     elif inspect.iscoroutinefunction(coro):
         raise TypeError(
             f"Coroutine function {coro} should be called prior to being scheduled."
@@ -240,6 +266,9 @@ def create_task(
             f"Attempt to add an object of type {type(coro)} to the scheduler, "
             f"which isn't a coroutine: {coro!r}\n"
         )
+    if priority is not None:
+        task.priority = priority
+    return task
 
 
 def _initialise_testbench(argv_):  # pragma: no cover
@@ -248,6 +277,7 @@ def _initialise_testbench(argv_):  # pragma: no cover
         _initialise_testbench_(argv_)
     except BaseException:
         log.exception("cocotb testbench initialization failed. Exiting.")
+        cocotb.logging._flush()
         from cocotb import simulator
 
         simulator.stop_simulator()
@@ -290,7 +320,9 @@ def _initialise_testbench_(argv_):
     )
 
     _process_plusargs()
-    _process_packages()
+    if sys.version_info < (3, 7):  # noqa: UP036 | Python 3.6 is still supported
+        # no module __getattr__ to discover the packages when they are first used
+        _process_packages()
     _setup_random_seed()
     _setup_root_handle()
     _start_user_coverage()
@@ -304,6 +336,48 @@ def _initialise_testbench_(argv_):
     regression_manager.start_regression()
 
 
+def _start_next_batch(env: Dict[str, Union[str, None]]) -> None:
+    """Run another batch of tests in the same simulator process.
+
+    Called at the end of a regression when running in persistent mode.
+    The Python-side state (random seed, tests, regression manager, and scheduler) is re-created
+    from the environment the runner submitted; the state of the HDL is *not* reset.
+    """
+    for name, value in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+    def restart(trigger: cocotb.triggers.Trigger) -> None:
+        # mirrors what the scheduler does when reacting to a GPI trigger
+        cocotb.utils._get_sim_time.cache_clear()
+        cocotb.sim_phase = SimPhase.NORMAL
+        trigger._cleanup()
+
+        try:
+            _setup_random_seed()
+            _setup_regression_manager()
+
+            global _scheduler_inst
+            _scheduler_inst = Scheduler(
+                test_complete_cb=regression_manager._test_complete
+            )
+
+            regression_manager.start_regression()
+        except BaseException:
+            log.exception("cocotb testbench re-initialization failed. Exiting.")
+            cocotb.logging._flush()
+            from cocotb import simulator
+
+            simulator.stop_simulator()
+            _stop_user_coverage()
+            _stop_library_coverage()
+
+    # start the next batch from a fresh time step, like tests after the first one in a regression
+    cocotb.triggers.Timer(1)._prime(restart)
+
+
 def _start_library_coverage() -> None:  # pragma: no cover
     if "COCOTB_LIBRARY_COVERAGE" in os.environ:
         try:
@@ -357,6 +431,14 @@ def _process_plusargs() -> None:
                 plusargs[option[1:]] = True
 
 
+def __getattr__(name: str) -> Any:
+    # discovering the packages can be slow, it is deferred until they are used
+    if name == "packages" and is_simulation:
+        _process_packages()
+        return packages
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _process_packages() -> None:
     global packages
 
@@ -496,17 +578,16 @@ def _setup_regression_manager() -> None:
     global regression_manager
     regression_manager = RegressionManager()
 
-    # discover tests
+    # find test modules
     module_str = os.getenv("COCOTB_TEST_MODULES", "")
     if not module_str:
         raise RuntimeError(
             "Environment variable COCOTB_TEST_MODULES, which defines the module(s) to execute, is not defined or empty."
         )
     modules = [s.strip() for s in module_str.split(",") if s.strip()]
-    regression_manager.setup_pytest_assertion_rewriting()
-    regression_manager.discover_tests(*modules)
 
     # filter tests
+    # Filters are added before discovery so modules without matching tests need not be imported.
     testcase_str = os.getenv("COCOTB_TESTCASE", "").strip()
     test_filter_str = os.getenv("COCOTB_TEST_FILTER", "").strip()
     if testcase_str and test_filter_str:
@@ -522,3 +603,8 @@ def _setup_regression_manager() -> None:
     elif test_filter_str:
         regression_manager.add_filters(test_filter_str)
         regression_manager.set_mode(RegressionMode.TESTCASE)
+
+    # discover tests
+    regression_manager.setup_pytest_assertion_rewriting()
+    cocotb._import_cache.install()
+    regression_manager.discover_tests(*modules)
@@ -0,0 +1,186 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Interoperability with :mod:`asyncio`, see :func:`cocotb.from_asyncio` and :func:`cocotb.to_asyncio`."""
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Callable, Coroutine, Generator, TypeVar, Union
+
+import cocotb
+from cocotb.task import CancelledError, Task
+from cocotb.triggers import Trigger
+
+T = TypeVar("T")
+
+_loop: Union[asyncio.AbstractEventLoop, None] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+def _step() -> None:
+    """Run one iteration of the event loop, without waiting for I/O."""
+    assert _loop is not None
+    # the stop callback is ready, so the loop polls for I/O without blocking
+    _loop.call_soon(_loop.stop)
+    _loop.run_forever()
+
+
+def _close() -> None:
+    """Cancel what is left of the finished test in the event loop, and close it."""
+    global _loop
+    if _loop is None:
+        return
+    loop, _loop = _loop, None
+    try:
+        if sys.version_info >= (3, 7):  # noqa: UP036 | Python 3.6 is still supported
+            tasks = asyncio.all_tasks(loop)
+        else:
+            tasks = {task for task in asyncio.Task.all_tasks(loop) if not task.done()}
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+class _AsyncioResult(Trigger):
+    """Fires when an :mod:`asyncio` future is done."""
+
+    def __init__(self, future: "asyncio.Future[Any]") -> None:
+        super().__init__()
+        self._future = future
+        future.add_done_callback(self._done)
+
+    def _done(self, future: "asyncio.Future[Any]") -> None:
+        if self._primed:
+            self._callback(self)
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        if self._future.done():
+            # fire immediately, like NullTrigger
+            callback(self)
+            return
+        self._callback = callback
+        return super()._prime(callback)
+
+    def _unprime(self) -> None:
+        # nobody is waiting for the result anymore
+        self._future.cancel()
+        return super()._unprime()
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        yield self
+        return self._future.result()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} of {self._future!r}>"
+
+
+def from_asyncio(awaitable: Awaitable[T]) -> Awaitable[T]:
+    r"""Run an :mod:`asyncio` awaitable so that it can be ``await``\ ed from a cocotb :class:`~cocotb.task.Task`.
+
+    The awaitable, like a coroutine using :mod:`asyncio` streams or subprocesses,
+    or an :class:`asyncio.Future`, is run in an :mod:`asyncio` event loop owned by cocotb.
+    The ``await`` expression returns its result, or raises its exception.
+
+    .. code-block:: python3
+
+        reader, writer = await cocotb.from_asyncio(asyncio.open_connection(host, port))
+        stimulus = await cocotb.from_asyncio(reader.readline())
+
+    The event loop is run for one iteration, without waiting for I/O, whenever the simulator calls back into cocotb,
+    so the simulation must keep running (e.g. a clock must be running) for the awaitable to make progress.
+    There is no need for a thread, as with :func:`cocotb.bridge`.
+
+    If the waiting task is killed, or stops waiting because the awaitable lost a :class:`~cocotb.triggers.First`,
+    the awaitable is cancelled.
+    When a test ends, whatever it left running in the event loop is cancelled, and the event loop is closed.
+
+    Before Python 3.10, :mod:`asyncio` objects like :class:`asyncio.Queue` are bound to an event loop when they are created,
+    so they must be created by code run in the event loop of cocotb:
+
+    .. code-block:: python3
+
+        async def make_queue():
+            return asyncio.Queue()
+
+
+        queue = await cocotb.from_asyncio(make_queue())
+
+    Args:
+        awaitable: A coroutine, :class:`asyncio.Future` or other :mod:`asyncio` awaitable.
+
+    Returns:
+        An awaitable which returns the result of *awaitable*.
+
+    .. versionadded:: 2.0
+    """
+    return _AsyncioResult(asyncio.ensure_future(awaitable, loop=_get_loop()))
+
+
+async def _await(awaitable: Awaitable[T], future: "asyncio.Future[T]") -> None:
+    # the outcome is passed on to the future, so an exception does not also fail the test
+    try:
+        result = await awaitable
+    except CancelledError:
+        future.cancel()
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(result)
+
+
+def to_asyncio(
+    awaitable: Union[Task[T], Coroutine[Any, Any, T], Awaitable[T]],
+) -> "asyncio.Future[T]":
+    r"""Run a cocotb awaitable so that it can be ``await``\ ed from :mod:`asyncio` code.
+
+    This is the counterpart of :func:`from_asyncio`,
+    for :mod:`asyncio` code run by it to wait on cocotb :class:`~cocotb.triggers.Trigger`\ s,
+    :class:`~cocotb.task.Task`\ s and coroutines.
+
+    .. code-block:: python3
+
+        async def serve(reader, writer):
+            while True:
+                await cocotb.to_asyncio(RisingEdge(dut.valid))
+                writer.write(f"{dut.data.value.integer}\n".encode())
+                await writer.drain()
+
+    The awaitable is run in a new cocotb :class:`~cocotb.task.Task`, which is killed if the returned future is cancelled,
+    and the other way around.
+
+    Args:
+        awaitable: A cocotb :class:`~cocotb.task.Task`, coroutine, or :class:`~cocotb.triggers.Trigger`.
+
+    Returns:
+        An :class:`asyncio.Future` which is set to the result of *awaitable*.
+
+    .. versionadded:: 2.0
+    """
+    future: asyncio.Future[T] = _get_loop().create_future()
+    task = cocotb.start_soon(_await(awaitable, future))
+
+    def task_done(task: Task[None]) -> None:
+        # the task was killed before it got an outcome
+        if not future.done():
+            future.cancel()
+
+    def future_done(future: "asyncio.Future[T]") -> None:
+        if future.cancelled():
+            task.kill()
+
+    task._add_done_callback(task_done)
+    future.add_done_callback(future_done)
+    return future
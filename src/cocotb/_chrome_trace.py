@@ -0,0 +1,179 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Trace of the activity of tasks, written when :envvar:`COCOTB_TRACE_FILE` is set.
+
+The trace is in the `Trace Event Format <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_
+understood by `Perfetto <https://ui.perfetto.dev>`_ and ``chrome://tracing``.
+"""
+
+import gzip
+import json
+import time
+from typing import IO, Any, Dict, Set, Tuple, Union
+
+from cocotb._instrumentation import EventRecord
+from cocotb.triggers import _TriggerSet
+from cocotb.utils import _get_simulator_precision
+
+# the two timelines of the trace, shown as processes
+_WALL_CLOCK = 1
+_SIM_TIME = 2
+# the thread of the wall clock timeline showing callbacks from the simulator,
+# the thread of a task is its ID plus one
+_SIMULATOR_TID = 0
+
+
+def _trigger_name(trigger: object) -> str:
+    if isinstance(trigger, _TriggerSet):
+        return "Combine" if trigger.wait_all else "First"
+    return type(trigger).__name__
+
+
+class ChromeTrace:
+    r"""Write the :data:`~cocotb._instrumentation.EventRecord`\ s it is called with as trace events.
+
+    The trace has two timelines, with a thread for each :class:`~cocotb.task.Task`:
+
+    * In the "wall clock" timeline, a span for each resumption of a task,
+      and an instant event for each callback from the simulator.
+    * In the "simulation time" timeline, a span for each wait of a task on a trigger.
+
+    Events are written as they happen, and :meth:`flush` is called at the end of each test,
+    so the trace of the tests which finished can be inspected even if the simulator crashes.
+    If *filename* ends with ``.gz``, the trace is compressed.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._file: Union[IO[str], None] = None
+        self._empty = True
+        self._start = time.perf_counter()
+        self._sim_us_per_step: Union[float, None] = None
+        self._named_tasks: Set[int] = set()
+        # start of the current resumption of each task, as wall clock timestamp
+        self._resumed_at: Dict[int, float] = {}
+        # start and trigger of the current wait of each task, as simulation time timestamp
+        self._waiting_since: Dict[int, Tuple[float, object]] = {}
+
+    def _open(self) -> IO[str]:
+        if self.filename.endswith(".gz"):
+            f: IO[str] = gzip.open(self.filename, "wt", encoding="utf-8")
+        else:
+            f = open(self.filename, "w", encoding="utf-8")
+        # the JSON array format allows the closing bracket to be missing
+        f.write("[")
+        self._file = f
+        for pid, name in ((_WALL_CLOCK, "wall clock"), (_SIM_TIME, "simulation time")):
+            self._emit(
+                {"ph": "M", "name": "process_name", "pid": pid, "args": {"name": name}}
+            )
+        self._emit(
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": _WALL_CLOCK,
+                "tid": _SIMULATOR_TID,
+                "args": {"name": "simulator"},
+            }
+        )
+        return f
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        f = self._file
+        if f is None:
+            f = self._open()
+        if self._empty:
+            self._empty = False
+        else:
+            f.write(",")
+        f.write("\n")
+        f.write(json.dumps(event, separators=(",", ":")))
+
+    def _wall_us(self) -> float:
+        return (time.perf_counter() - self._start) * 1e6
+
+    def _sim_us(self, sim_time: int) -> float:
+        if self._sim_us_per_step is None:
+            self._sim_us_per_step = 10.0 ** (_get_simulator_precision() + 6)
+        return sim_time * self._sim_us_per_step
+
+    def _name_task(self, task: Any, tid: int) -> None:
+        self._named_tasks.add(tid)
+        name = f"{task.__name__} {task._coro.__qualname__}"
+        for pid in (_WALL_CLOCK, _SIM_TIME):
+            self._emit(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+
+    def __call__(self, record: EventRecord) -> None:
+        event, sim_time, subject = record
+        if event == "resume":
+            tid = subject._task_id + 1
+            if tid not in self._named_tasks:
+                self._name_task(subject, tid)
+            self._resumed_at[tid] = self._wall_us()
+            waiting = self._waiting_since.pop(tid, None)
+            if waiting is not None:
+                since, trigger = waiting
+                self._emit(
+                    {
+                        "ph": "X",
+                        "name": _trigger_name(trigger),
+                        "pid": _SIM_TIME,
+                        "tid": tid,
+                        "ts": since,
+                        "dur": self._sim_us(sim_time) - since,
+                        "args": {"trigger": repr(trigger)},
+                    }
+                )
+        elif event == "suspend":
+            tid = subject._task_id + 1
+            resumed_at = self._resumed_at.pop(tid, None)
+            if resumed_at is not None:
+                self._emit(
+                    {
+                        "ph": "X",
+                        "name": subject._coro.__qualname__,
+                        "pid": _WALL_CLOCK,
+                        "tid": tid,
+                        "ts": resumed_at,
+                        "dur": self._wall_us() - resumed_at,
+                        "args": {"sim_time_us": self._sim_us(sim_time)},
+                    }
+                )
+            if subject._trigger is not None:
+                self._waiting_since[tid] = (self._sim_us(sim_time), subject._trigger)
+        elif event == "gpi":
+            self._emit(
+                {
+                    "ph": "i",
+                    "s": "t",
+                    "name": _trigger_name(subject),
+                    "pid": _WALL_CLOCK,
+                    "tid": _SIMULATOR_TID,
+                    "ts": self._wall_us(),
+                    "args": {"sim_time_us": self._sim_us(sim_time)},
+                }
+            )
+
+    def flush(self) -> None:
+        """Write out the events so far, so that the trace can be read up to them."""
+        if self._file is not None:
+            # for a compressed trace, this also ends a deflate block
+            self._file.flush()
+
+    def close(self) -> None:
+        """Terminate the trace."""
+        if self._file is None:
+            return
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
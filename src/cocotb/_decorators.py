@@ -26,6 +26,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import functools
+import inspect
 import sys
 from enum import Enum
 from itertools import product
@@ -48,7 +49,7 @@ from typing import (
 )
 
 import cocotb
-from cocotb.regression import Test
+from cocotb.regression import Test, _TestStub
 
 Result = TypeVar("Result")
 
@@ -104,9 +105,11 @@ def bridge(func: Callable[..., Result]) -> Callable[..., Coroutine[Any, Any, Res
     Results of the converted function are returned from the :keyword:`await` expression.
 
     .. warning::
-        Each bridge is implemented with a distinct thread, meaning that all bridges and
+        Each running bridge is implemented with a distinct thread, meaning that all bridges and
         the main thread that runs all :keyword:`async` code are susceptible to races
         when sharing data.
+        Threads are reused by later bridge calls once a bridge finishes,
+        so thread-local data may outlive the call that set it.
 
     .. note::
         Bridge threads *must* either finish or block on a :func:`cocotb.resume`
@@ -175,10 +178,17 @@ class _Parameterized(Generic[F]):
         expect_error: Union[Type[Exception], Sequence[Type[Exception]]] = (),
         skip: bool = False,
         stage: int = 0,
+        profile: bool = False,
         _expect_sim_failure: bool = False,
-    ) -> Iterable[Test]:
+    ) -> Iterable[_TestStub]:
         test_func_name = self.test_function.__qualname__ if name is None else name
 
+        # shared by all generated tests, so only computed once
+        module = self.test_function.__module__
+        doc = self.test_function.__doc__
+        if doc is not None:
+            doc = inspect.cleandoc(doc)
+
         # this value is a list of ranges of the same length as each set of values in self.options for passing to itertools.product
         option_indexes = [range(len(option[1])) for option in self.options]
 
@@ -208,23 +218,37 @@ class _Parameterized(Generic[F]):
 
             parametrized_test_name = "".join(test_name_pieces)
 
-            # create wrapper function to bind kwargs
-            @functools.wraps(self.test_function)
-            async def _my_test(dut, kwargs: Dict[str, Any] = test_kwargs) -> None:
-                await self.test_function(dut, **kwargs)
-
-            yield Test(
-                func=_my_test,
+            # the Test is only created if it passes the filters of the regression
+            yield _TestStub(
                 name=parametrized_test_name,
-                timeout_time=timeout_time,
-                timeout_unit=timeout_unit,
-                expect_fail=expect_fail,
-                expect_error=expect_error,
+                module=module,
+                doc=doc,
                 skip=skip,
                 stage=stage,
-                _expect_sim_failure=_expect_sim_failure,
+                func=self.test_function,
+                create=functools.partial(
+                    self._create_test,
+                    test_kwargs,
+                    name=parametrized_test_name,
+                    timeout_time=timeout_time,
+                    timeout_unit=timeout_unit,
+                    expect_fail=expect_fail,
+                    expect_error=expect_error,
+                    skip=skip,
+                    stage=stage,
+                    profile=profile,
+                    _expect_sim_failure=_expect_sim_failure,
+                ),
             )
 
+    def _create_test(self, test_kwargs: Dict[str, Any], **kwargs: Any) -> Test:
+        # create wrapper function to bind kwargs
+        @functools.wraps(self.test_function)
+        async def _my_test(dut) -> None:
+            await self.test_function(dut, **test_kwargs)
+
+        return Test(func=_my_test, **kwargs)
+
 
 def _reprs(values: Sequence[Any]) -> List[str]:
     result: List[str] = []
@@ -270,6 +294,7 @@ def test(
     skip: bool = False,
     stage: int = 0,
     name: Optional[str] = None,
+    profile: bool = False,
     _expect_sim_failure: bool = False,
 ) -> Callable[[Union[F, _Parameterized[F]]], F]: ...
 
@@ -284,6 +309,7 @@ def test(
     skip: bool = False,
     stage: int = 0,
     name: Optional[str] = None,
+    profile: bool = False,
     _expect_sim_failure: bool = False,
 ) -> Union[F, Callable[[Union[F, _Parameterized[F]]], F]]:
     r"""
@@ -371,6 +397,12 @@ def test(
 
             .. versionadded:: 2.0
 
+        profile:
+            Profile the test with a low-overhead sampling profiler,
+            as :envvar:`COCOTB_SAMPLING_PROFILE` does for all tests.
+
+            .. versionadded:: 2.0
+
     Returns:
         The test function to which the decorator is applied.
 
@@ -397,7 +429,7 @@ def test(
 
     """
 
-    def _add_tests(module_name: str, *tests: Test) -> None:
+    def _add_tests(module_name: str, *tests: Union[Test, _TestStub]) -> None:
         mod = sys.modules[module_name]
         if not hasattr(mod, "__cocotb_tests__"):
             mod.__cocotb_tests__ = []
@@ -425,6 +457,7 @@ def test(
                     expect_error=expect_error,
                     skip=skip,
                     stage=stage,
+                    profile=profile,
                     _expect_sim_failure=_expect_sim_failure,
                 ),
             )
@@ -441,6 +474,7 @@ def test(
                     expect_error=expect_error,
                     skip=skip,
                     stage=stage,
+                    profile=profile,
                     _expect_sim_failure=_expect_sim_failure,
                 ),
             )
@@ -0,0 +1,226 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Bundle the modules imported by the tests in a zip file, see :envvar:`COCOTB_IMPORT_CACHE`.
+
+The zip file holds the bytecode of the pure-Python packages and modules the tests imported,
+together with a manifest of their source files.
+When the sources did not change, the zip file is put first on :data:`sys.path` before the tests are discovered,
+so these modules are loaded from a single file instead of being searched for on :data:`sys.path`.
+Otherwise, the zip file is (re)written at the end of the regression.
+"""
+
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Set, Union
+
+_logger = logging.getLogger(__name__)
+
+_MANIFEST = "__cocotb_import_cache__.json"
+_VERSION = 1
+
+# packages with other files may read them relative to their __file__,
+# which does not work in a zip file
+_PACKAGE_FILES = (".py", ".pyc", ".pyi", "py.typed")
+
+_filename: Union[str, None] = None
+"""The cache to write at the end of the regression, if it must be (re)written."""
+
+_preloaded: Set[str] = set()
+"""The top-level modules imported before the tests, which are not cached."""
+
+_sys_path: List[str] = []
+"""The :data:`sys.path` the modules were imported with, before the cache was put on it."""
+
+
+def _rewrite_patterns() -> List[str]:
+    # modules loaded from a zip file are not rewritten by pytest,
+    # must match cocotb.regression.RegressionManager.setup_pytest_assertion_rewriting
+    return os.getenv("COCOTB_REWRITE_ASSERTION_FILES", "*.py").split()
+
+
+def _key(sys_path: List[str]) -> Dict[str, object]:
+    """Return what the cached modules depend on besides their sources, when imported with *sys_path*."""
+    return {
+        "version": _VERSION,
+        "magic": importlib.util.MAGIC_NUMBER.hex(),
+        "rewrite": _rewrite_patterns(),
+        # another copy of a cached package may come first on a different path
+        "path": sys_path,
+    }
+
+
+def _is_current(filename: str, sys_path: List[str]) -> bool:
+    """Return whether the cache exists and none of the sources it was built from changed."""
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(filename) as zf:
+            manifest = json.loads(zf.read(_MANIFEST))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return False
+    if manifest.get("key") != _key(sys_path):
+        return False
+    # the package directories are included, as adding or removing files changes their modification time
+    for path, (mtime_ns, size) in manifest["files"].items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or (size is not None and st.st_size != size):
+            return False
+    return True
+
+
+def install() -> None:
+    """Put the cache first on :data:`sys.path`, or arrange for it to be written if it is outdated.
+
+    Must be called before the test modules are imported.
+    The modules needed to use the cache are only imported if it is enabled, to not slow down the start-up.
+    """
+    global _filename, _preloaded, _sys_path
+    filename = os.getenv("COCOTB_IMPORT_CACHE", "").strip()
+    if not filename:
+        return
+    filename = os.path.abspath(filename)
+    if filename in sys.path:
+        # installed by an earlier batch of tests in persistent mode
+        return
+    sys_path = [os.path.abspath(entry) for entry in sys.path]
+    if _is_current(filename, sys_path):
+        _logger.debug("Importing cached modules from %s", filename)
+        sys.path.insert(0, filename)
+    else:
+        _logger.info(
+            "Import cache %s is outdated, it is written when the tests complete",
+            filename,
+        )
+        _filename = filename
+        _sys_path = sys_path
+        _preloaded = {name.partition(".")[0] for name in sys.modules}
+
+
+def _stdlib_dirs() -> List[str]:
+    import sysconfig
+
+    paths = sysconfig.get_paths()
+    return [
+        os.path.join(os.path.normcase(paths[name]), "")
+        for name in ("stdlib", "platstdlib")
+        if name in paths
+    ]
+
+
+def _root(name: str, stdlib_dirs: List[str]) -> Optional[str]:
+    """Return the source file or package directory of a top-level module which can be cached."""
+    spec = getattr(sys.modules.get(name), "__spec__", None)
+    # extension modules and namespace packages cannot be loaded from a zip file
+    if (
+        spec is None
+        or spec.origin is None
+        or not isinstance(spec.loader, importlib.machinery.SourceFileLoader)
+    ):
+        return None
+    if os.path.normcase(spec.origin).startswith(tuple(stdlib_dirs)):
+        return None
+    if spec.submodule_search_locations is None:
+        return spec.origin
+    locations = list(spec.submodule_search_locations)
+    if len(locations) != 1:
+        return None
+    return locations[0]
+
+
+def _package_files(root: str, patterns: List[str]) -> Optional[Dict[str, str]]:
+    """Return the sources of a package or module by their path in the cache, or ``None`` if it cannot be cached."""
+    import fnmatch
+
+    if not os.path.isdir(root):
+        if any(fnmatch.fnmatch(os.path.basename(root), p) for p in patterns):
+            return None
+        return {os.path.basename(root): root}
+    sources = {}
+    base = os.path.dirname(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "__pycache__" in dirnames:
+            dirnames.remove("__pycache__")
+        for f in filenames:
+            if not f.endswith(_PACKAGE_FILES):
+                return None
+            if not f.endswith(".py"):
+                continue
+            if any(fnmatch.fnmatch(f, p) for p in patterns):
+                return None
+            path = os.path.join(dirpath, f)
+            sources[os.path.relpath(path, base).replace(os.sep, "/")] = path
+    return sources
+
+
+def _pyc(source_path: str) -> bytes:
+    import marshal
+
+    with open(source_path, "rb") as f:
+        source = f.read()
+    # the code keeps the path of the source, so tracebacks show its lines
+    code = compile(source, source_path, "exec", dont_inherit=True)
+    # no timestamp: without the source in the zip file, zipimport does not check it
+    header = importlib.util.MAGIC_NUMBER
+    if sys.version_info >= (3, 7):  # noqa: UP036 | Python 3.6 is still supported
+        header += bytes(4)  # flags
+    return header + bytes(8) + marshal.dumps(code)
+
+
+def save() -> None:
+    """Write the cache, if it was outdated, from the modules imported during the regression."""
+    global _filename
+    if _filename is None:
+        return
+    filename, _filename = _filename, None
+    import zipfile
+
+    patterns = _rewrite_patterns()
+    stdlib_dirs = _stdlib_dirs()
+    sources: Dict[str, str] = {}
+    checked: List[str] = []
+    for name in sorted({name.partition(".")[0] for name in list(sys.modules)}):
+        if name in _preloaded:
+            continue
+        root = _root(name, stdlib_dirs)
+        if root is None:
+            continue
+        files = _package_files(root, patterns)
+        if files is None:
+            continue
+        sources.update(files)
+        if os.path.isdir(root):
+            checked.extend({os.path.dirname(path) for path in files.values()})
+
+    if not sources:
+        _logger.info(
+            "No modules to cache in %s, modules matching COCOTB_REWRITE_ASSERTION_FILES=%r are not cached",
+            filename,
+            " ".join(patterns),
+        )
+
+    manifest_files: Dict[str, List[Optional[int]]] = {}
+    for path in checked + list(sources.values()):
+        st = os.stat(path)
+        manifest_files[path] = [
+            st.st_mtime_ns,
+            None if os.path.isdir(path) else st.st_size,
+        ]
+
+    tmp = f"{filename}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as zf:
+        for arcname, path in sorted(sources.items()):
+            zf.writestr(arcname + "c", _pyc(path))
+        zf.writestr(
+            _MANIFEST, json.dumps({"key": _key(_sys_path), "files": manifest_files})
+        )
+    os.replace(tmp, filename)
+    _logger.info("Wrote import cache %s with %d modules", filename, len(sources))
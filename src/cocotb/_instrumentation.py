@@ -0,0 +1,130 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Counters and event records of the scheduler, see :meth:`cocotb._scheduler.Scheduler.instrument`."""
+
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cocotb.utils import _get_sim_time
+
+EventRecord = Tuple[str, int, Any]
+"""An event of the scheduler, as ``(event, sim_time, subject)``.
+
+*event* is one of:
+
+* ``"gpi"``: the simulator called back into cocotb because the GPI trigger *subject* fired.
+* ``"fire"``: the trigger *subject* fired.
+* ``"prime"``: the trigger *subject* was primed.
+* ``"unprime"``: the trigger *subject* was unprimed because no task waits on it anymore.
+* ``"resume"``: the task *subject* was resumed.
+* ``"suspend"``: the task *subject* returned control to the scheduler, because it awaits a trigger or finished.
+
+*sim_time* is the simulation time of the event, in simulator steps.
+"""
+
+
+def _count(counter: Dict[str, int], obj: object) -> None:
+    name = type(obj).__name__
+    counter[name] = counter.get(name, 0) + 1
+
+
+class SchedulerInstrumentation:
+    """Counters of the work done by the scheduler, and an optional hook receiving each :data:`EventRecord`.
+
+    Install it with :meth:`cocotb._scheduler.Scheduler.instrument`.
+    When no instrumentation is installed, the scheduler only pays for a check against ``None``.
+
+    Args:
+        task_cpu_time: Also measure the CPU time spent in each task, by coroutine name.
+        hook: Called with each :data:`EventRecord`, as it happens.
+    """
+
+    def __init__(
+        self,
+        task_cpu_time: bool = False,
+        hook: Optional[Callable[[EventRecord], None]] = None,
+    ) -> None:
+        self._measure_task_cpu_time = task_cpu_time
+        self.hook = hook
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.gpi_callbacks: Dict[str, int] = {}
+        self.triggers_fired: Dict[str, int] = {}
+        self.triggers_primed: Dict[str, int] = {}
+        self.triggers_unprimed: Dict[str, int] = {}
+        self.tasks_resumed = 0
+        self.writes_applied = 0
+        self.event_loops = 0
+        self.event_loop_iterations = 0
+        self.max_event_loop_iterations = 0
+        self.task_cpu_time_s: Dict[str, float] = {}
+
+    def _record(self, event: str, subject: Any) -> None:
+        assert self.hook is not None
+        self.hook((event, _get_sim_time(), subject))
+
+    def gpi_callback(self, trigger: Any) -> None:
+        _count(self.gpi_callbacks, trigger)
+        if self.hook is not None:
+            self._record("gpi", trigger)
+
+    def trigger_fired(self, trigger: Any) -> None:
+        _count(self.triggers_fired, trigger)
+        if self.hook is not None:
+            self._record("fire", trigger)
+
+    def trigger_primed(self, trigger: Any) -> None:
+        _count(self.triggers_primed, trigger)
+        if self.hook is not None:
+            self._record("prime", trigger)
+
+    def trigger_unprimed(self, trigger: Any) -> None:
+        _count(self.triggers_unprimed, trigger)
+        if self.hook is not None:
+            self._record("unprime", trigger)
+
+    def task_resuming(self, task: Any) -> float:
+        """Called before *task* is resumed, returns the value to pass to :meth:`task_suspended`."""
+        self.tasks_resumed += 1
+        if self.hook is not None:
+            self._record("resume", task)
+        if self._measure_task_cpu_time:
+            return time.thread_time()
+        return 0.0
+
+    def task_suspended(self, task: Any, resumed_at: float) -> None:
+        if self._measure_task_cpu_time:
+            elapsed = time.thread_time() - resumed_at
+            name = task._coro.__qualname__
+            self.task_cpu_time_s[name] = self.task_cpu_time_s.get(name, 0.0) + elapsed
+        if self.hook is not None:
+            self._record("suspend", task)
+
+    def event_loop_done(self, iterations: int) -> None:
+        """Called when the event loop ran out of tasks to resume, after resuming *iterations* tasks."""
+        self.event_loops += 1
+        self.event_loop_iterations += iterations
+        self.max_event_loop_iterations = max(self.max_event_loop_iterations, iterations)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters, in a form suitable for JSON."""
+        counters: Dict[str, Any] = {
+            "gpi_callbacks": dict(sorted(self.gpi_callbacks.items())),
+            "triggers_fired": dict(sorted(self.triggers_fired.items())),
+            "triggers_primed": dict(sorted(self.triggers_primed.items())),
+            "triggers_unprimed": dict(sorted(self.triggers_unprimed.items())),
+            "tasks_resumed": self.tasks_resumed,
+            "writes_applied": self.writes_applied,
+            "event_loops": self.event_loops,
+            "event_loop_iterations": self.event_loop_iterations,
+            "max_event_loop_iterations": self.max_event_loop_iterations,
+        }
+        if self._measure_task_cpu_time:
+            counters["task_cpu_time_s"] = dict(
+                sorted(self.task_cpu_time_s.items(), key=lambda item: -item[1])
+            )
+        return counters
@@ -0,0 +1,61 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Client side of the persistent simulator mode of :class:`cocotb_tools.runner.Runner`.
+
+When :envvar:`COCOTB_PERSISTENT_SERVER` is set, the simulator does not exit once a regression completes.
+Instead the results are reported to the runner and the runner is asked for the next batch of tests to run.
+Messages are newline-delimited JSON objects exchanged over a local TCP connection.
+"""
+
+import json
+import os
+import socket
+from typing import Dict, Optional, Union
+
+_connection: Union[socket.socket, None] = None
+_reader = None
+
+
+def enabled() -> bool:
+    """Return ``True`` if the simulator was started by a runner in persistent mode."""
+    return "COCOTB_PERSISTENT_SERVER" in os.environ
+
+
+def _connect() -> None:
+    global _connection, _reader
+    host, port = os.environ["COCOTB_PERSISTENT_SERVER"].rsplit(":", 1)
+    _connection = socket.create_connection((host, int(port)))
+    _reader = _connection.makefile("r", encoding="utf-8")
+
+
+def request_next_batch(results_file: str) -> Optional[Dict[str, Optional[str]]]:
+    """Report the finished batch and block until the runner submits another.
+
+    Args:
+        results_file: The xUnit results file written by the finished batch.
+
+    Returns:
+        The environment variables to apply for the next batch,
+        where a value of ``None`` means the variable is to be unset,
+        or ``None`` if the runner wants the simulator to exit.
+    """
+    if _connection is None:
+        _connect()
+    assert _connection is not None and _reader is not None
+
+    msg = json.dumps({"done": results_file}) + "\n"
+    try:
+        _connection.sendall(msg.encode("utf-8"))
+        line = _reader.readline()
+    except OSError:
+        line = ""
+    if not line:
+        # runner went away
+        return None
+
+    request = json.loads(line)
+    if "env" not in request:
+        return None
+    return request["env"]
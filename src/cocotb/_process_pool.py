@@ -0,0 +1,126 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Offload computation to worker processes, see :func:`cocotb.run_in_process`."""
+
+import collections
+import concurrent.futures
+import os
+from typing import Any, Callable, Deque, Generator, Generic, TypeVar, Union
+
+from cocotb.triggers import Trigger
+
+T = TypeVar("T")
+
+_executor: Union["concurrent.futures.ProcessPoolExecutor", None] = None
+
+# results not delivered yet, in submission order
+_pending: Deque["_ProcessResult[Any]"] = collections.deque()
+
+
+def _get_executor() -> "concurrent.futures.ProcessPoolExecutor":
+    global _executor
+    if _executor is None:
+        # multiprocessing is only imported once it is used, it slows down the start-up
+        import multiprocessing
+
+        max_workers = os.getenv("COCOTB_PROCESS_POOL_WORKERS")
+        # Forking the simulator process is not safe, start fresh interpreters instead.
+        _executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=int(max_workers) if max_workers else None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+class _ProcessResult(Trigger, Generic[T]):
+    """Fires when the result of a function submitted by :func:`run_in_process` is delivered."""
+
+    def __init__(self, future: "concurrent.futures.Future[T]") -> None:
+        super().__init__()
+        self._future = future
+        self._delivered = False
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        if self._delivered:
+            # fire immediately, like NullTrigger
+            callback(self)
+            return
+        self._callback = callback
+        return super()._prime(callback)
+
+    def _deliver(self) -> None:
+        self._delivered = True
+        if self._primed:
+            self._callback(self)
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        yield self
+        return self._future.result()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} of {self._future!r}>"
+
+
+def run_in_process(
+    func: Callable[..., T], *args: Any, **kwargs: Any
+) -> "_ProcessResult[T]":
+    r"""Run ``func(*args, **kwargs)`` in a worker process, without stopping the simulation.
+
+    The call is submitted to a :class:`concurrent.futures.ProcessPoolExecutor` immediately.
+    ``await``\ ing the returned object blocks the current :class:`~cocotb.task.Task` until the result is available,
+    while other tasks and the simulator keep running.
+    The ``await`` expression returns the return value of *func*, or raises the exception it raised.
+
+    This is useful for expensive computations which do not need to access the simulation,
+    like reference models computing the expected outputs of a design,
+    which can then use the CPU cores the simulator does not.
+
+    Completed results are checked for whenever the simulator calls back into cocotb,
+    so the simulation must keep running (e.g. a clock must be running) for results to be delivered.
+    Results are delivered in the order the calls were submitted in,
+    so tasks awaiting results resume in a deterministic order,
+    though the simulation time at which they resume depends on how fast the worker processes are.
+
+    *func*, its arguments and its return value must be picklable,
+    so *func* must be defined at the top level of a module.
+    The number of worker processes defaults to the number of CPUs,
+    and can be set with :envvar:`COCOTB_PROCESS_POOL_WORKERS`.
+
+    Calls which are still pending when a test ends are cancelled if they have not started yet,
+    and their results are discarded.
+
+    Args:
+        func: The function to call.
+        args: Positional arguments to pass to *func*.
+        kwargs: Keyword arguments to pass to *func*.
+
+    Returns:
+        An awaitable which returns the result of the call.
+
+    .. versionadded:: 2.0
+    """
+    result = _ProcessResult(_get_executor().submit(func, *args, **kwargs))
+    _pending.append(result)
+    return result
+
+
+def _poll() -> None:
+    """Deliver the results of completed calls, in submission order."""
+    while _pending and _pending[0]._future.done():
+        _pending.popleft()._deliver()
+
+
+def _cancel_pending() -> None:
+    """Discard the calls of the finished test."""
+    while _pending:
+        _pending.popleft()._future.cancel()
+
+
+def _shutdown() -> None:
+    global _executor
+    _cancel_pending()
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
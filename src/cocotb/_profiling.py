@@ -4,39 +4,153 @@
 
 
 # Debug mode controlled by environment variables
-import cProfile
+import json
 import os
-import pstats
-from typing import Union
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
+from cocotb._instrumentation import SchedulerInstrumentation
 from cocotb._py_compat import nullcontext
 
-_profile: Union[cProfile.Profile, None]
+if TYPE_CHECKING:
+    import cProfile
+
+    from cocotb._chrome_trace import ChromeTrace
+
+
+class ProfilingReport:
+    """Per-test statistics collected when :envvar:`COCOTB_PROFILING_REPORT` is set.
+
+    Time is attributed to Python from the moment the simulator calls into cocotb
+    until control is handed back to the simulator;
+    the rest of the wall time of a test is attributed to the simulator.
+    The work done by the scheduler is counted by :attr:`instrumentation`,
+    which must be installed with :meth:`cocotb._scheduler.Scheduler.instrument`.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.tests: List[Dict[str, Any]] = []
+        self.instrumentation = SchedulerInstrumentation(task_cpu_time=True)
+        self._python_since: Union[float, None] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.python_time_s = 0.0
+        self.instrumentation.reset()
+
+    def _flush_python_time(self) -> None:
+        # account the time spent in Python so far without leaving Python
+        if self._python_since is not None:
+            now = time.perf_counter()
+            self.python_time_s += now - self._python_since
+            self._python_since = now
+
+    def enter(self) -> None:
+        """Called when the simulator hands control to Python."""
+        self._python_since = time.perf_counter()
+
+    def exit(self) -> None:
+        """Called when Python hands control back to the simulator."""
+        self._flush_python_time()
+        self._python_since = None
+
+    def start_test(self) -> None:
+        """Start collecting statistics for a new test."""
+        self._flush_python_time()
+        self._reset()
+
+    def end_test(
+        self, name: str, wall_time_s: float, sim_time_ns: float
+    ) -> Dict[str, Any]:
+        """Finish collecting statistics for the current test and return them."""
+        self._flush_python_time()
+        stats = {
+            "python_time_s": self.python_time_s,
+            "simulator_time_s": max(wall_time_s - self.python_time_s, 0.0),
+            **self.instrumentation.as_dict(),
+        }
+        self.tests.append(
+            {
+                "test": name,
+                "wall_time_s": wall_time_s,
+                "sim_time_ns": sim_time_ns,
+                **stats,
+            }
+        )
+        return stats
+
+    def write(self) -> None:
+        """Write the JSON summary of all tests that completed since the last write."""
+        with open(self.filename, "w") as f:
+            json.dump({"tests": self.tests}, f, indent=2)
+            f.write("\n")
+        self.tests = []
+
+
+_profile: Union["cProfile.Profile", None]
+report: Union[ProfilingReport, None]
+trace: Union["ChromeTrace", None]
+instrumentation: Union[SchedulerInstrumentation, None]
+"""The instrumentation to install in the scheduler, if any of the above need it."""
 
 
 class _profiling_context:
     """Context manager that profiles its contents"""
 
     def __enter__(self):
-        _profile.enable()
+        if report is not None:
+            report.enter()
+        if _profile is not None:
+            _profile.enable()
 
     def __exit__(self, *excinfo):
-        _profile.disable()
+        if _profile is not None:
+            _profile.disable()
+        if report is not None:
+            report.exit()
 
 
-if "COCOTB_ENABLE_PROFILING" in os.environ:
-    _profile = cProfile.Profile()
+def finalize() -> None:
+    if _profile is not None:
+        import pstats
 
-    def finalize() -> None:
         ps = pstats.Stats(_profile).sort_stats("cumulative")
         ps.dump_stats("cocotb.pstat")
+    if trace is not None:
+        trace.close()
 
-    profiling_context = _profiling_context()
 
+if "COCOTB_ENABLE_PROFILING" in os.environ:
+    import cProfile
+
+    _profile = cProfile.Profile()
 else:
     _profile = None
 
-    def finalize() -> None:
-        pass
+if os.environ.get("COCOTB_PROFILING_REPORT"):
+    report = ProfilingReport(os.environ["COCOTB_PROFILING_REPORT"])
+else:
+    report = None
+
+if os.environ.get("COCOTB_TRACE_FILE"):
+    from cocotb._chrome_trace import ChromeTrace
+
+    trace = ChromeTrace(os.environ["COCOTB_TRACE_FILE"])
+else:
+    trace = None
 
+if report is not None:
+    instrumentation = report.instrumentation
+elif trace is not None:
+    instrumentation = SchedulerInstrumentation()
+else:
+    instrumentation = None
+if trace is not None:
+    assert instrumentation is not None
+    instrumentation.hook = trace
+
+if _profile is not None or report is not None:
+    profiling_context = _profiling_context()
+else:
     profiling_context = nullcontext()
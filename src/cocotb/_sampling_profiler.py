@@ -0,0 +1,100 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Statistical profiler enabled with :envvar:`COCOTB_SAMPLING_PROFILE` or ``@cocotb.test(profile=True)``."""
+
+import os
+import re
+import sys
+import threading
+from types import FrameType
+from typing import Dict, List, Optional, Union
+
+import cocotb
+
+output_dir: Union[str, None] = os.environ.get("COCOTB_SAMPLING_PROFILE") or None
+"""Directory to write the profiles to, if all tests are to be profiled."""
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class SamplingProfiler:
+    """Attribute the wall time of a test to the stacks of the tasks running in it, by sampling.
+
+    A background thread samples the stack of the thread running cocotb every *interval_s* seconds,
+    so the overhead is a small constant,
+    unlike :envvar:`COCOTB_ENABLE_PROFILING` which traces every function call.
+    Samples are attributed to the coroutine of the running :class:`~cocotb.task.Task`,
+    to ``[cocotb]`` when cocotb itself is running,
+    and to ``[simulator]`` when Python is not running at all.
+
+    The samples are written as "collapsed stacks", one stack per line followed by its number of samples,
+    which `flamegraph.pl <https://github.com/brendangregg/FlameGraph>`_, `speedscope <https://www.speedscope.app>`_
+    and similar tools can render as a flame graph.
+    """
+
+    def __init__(self, interval_s: float = 0.005) -> None:
+        self.interval_s = interval_s
+        self.samples: Dict[str, int] = {}
+        self._target = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling the stack of the calling thread."""
+        self._target = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_s):
+            stack = self._collapse(sys._current_frames().get(self._target))
+            self.samples[stack] = self.samples.get(stack, 0) + 1
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        if frame is None:
+            return "[simulator]"
+        frames: List[FrameType] = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+
+        root = "[cocotb]"
+        scheduler = getattr(cocotb, "_scheduler_inst", None)
+        task = scheduler._current_task if scheduler is not None else None
+        if task is not None:
+            # only keep the frames of the running task, from its coroutine on
+            coro_frame = task._coro.cr_frame
+            for i, f in enumerate(frames):
+                if f is coro_frame:
+                    root = task._coro.__qualname__
+                    frames = frames[i:]
+                    break
+        return ";".join([root, *(_frame_name(f) for f in frames)])
+
+    def write(self, filename: str) -> None:
+        """Write the collapsed stacks of the samples, creating the directory of *filename* if needed."""
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        with open(filename, "w") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def profile_filename(test_fullname: str) -> str:
+    """Return the file to write the profile of a test to."""
+    name = re.sub(r"[^\w.=-]", "_", test_fullname)
+    return os.path.join(output_dir or ".", f"{name}.folded")
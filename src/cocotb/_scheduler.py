@@ -34,17 +34,22 @@ also have pending writes we have to schedule the ReadWrite callback before
 the ReadOnly (and this is invalid, at least in Modelsim).
 """
 
+import functools
 import logging
 import os
 import threading
 from collections import OrderedDict
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import cocotb
+import cocotb._asyncio_bridge
+import cocotb._process_pool
 import cocotb._write_scheduler
 from cocotb import _outcomes, _py_compat
 from cocotb._exceptions import InternalError
+from cocotb._instrumentation import SchedulerInstrumentation
 from cocotb._profiling import profiling_context
+from cocotb._py_compat import cached_property
 from cocotb.task import Task
 from cocotb.triggers import (
     Event,
@@ -54,6 +59,8 @@ from cocotb.triggers import (
     ReadWrite,
     Trigger,
     _Join,
+    _Park,
+    _TriggerSet,
 )
 from cocotb.utils import _get_sim_time
 
@@ -69,14 +76,78 @@ class external_state:
     EXITED = 3
 
 
+class _BridgeThread:
+    """A reusable thread which runs the blocking functions of :func:`cocotb.bridge` calls, one at a time."""
+
+    def __init__(self, pool: "_BridgeThreadPool") -> None:
+        self._pool = pool
+        self._job: Union[Tuple[Callable[[], None], Callable[[], None]], None] = None
+        self._cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, func: Callable[[], None], done: Callable[[], None]) -> None:
+        """Run *func* in this thread, then *done* once the thread has been returned to the pool."""
+        with self._cond:
+            self._job = (func, done)
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._job is None:
+                    self._cond.wait()
+                (func, done), self._job = self._job, None
+            func()
+            # Return to the pool before signalling completion,
+            # as the scheduler thread may immediately reuse the thread for the next call.
+            keep = self._pool._release(self)
+            done()
+            if not keep:
+                return
+
+
+class _BridgeThreadPool:
+    """Threads for :func:`cocotb.bridge` calls, kept around to avoid starting a thread per call.
+
+    Bridge calls may block on :func:`cocotb.resume` calls, so every running bridge call needs its own thread.
+    Only the number of idle threads kept for reuse is bounded.
+    """
+
+    def __init__(self, max_idle: int) -> None:
+        self._max_idle = max_idle
+        self._idle: List[_BridgeThread] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> _BridgeThread:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _BridgeThread(self)
+
+    def _release(self, thread: _BridgeThread) -> bool:
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(thread)
+                return True
+        return False
+
+
+_bridge_threads = _BridgeThreadPool(max_idle=8)
+
+
 class external_waiter:
-    def __init__(self):
+    def __init__(self, func: Callable[[], Any]) -> None:
         self._outcome = None
+        self._func = func
         self.thread = None
         self.event = Event()
         self.state = external_state.INIT
         self.cond = threading.Condition()
-        self._log = logging.getLogger(f"cocotb.bridge.{self.thread}.0x{id(self):x}")
+
+    @cached_property
+    def _log(self) -> logging.Logger:
+        return logging.getLogger(f"cocotb.bridge.{self.thread}.0x{id(self):x}")
 
     @property
     def result(self):
@@ -99,13 +170,23 @@ class external_waiter:
     def thread_suspend(self):
         self._propagate_state(external_state.PAUSED)
 
-    def thread_start(self):
+    def _execute(self):
+        self._outcome = _outcomes.capture(self._func)
+        if _debug:
+            self._log.debug(
+                f"Execution of external routine done {threading.current_thread()}"
+            )
+
+    def thread_start(self, thread2waiter: Dict[threading.Thread, "external_waiter"]):
         if self.state > external_state.INIT:
             return
 
-        if not self.thread.is_alive():
-            self._propagate_state(external_state.RUNNING)
-            self.thread.start()
+        bridge_thread = _bridge_threads.acquire()
+        self.thread = bridge_thread.thread
+        # register before the thread starts running, it may immediately call a resume function
+        thread2waiter[self.thread] = self
+        self._propagate_state(external_state.RUNNING)
+        bridge_thread.submit(self._execute, self.thread_done)
 
     def thread_resume(self):
         self._propagate_state(external_state.RUNNING)
@@ -142,6 +223,59 @@ class external_waiter:
         return self.state
 
 
+class _RunQueue:
+    """The tasks scheduled to be resumed, with the outcome to resume each with.
+
+    Tasks are resumed by decreasing :attr:`~cocotb.task.Task.priority`,
+    and in the order they were scheduled in among tasks of the same priority.
+    Tasks are kept in a FIFO bucket per priority.
+    The bucket of the default priority, :attr:`default`, is used directly by the scheduler,
+    so that tasks of the default priority are scheduled as fast as with a single FIFO
+    while no task of another priority is scheduled.
+    """
+
+    def __init__(self) -> None:
+        self.default: OrderedDict[Task[Any], _outcomes.Outcome[Any]] = OrderedDict()
+        self._buckets: Dict[int, OrderedDict[Task[Any], _outcomes.Outcome[Any]]] = {
+            0: self.default
+        }
+        # the keys of _buckets, highest first
+        self._priorities: List[int] = [0]
+        self.prioritized = 0
+        """The number of scheduled tasks not of the default priority."""
+
+    def __contains__(self, task: Task[Any]) -> bool:
+        bucket = self._buckets.get(task._priority)
+        return bucket is not None and task in bucket
+
+    def __setitem__(self, task: Task[Any], outcome: _outcomes.Outcome[Any]) -> None:
+        priority = task._priority
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = OrderedDict()
+            self._priorities.append(priority)
+            self._priorities.sort(reverse=True)
+        bucket[task] = outcome
+        if priority:
+            self.prioritized += 1
+
+    def pop(self, task: Task[Any]) -> _outcomes.Outcome[Any]:
+        outcome = self._buckets[task._priority].pop(task)
+        if task._priority:
+            self.prioritized -= 1
+        return outcome
+
+    def popitem(self) -> Tuple[Task[Any], _outcomes.Outcome[Any]]:
+        """Remove and return the next task to resume, with its outcome."""
+        for priority in self._priorities:
+            bucket = self._buckets[priority]
+            if bucket:
+                if priority:
+                    self.prioritized -= 1
+                return bucket.popitem(last=False)
+        raise KeyError("popitem(): run queue is empty")
+
+
 class Scheduler:
     """The main Task scheduler.
 
@@ -229,8 +363,15 @@ class Scheduler:
             _py_compat.insertion_ordered_dict()
         )
 
-        self._scheduled_tasks: OrderedDict[Task[Any], _outcomes.Outcome] = OrderedDict()
-        self._pending_threads = []
+        # tasks suspended on _park, waiting to be resumed by _unpark
+        self._parked: Dict[Task, None] = {}
+
+        self._run_queue = _RunQueue()
+        # the tasks of default priority, by far the most common, are scheduled directly
+        self._scheduled_tasks = self._run_queue.default
+        self._pending_threads: List[external_waiter] = []
+        # the waiters of the bridge calls currently running, by thread
+        self._thread2waiter: Dict[threading.Thread, external_waiter] = {}
         self._pending_events = []  # Events we need to call set on once we've unwound
 
         self._terminate = False
@@ -238,6 +379,16 @@ class Scheduler:
 
         self._current_task = None
 
+        self._instrumentation: Optional[SchedulerInstrumentation] = None
+
+    def instrument(self, instrumentation: Optional[SchedulerInstrumentation]) -> None:
+        """Count the work done by the scheduler into *instrumentation*, or stop counting if ``None``.
+
+        Unlike :envvar:`COCOTB_SCHEDULER_DEBUG`, which logs every event as a string,
+        this is cheap enough to leave enabled for whole regressions.
+        """
+        self._instrumentation = instrumentation
+
     def _handle_termination(self) -> None:
         """
         Handle a termination that causes us to move onto the next test.
@@ -268,6 +419,9 @@ class Scheduler:
             # TODO: move to GPITrigger
             _get_sim_time.cache_clear()
 
+            if self._instrumentation is not None:
+                self._instrumentation.gpi_callback(trigger)
+
             # TODO: move state tracking to global variable
             # and handle this via some kind of trigger-specific Python callback
             if trigger is self._read_write:
@@ -281,6 +435,14 @@ class Scheduler:
             if trigger is self._read_write:
                 cocotb._write_scheduler.apply_scheduled_writes()
 
+            # deliver results of run_in_process and progress asyncio code,
+            # unless values can no longer be written
+            if trigger is not self._read_only:
+                if cocotb._process_pool._pending:
+                    cocotb._process_pool._poll()
+                if cocotb._asyncio_bridge._loop is not None:
+                    cocotb._asyncio_bridge._step()
+
             self._react(trigger)
             self._event_loop()
 
@@ -317,11 +479,28 @@ class Scheduler:
                 f"{len(scheduling)} pending tasks for trigger {trigger}{debugstr}"
             )
 
+        if self._instrumentation is not None:
+            self._instrumentation.trigger_fired(trigger)
+
         # queue all tasks to wake up
         for task in scheduling:
-            # unset trigger
+            waiting_on = task._trigger
+            if waiting_on is trigger:
+                # unset trigger
+                task._trigger = None
+                self._schedule_task(task)
+                continue
+
+            # the task is waiting on a set of triggers
+            assert isinstance(waiting_on, _TriggerSet)
+            waiting_on.pending.remove(trigger)
+            if waiting_on.wait_all and waiting_on.pending:
+                continue
             task._trigger = None
-            self._schedule_task(task)
+            for other in waiting_on.pending:
+                self._stop_waiting(task, other)
+            waiting_on.pending.clear()
+            self._schedule_task(task, _outcomes.Value(trigger))
 
         # cleanup trigger
         trigger._cleanup()
@@ -334,12 +513,26 @@ class Scheduler:
         * A GPI trigger
         """
 
-        while self._scheduled_tasks and not self._terminate:
-            task, outcome = self._scheduled_tasks.popitem(last=False)
+        instrumentation = self._instrumentation
+        iterations = 0
+
+        while not self._terminate:
+            if self._run_queue.prioritized:
+                task, outcome = self._run_queue.popitem()
+            elif self._scheduled_tasks:
+                task, outcome = self._scheduled_tasks.popitem(last=False)
+            else:
+                break
 
             if _debug:
                 self.log.debug(f"Scheduling task {task}")
-            self._resume_task(task, outcome)
+            if instrumentation is not None:
+                iterations += 1
+                resumed_at = instrumentation.task_resuming(task)
+                self._resume_task(task, outcome)
+                instrumentation.task_suspended(task, resumed_at)
+            else:
+                self._resume_task(task, outcome)
             if _debug:
                 self.log.debug(f"Scheduled task {task}")
 
@@ -356,6 +549,9 @@ class Scheduler:
                     )
                 self._pending_events.pop(0).set()
 
+        if instrumentation is not None:
+            instrumentation.event_loop_done(iterations)
+
         # no more pending tasks
         if self._terminate:
             self._handle_termination()
@@ -372,18 +568,21 @@ class Scheduler:
         """
 
         # remove task from queue
-        if task in self._scheduled_tasks:
-            self._scheduled_tasks.pop(task)
+        queue = self._run_queue if task._priority else self._scheduled_tasks
+        if task in queue:
+            queue.pop(task)
+        self._parked.pop(task, None)
 
         # Unprime the trigger this task is waiting on
         trigger = task._trigger
         if trigger is not None:
             task._trigger = None
-            if task in self._trigger2tasks.setdefault(trigger, []):
-                self._trigger2tasks[trigger].remove(task)
-            if not self._trigger2tasks[trigger]:
-                trigger._unprime()
-                del self._trigger2tasks[trigger]
+            if isinstance(trigger, _TriggerSet):
+                for t in trigger.pending:
+                    self._stop_waiting(task, t)
+                trigger.pending.clear()
+            else:
+                self._stop_waiting(task, trigger)
 
         if self._terminate:
             return
@@ -391,6 +590,59 @@ class Scheduler:
         elif _Join(task) in self._trigger2tasks:
             self._react(_Join(task))
 
+    def _stop_waiting(self, task: Task[Any], trigger: Trigger) -> None:
+        """Deassociate *task* from *trigger*, unpriming *trigger* if no other task waits on it."""
+        if task in self._trigger2tasks.setdefault(trigger, []):
+            self._trigger2tasks[trigger].remove(task)
+        if not self._trigger2tasks[trigger]:
+            if self._instrumentation is not None:
+                self._instrumentation.trigger_unprimed(trigger)
+            trigger._unprime()
+            del self._trigger2tasks[trigger]
+
+    def _schedule_task_upon_set(self, task: Task[Any], triggers: _TriggerSet) -> None:
+        """Schedule `task` to be resumed when the triggers in `triggers` fire.
+
+        Used by :class:`~cocotb.triggers.First` and :class:`~cocotb.triggers.Combine`
+        to wait on several triggers without starting a task for each of them.
+        """
+        task._trigger = triggers
+        task._state = Task._State.PENDING
+
+        # triggers may fire as soon as they are primed, which removes them from the set
+        for trigger in list(triggers.pending):
+            if task._trigger is not triggers:
+                # already resumed
+                return
+
+            trigger_tasks = self._trigger2tasks.setdefault(trigger, [])
+            trigger_tasks.append(task)
+
+            if not trigger._primed:
+                if trigger_tasks != [task]:
+                    # should never happen
+                    raise InternalError(
+                        "More than one task waiting on an unprimed trigger"
+                    )
+
+                if self._instrumentation is not None:
+                    self._instrumentation.trigger_primed(trigger)
+                try:
+                    if isinstance(trigger, GPITrigger):
+                        trigger._prime(self._sim_react)
+                    else:
+                        trigger._prime(self._react)
+                except Exception as e:
+                    # stop waiting on all the triggers, and throw the exception back
+                    task._trigger = None
+                    for t in triggers.pending:
+                        self._stop_waiting(task, t)
+                        if t is trigger:
+                            break
+                    triggers.pending.clear()
+                    self._schedule_task(task, outcome=_outcomes.Error(e))
+                    return
+
     def _schedule_task_upon(self, task: Task[Any], trigger: Trigger) -> None:
         """Schedule `task` to be resumed when `trigger` fires."""
         # TODO Move this all into Task
@@ -405,6 +657,8 @@ class Scheduler:
                 # should never happen
                 raise InternalError("More than one task waiting on an unprimed trigger")
 
+            if self._instrumentation is not None:
+                self._instrumentation.trigger_primed(trigger)
             try:
                 # TODO maybe associate the react method with the trigger object so
                 # we don't have to do a type check here.
@@ -426,28 +680,30 @@ class Scheduler:
 
         It is an error to attempt to queue a task that has already been queued.
         """
+        queue = self._run_queue if task._priority else self._scheduled_tasks
         # Don't queue the same task more than once (gh-2503)
-        if task in self._scheduled_tasks:
+        if task in queue:
             raise InternalError("Task was queued more than once.")
         # TODO Move state tracking into Task
         task._state = Task._State.SCHEDULED
-        self._scheduled_tasks[task] = outcome
+        queue[task] = outcome
+
+    def _unpark(
+        self, task: Task[Any], outcome: _outcomes.Outcome[Any] = _none_outcome
+    ) -> None:
+        """Queue *task*, suspended on :data:`~cocotb.triggers._park`, for scheduling."""
+        del self._parked[task]
+        self._schedule_task(task, outcome)
 
     def _queue_function(self, task):
         """Queue a task for execution and move the containing thread
         so that it does not block execution of the main thread any longer.
         """
-        # We should be able to find ourselves inside the _pending_threads list
-        matching_threads = [
-            t for t in self._pending_threads if t.thread == threading.current_thread()
-        ]
-        if len(matching_threads) == 0:
+        # We should be able to find ourselves among the running bridge calls
+        t = self._thread2waiter.get(threading.current_thread())
+        if t is None:
             raise RuntimeError("queue_function called from unrecognized thread")
 
-        # Raises if there is more than one match. This can never happen, since
-        # each entry always has a unique thread.
-        (t,) = matching_threads
-
         async def wrapper():
             # This function runs in the scheduler thread
             try:
@@ -478,31 +734,14 @@ class Scheduler:
         """Run the task in a separate execution thread
         and return an awaitable object for the caller.
         """
-        # Create a thread
-        # Create a trigger that is called as a result of the thread finishing
+        # Create a waiter, which runs the function in a thread from the pool
+        # when the scheduler next hands control to pending threads
         # Create an Event object that the caller can await on
         # Event object set when the thread finishes execution, this blocks the
         # calling task (but not the thread) until the external completes
 
-        def execute_external(func, _waiter):
-            _waiter._outcome = _outcomes.capture(func, *args, **kwargs)
-            if _debug:
-                self.log.debug(
-                    f"Execution of external routine done {threading.current_thread()}"
-                )
-            _waiter.thread_done()
-
         async def wrapper():
-            waiter = external_waiter()
-            thread = threading.Thread(
-                group=None,
-                target=execute_external,
-                name=func.__qualname__ + "_thread",
-                args=([func, waiter]),
-                kwargs={},
-            )
-
-            waiter.thread = thread
+            waiter = external_waiter(functools.partial(func, *args, **kwargs))
             self._pending_threads.append(waiter)
 
             await waiter.event.wait()
@@ -528,13 +767,16 @@ class Scheduler:
             self.log.debug(f"Scheduling unstarted task: {result!r}")
         return _Join(result)
 
-    def _trigger_from_any(self, result) -> Trigger:
+    def _trigger_from_any(self, result) -> Union[Trigger, _TriggerSet, _Park]:
         """Convert a yielded object into a Trigger instance"""
         # note: the order of these can significantly impact performance
 
         if isinstance(result, Trigger):
             return result
 
+        if isinstance(result, (_TriggerSet, _Park)):
+            return result
+
         # TODO move this into Task
         if isinstance(result, Task):
             if result._state is Task._State.UNSTARTED:
@@ -587,7 +829,13 @@ class Scheduler:
                     # it wasn't allowed to yield that
                     self._schedule_task(task, _outcomes.Error(exc))
                 else:
-                    self._schedule_task_upon(task, result)
+                    if isinstance(result, _Park):
+                        self._parked[task] = None
+                        task._state = Task._State.PENDING
+                    elif isinstance(result, _TriggerSet):
+                        self._schedule_task_upon_set(task, result)
+                    else:
+                        self._schedule_task_upon(task, result)
 
             # We do not return from here until pending threads have completed, but only
             # from the main thread, this seems like it could be problematic in cases
@@ -595,7 +843,7 @@ class Scheduler:
 
             if self._main_thread is threading.current_thread():
                 for ext in self._pending_threads:
-                    ext.thread_start()
+                    ext.thread_start(self._thread2waiter)
                     if _debug:
                         self.log.debug(
                             f"Blocking from {threading.current_thread()} on {ext.thread}"
@@ -607,6 +855,7 @@ class Scheduler:
                         )
                     if state == external_state.EXITED:
                         self._pending_threads.remove(ext)
+                        del self._thread2waiter[ext.thread]
                         self._pending_events.append(ext.event)
         finally:
             self._current_task = None
@@ -630,11 +879,15 @@ class Scheduler:
             # the trigger should cause it to be unprimed in _unschedule
         assert not self._trigger2tasks
 
+        # Kill any parked coroutines.
+        while self._parked:
+            next(iter(self._parked)).kill()
+
         # Kill any queued coroutines.
         # We use a while loop because task.kill() calls _unschedule(), which will remove the task from _pending_tasks.
         # If that happens a for loop will stop early and then the assert will fail.
-        while self._scheduled_tasks:
-            task, _ = self._scheduled_tasks.popitem(last=False)
+        while self._scheduled_tasks or self._run_queue.prioritized:
+            task, _ = self._run_queue.popitem()
             task.kill()
 
         if self._main_thread is not threading.current_thread():
@@ -0,0 +1,158 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""The timed callbacks of the triggers, coalesced into a single simulator callback.
+
+Timed triggers like :class:`~cocotb.triggers.Timer` do not each register a callback with the simulator.
+Their callbacks are kept in a heap by deadline,
+and only one simulator callback is registered, for the earliest deadline.
+When it fires, the callbacks which are due are called in the order they were registered in,
+and the simulator callback is registered again for the next deadline.
+
+Cancelling a callback does not deregister the simulator callback, even if it was the earliest:
+the simulator callback then fires without calling anything, and is registered for the next deadline.
+This way a timeout which is cancelled once the operation it guards completes,
+like the :class:`~cocotb.triggers.Timer` of :func:`~cocotb.triggers.with_timeout`,
+costs no calls to the simulator,
+as the next timeout is usually later than the simulator callback still registered for the last one.
+"""
+
+import heapq
+import itertools
+from typing import Any, Callable, List, Optional, Tuple
+
+from cocotb import simulator
+
+
+def _now() -> int:
+    # not cached, unlike cocotb.utils._get_sim_time, as this may be called outside of a callback
+    timeh, timel = simulator.get_sim_time()
+    return timeh << 32 | timel
+
+
+class TimerHandle:
+    """A timed callback registered with :func:`call_at`.
+
+    It can be cancelled like a :class:`cocotb.simulator.gpi_cb_hdl`, with :meth:`deregister`.
+    """
+
+    __slots__ = ("time", "_callback", "_args", "_active")
+
+    def __init__(self, time: int, callback: Callable[..., Any], args: Tuple[Any, ...]):
+        self.time = time
+        self._callback = callback
+        self._args = args
+        self._active = True
+
+    def deregister(self) -> None:
+        """Cancel the callback, if it was not called yet."""
+        if self._active:
+            self._active = False
+            _heap._cancelled(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} at {self.time} of {self._callback!r}>"
+
+
+class TimerHeap:
+    """Pending timed callbacks, of which the earliest is materialized as a simulator callback."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int, TimerHandle]] = []
+        # breaks the ties between callbacks with the same deadline
+        self._counter = itertools.count()
+        self._cbhdl: Optional[simulator.gpi_cb_hdl] = None
+        self._cb_time: Optional[int] = None
+        self._firing = False
+        # the callbacks in the heap which were not cancelled
+        self._active = 0
+        self.registrations = 0
+        """The number of callbacks registered with the simulator."""
+
+    def call_at(
+        self, time: int, now: int, callback: Callable[..., Any], args: Tuple[Any, ...]
+    ) -> TimerHandle:
+        if time <= now:
+            raise ValueError(
+                f"Timed callback at {time} is not after the current time {now}"
+            )
+        handle = TimerHandle(time, callback, args)
+        heapq.heappush(self._heap, (time, next(self._counter), handle))
+        self._active += 1
+        # while firing, the simulator callback is registered after the due callbacks are called
+        if not self._firing and (self._cb_time is None or time < self._cb_time):
+            self._register(now)
+        return handle
+
+    def _cancelled(self, handle: TimerHandle) -> None:
+        self._active -= 1
+        heap = self._heap
+        if not self._active:
+            heap.clear()
+        elif len(heap) > 2 * self._active + _COMPACT_MIN:
+            # most callbacks were cancelled, like the timeouts of completed operations
+            self._heap = [entry for entry in heap if entry[2]._active]
+            heapq.heapify(self._heap)
+        else:
+            # the others are dropped when they reach the top
+            while not heap[0][2]._active:
+                heapq.heappop(heap)
+
+    def _register(self, now: int) -> None:
+        if self._cbhdl is not None:
+            self._cbhdl.deregister()
+            self._cbhdl = None
+            self._cb_time = None
+        if not self._heap:
+            return
+        time = self._heap[0][0]
+        cbhdl = simulator.register_timed_callback(time - now, self._fire)
+        if cbhdl is None:
+            raise RuntimeError(f"Unable to register a timed callback at {time}")
+        self._cbhdl = cbhdl
+        self._cb_time = time
+        self.registrations += 1
+
+    def _fire(self) -> None:
+        now = self._cb_time
+        assert now is not None
+        self._cbhdl = None
+        self._cb_time = None
+        self._firing = True
+        try:
+            # callbacks may register or cancel others, which are due later
+            while self._heap and self._heap[0][0] <= now:
+                _, _, handle = heapq.heappop(self._heap)
+                if handle._active:
+                    handle._active = False
+                    self._active -= 1
+                    handle._callback(*handle._args)
+        finally:
+            self._firing = False
+        heap = self._heap
+        while heap and not heap[0][2]._active:
+            heapq.heappop(heap)
+        self._register(now)
+
+
+_COMPACT_MIN = 64
+"""The number of cancelled callbacks kept in the heap before it is compacted, besides as many as the others."""
+
+_heap = TimerHeap()
+
+
+def call_at(time: int, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+    """Call *callback* with *args* at the absolute simulation *time*, in steps.
+
+    Raises:
+        ValueError: If *time* is not after the current simulation time.
+        RuntimeError: If the simulator callback cannot be registered.
+    """
+    return _heap.call_at(time, _now(), callback, args)
+
+
+def call_later(delay: int, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+    """Call *callback* with *args* after *delay* simulation steps, see :func:`call_at`."""
+    now = _now()
+    return _heap.call_at(now + delay, now, callback, args)
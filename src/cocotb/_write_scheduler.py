@@ -49,6 +49,9 @@ def stop_write_scheduler() -> None:
 
 
 def apply_scheduled_writes() -> None:
+    instrumentation = cocotb._scheduler_inst._instrumentation
+    if instrumentation is not None:
+        instrumentation.writes_applied += len(_write_calls)
     while _write_calls:
         _, (func, args) = _write_calls.popitem(last=False)
         func(*args)
@@ -62,6 +65,9 @@ if trust_inertial:
         write_func: Callable[..., None],
         args: Sequence[Any],
     ) -> None:
+        instrumentation = cocotb._scheduler_inst._instrumentation
+        if instrumentation is not None:
+            instrumentation.writes_applied += 1
         write_func(*args)
 else:
 
@@ -72,6 +78,9 @@ else:
     ) -> None:
         """Queue *write_func* to be called on the next ``ReadWrite`` trigger."""
         if cocotb.sim_phase == cocotb.SimPhase.READ_WRITE:
+            instrumentation = cocotb._scheduler_inst._instrumentation
+            if instrumentation is not None:
+                instrumentation.writes_applied += 1
             write_func(*args)
         elif cocotb.sim_phase == cocotb.SimPhase.READ_ONLY:
             raise RuntimeError(
@@ -25,55 +25,134 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element, SubElement
 
+# escapes applied to attribute values, matching xml.etree.ElementTree
+_attrib_escapes = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\r": "&#13;",
+        "\n": "&#10;",
+        "\t": "&#09;",
+    }
+)
+
+
+def _serialize_attrib(attrib):
+    """Serialize the attributes *attrib* of an element, each preceded by a space."""
+    return "".join(
+        f' {key}="{str(value).translate(_attrib_escapes)}"'
+        for key, value in attrib.items()
+    )
+
+
+def _serialize(elem, level, start_tag_only=False):
+    """Serialize *elem* indented to *level* with two spaces per level."""
+    indent = "\n" + level * "  "
+    attrib = _serialize_attrib(elem.attrib)
+    if start_tag_only:
+        return f"{indent}<{elem.tag}{attrib}>"
+    elif len(elem) == 0:
+        return f"{indent}<{elem.tag}{attrib} />"
+    else:
+        children = "".join(_serialize(child, level + 1) for child in elem)
+        return f"{indent}<{elem.tag}{attrib}>{children}{indent}</{elem.tag}>"
+
 
 class XUnitReporter:
+    """Write an xUnit XML results file incrementally.
+
+    Every testcase is written to disk as soon as it is added,
+    followed by the closing tags needed to make the file well-formed.
+    The closing tags are overwritten by the next record,
+    so the file is valid XML after every testcase, even if the simulator crashes during the regression.
+    The file is only created when the first testcase is added, or by :meth:`write`,
+    and it is opened only for as long as it takes to write each testcase.
+    Only the most recent testcase is kept in memory,
+    as failure and skipped records are still added to it after it is written.
+    """
+
     def __init__(self, filename="results.xml"):
-        self.results = Element("testsuites", name="results")
         self.filename = filename
+        self._created = False
+        self._closed = False
+        # records not written yet
+        self._pending = '<testsuites name="results">'
+        # position where the closing tags are written, and the pending records replace them
+        self._end = 0
+        self._in_testsuite = False
+        self.last_testcase = None
+        self._testcase_start = None
+
+    def _flush(self):
+        closing = "\n  </testsuite>" if self._in_testsuite else ""
+        data = self._pending.encode()
+        # records are only ever added or extended, so the file never needs truncating
+        with open(self.filename, "r+b" if self._created else "wb") as f:
+            self._created = True
+            f.seek(self._end)
+            f.write(data)
+            f.write(f"{closing}\n</testsuites>\n".encode())
+        self._end += len(data)
+        self._pending = ""
+
+    def _append(self, data):
+        self._pending += data
+
+    def _rewrite_testcase(self):
+        if self._testcase_start is not None and not self._pending:
+            # the testcase was written already, overwrite it
+            self._end = self._testcase_start
+        else:
+            self._testcase_start = self._end + len(self._pending.encode())
+        self._append(_serialize(self.last_testcase, 2))
+        self._flush()
+
+    def _testcase(self):
+        if self.last_testcase is None:
+            raise ValueError("No testcase was added to add a record to")
+        return self.last_testcase
 
     def add_testsuite(self, **kwargs):
-        self.last_testsuite = SubElement(self.results, "testsuite", **kwargs)
-        return self.last_testsuite
+        start_tag = _serialize(Element("testsuite", **kwargs), 1, start_tag_only=True)
+        if self._in_testsuite:
+            start_tag = "\n  </testsuite>" + start_tag
+        self.last_testcase = None
+        self._in_testsuite = True
+        self._append(start_tag)
 
-    def add_testcase(self, testsuite=None, **kwargs):
-        if testsuite is None:
-            testsuite = self.last_testsuite
-        self.last_testcase = SubElement(testsuite, "testcase", **kwargs)
+    def add_testcase(self, **kwargs):
+        self.last_testcase = Element("testcase", **kwargs)
+        self._testcase_start = None
+        self._rewrite_testcase()
         return self.last_testcase
 
-    def add_property(self, testsuite=None, **kwargs):
-        if testsuite is None:
-            testsuite = self.last_testsuite
-        self.last_property = SubElement(testsuite, "property", **kwargs)
-        return self.last_property
-
-    def add_failure(self, testcase=None, **kwargs):
-        if testcase is None:
-            testcase = self.last_testcase
-        SubElement(testcase, "failure", **kwargs)
-
-    def add_skipped(self, testcase=None, **kwargs):
-        if testcase is None:
-            testcase = self.last_testcase
-        SubElement(testcase, "skipped", **kwargs)
-
-    def indent(self, elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for sub_elem in elem:
-                self.indent(sub_elem, level + 1)
-            if not sub_elem.tail or not sub_elem.tail.strip():
-                sub_elem.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+    def add_property(self, **kwargs):
+        self.last_testcase = None
+        self._append(_serialize(Element("property", **kwargs), 2))
+
+    def add_testcase_property(self, **kwargs):
+        testcase = self._testcase()
+        properties = testcase.find("properties")
+        if properties is None:
+            properties = SubElement(testcase, "properties")
+        SubElement(properties, "property", **kwargs)
+        self._rewrite_testcase()
+
+    def add_failure(self, **kwargs):
+        SubElement(self._testcase(), "failure", **kwargs)
+        self._rewrite_testcase()
+
+    def add_skipped(self, **kwargs):
+        SubElement(self._testcase(), "skipped", **kwargs)
+        self._rewrite_testcase()
 
     def write(self):
-        self.indent(self.results)
-        ET.ElementTree(self.results).write(self.filename, encoding="UTF-8")
+        """Finalize the results file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
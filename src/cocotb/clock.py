@@ -25,23 +25,43 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-"""A clock class."""
+"""Clock drivers."""
 
 import logging
+import random
 from decimal import Decimal
 from fractions import Fraction
 from logging import Logger
-from typing import Union
+from typing import Callable, Iterable, List, Optional, Set, Union
 
+import cocotb
+from cocotb import _timer_heap
 from cocotb._py_compat import cached_property
 from cocotb._write_scheduler import trust_inertial
-from cocotb.simulator import clock_create
-from cocotb.triggers import Event, Timer
-from cocotb.utils import get_sim_steps, get_time_from_sim_steps
+from cocotb.simulator import GpiClock, GpiClockGroup, clock_create, clock_group_create
+from cocotb.triggers import Event, GPITrigger, Timer, Trigger, _pointer_str
+from cocotb.utils import get_sim_steps, get_sim_time, get_time_from_sim_steps
+
+_MASK64 = 2**64 - 1
+# the increment of the splitmix64 state for each edge
+_RNG_INCREMENT = 0x9E3779B97F4A7C15
+
+
+def _jitter_offset(state: int, jitter: int) -> int:
+    """Return the offset of an edge, between -*jitter* and *jitter*, drawn from splitmix64 *state*.
+
+    Unlike :class:`random.Random`, the state of the n-th edge is computed directly,
+    which :meth:`Clock.cycle_time` uses to look ahead without replaying the edges in between.
+    """
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z ^= z >> 31
+    return z % (2 * jitter + 1) - jitter
 
 
 class Clock:
-    r"""Simple 50:50 duty cycle clock driver.
+    r"""Clock driver.
 
     Instances of this class should call its :meth:`start` method
     and pass the coroutine object to one of the functions in :ref:`task-management`.
@@ -70,6 +90,31 @@ class Clock:
             When ``'auto'`` is used (default), the fastest implementation that supports your environment and use case is picked.
 
             .. versionadded:: 2.0
+        duty_cycle: The fraction of the period the clock is high.
+            The number of time steps the clock is high is rounded down.
+
+            .. versionadded:: 2.0
+        phase: The time, in *units*, the clock holds the opposite state
+            before it starts toggling.
+
+            .. versionadded:: 2.0
+        jitter: The largest time, in *units*, by which each edge is moved randomly,
+            earlier or later, from its ideal time.
+            Edges do not drift, the periods average to *period*.
+            Twice the jitter must be less than the time the clock is high or low.
+
+            .. versionadded:: 2.0
+        seed: The seed of the random jitter.
+            By default, it is drawn from the :mod:`random` module,
+            which cocotb seeds with :envvar:`COCOTB_RANDOM_SEED`,
+            so the jitter is reproducible.
+            The jitter differs between the two *impl*\ s.
+
+            .. versionadded:: 2.0
+
+    Raises:
+        ValueError: If the time the clock is high or low would be less than one time step,
+            or the jitter is too large.
 
     When *impl* is ``'auto'``, if :envvar:`COCOTB_TRUST_INERTIAL_WRITES` is defined,
     the :class:`~cocotb.simulator.GpiClock` implementation will be used.
@@ -77,7 +122,13 @@ class Clock:
     See the environment variable documentation for more information on the consequences
     of using the simulator's inertial write mechanism.
 
-    If you need more features like a phase shift and an asymmetric duty cycle,
+    The period can be changed with :meth:`set_period` and the clock can be gated with :attr:`enabled`
+    while the clock is running.
+    The cycles of a running clock are counted by :attr:`cycles`,
+    and :class:`AtCycle` waits for a given cycle.
+    To drive several clocks without waking up Python on their edges, use a :class:`ClockGroup`.
+
+    If you need a waveform this class does not support,
     it is simple to create your own clock generator (that you then :func:`~cocotb.start`):
 
     .. code-block:: python
@@ -93,27 +144,6 @@ class Clock:
                 dut.clk.value = 0
                 await low_time
 
-    If you also want to change the timing during simulation,
-    use this slightly more inefficient example instead where
-    the :class:`Timer`\ s inside the while loop are created with
-    current delay values:
-
-    .. code-block:: python
-
-        async def custom_clock():
-            while True:
-                dut.clk.value = 1
-                await Timer(high_delay, units="ns")
-                dut.clk.value = 0
-                await Timer(low_delay, units="ns")
-
-
-        high_delay = low_delay = 100
-        await cocotb.start(custom_clock())
-        await Timer(1000, units="ns")
-        high_delay = low_delay = 10  # change the clock speed
-        await Timer(1000, units="ns")
-
     .. versionchanged:: 1.5
         Support ``'step'`` as the *units* argument to mean "simulator time step".
 
@@ -127,10 +157,12 @@ class Clock:
         period: Union[float, Fraction, Decimal],
         units: str = "step",
         impl: str = "auto",
+        duty_cycle: float = 0.5,
+        phase: Union[float, Fraction, Decimal] = 0,
+        jitter: Union[float, Fraction, Decimal] = 0,
+        seed: Optional[int] = None,
     ):
         self.signal = signal
-        self.period = get_sim_steps(period, units)
-        self.frequency = 1 / get_time_from_sim_steps(self.period, units="us")
         valid_impls = ["auto", "gpi", "py"]
         if impl not in valid_impls:
             valid_impls_str = ", ".join([repr(i) for i in valid_impls])
@@ -140,6 +172,174 @@ class Clock:
         if impl == "auto":
             impl = "gpi" if trust_inertial else "py"
         self.impl = impl
+        self.duty_cycle = duty_cycle
+        self.phase = get_sim_steps(phase, units)
+        self.jitter = get_sim_steps(jitter, units)
+        self.seed = seed
+        self._enabled = True
+        self._clkobj: Optional[GpiClock] = None
+        self._set_timing(get_sim_steps(period, units))
+        # the timing the Python implementation applies at the next rising edge
+        self._next_timing = (self.period, self._t_high)
+        # the state of the Python implementation, or the cycles of a stopped GpiClock
+        self._running = False
+        self._cycles = 0
+        self._timing = self._next_timing
+        self._high = False
+        self._next_nominal = 0
+        self._next_edge = 0
+        # the splitmix64 state last drawn for the jitter of an edge, if jittered
+        self._rng_state: Optional[int] = None
+        self._cycle_triggers: Set[AtCycle] = set()
+
+    def _set_timing(self, period: int) -> None:
+        t_high = int(period * self.duty_cycle)
+        if not 1 <= t_high < period:
+            raise ValueError(
+                "The clock must be high and low for at least one time step each"
+            )
+        if 2 * self.jitter >= min(t_high, period - t_high):
+            raise ValueError(
+                "Twice the jitter must be less than the time the clock is high or low"
+            )
+        self.period = period
+        self._t_high = t_high
+        self.frequency = 1 / get_time_from_sim_steps(self.period, units="us")
+
+    def set_period(
+        self, period: Union[float, Fraction, Decimal], units: str = "step"
+    ) -> None:
+        """Change the period of the clock, keeping its duty cycle.
+
+        A running clock changes its period at its next rising edge.
+
+        Args:
+            period: The new clock period.
+            units: The units of *period*, like in :class:`Clock`.
+
+        Raises:
+            ValueError: If the time the clock is high or low would be less than one time step,
+                or the jitter is too large.
+
+        .. versionadded:: 2.0
+        """
+        self._set_timing(get_sim_steps(period, units))
+        self._next_timing = (self.period, self._t_high)
+        if self._clkobj is not None:
+            self._clkobj.set_period(self.period, self._t_high)
+        # the cycles after the next one start at different times
+        for trigger in list(self._cycle_triggers):
+            trigger._reschedule()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the clock toggles, set to ``False`` to gate the clock.
+
+        Gating is glitch-free: a disabled clock completes its high state and stays low,
+        and an enabled clock starts again with its next rising edge.
+
+        .. versionadded:: 2.0
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if self._clkobj is not None:
+            self._clkobj.set_enabled(value)
+
+    @property
+    def cycles(self) -> int:
+        """The number of rising edges since the clock was last started.
+
+        The rising edges suppressed by gating the clock are counted too,
+        so the cycles are counted in time even while the clock is disabled.
+
+        .. versionadded:: 2.0
+        """
+        if self._clkobj is not None:
+            return self._clkobj.cycles()
+        return self._cycles
+
+    def _check_running(self) -> None:
+        if self._clkobj is None and not self._running:
+            raise RuntimeError("Clock is not running")
+
+    def next_edge_time(self, units: str = "step") -> Union[int, float]:
+        """Return the simulation time of the next edge of the running clock.
+
+        Args:
+            units: The units of the result, like for :func:`~cocotb.utils.get_sim_time`.
+
+        Raises:
+            RuntimeError: If the clock is not running.
+
+        .. versionadded:: 2.0
+        """
+        self._check_running()
+        if self._clkobj is not None:
+            steps = self._clkobj.next_edge()
+        else:
+            steps = self._next_edge
+        if units == "step":
+            return steps
+        return get_time_from_sim_steps(steps, units)
+
+    def cycle_time(self, cycle: int, units: str = "step") -> Union[int, float]:
+        """Return the simulation time of the rising edge starting a later cycle of the running clock.
+
+        The time accounts for the jitter and a pending change of the period,
+        but not for later calls to :meth:`set_period`.
+
+        Args:
+            cycle: The value of :attr:`cycles` from that rising edge on.
+            units: The units of the result, like for :func:`~cocotb.utils.get_sim_time`.
+
+        Raises:
+            RuntimeError: If the clock is not running.
+            ValueError: If *cycle* has already started.
+
+        .. versionadded:: 2.0
+        """
+        steps = self._cycle_time(cycle)
+        if units == "step":
+            return steps
+        return get_time_from_sim_steps(steps, units)
+
+    def _cycle_time(self, cycle: int) -> int:
+        self._check_running()
+        if self._clkobj is not None:
+            return self._clkobj.cycle_time(cycle)
+        if cycle <= self._cycles:
+            raise ValueError(f"Cycle {cycle} has already started")
+        jitter = self.jitter
+        state = self._rng_state
+        period, t_high = self._timing
+        nominal = self._next_nominal
+        edge = self._next_edge
+        if self._high:
+            # the next edge is falling, the next rising edge ends this period
+            nominal += period - t_high
+            if state is None:
+                edge = nominal
+            else:
+                state = (state + _RNG_INCREMENT) & _MASK64
+                edge = nominal + _jitter_offset(state, jitter)
+        # the pending period applies from the rising edge starting cycle `self._cycles + 1` on
+        period, t_high = self._next_timing
+        periods = cycle - self._cycles - 1
+        if state is None:
+            return nominal + periods * period
+        if not periods:
+            return edge
+        # each edge draws the next state, so the rising edge `2 * periods` edges later is computed directly
+        state = (state + 2 * periods * _RNG_INCREMENT) & _MASK64
+        return nominal + periods * period + _jitter_offset(state, jitter)
+
+    def _stop_cycle_triggers(self) -> None:
+        # the predicted edges do not happen
+        for trigger in list(self._cycle_triggers):
+            trigger._deregister()
 
     async def start(self, start_high: bool = True) -> None:
         r"""Clocking coroutine.  Start driving your clock by :func:`cocotb.start`\ ing a
@@ -156,13 +356,8 @@ class Clock:
             Removed ``cycles`` arguments for toggling for a finite amount of cyles.
             Use ``kill()`` on the clock task instead, or implement manually.
         """
-
-        t_high = self.period // 2
-
         if self.impl == "gpi":
-            clkobj = clock_create(self.signal._handle)
-            clkobj.start(self.period, t_high, start_high)
-
+            self._start_gpi(start_high)
             try:
                 # The clock is meant to toggle forever, so awaiting this should
                 # never return (except in case of CancelledError).
@@ -170,18 +365,83 @@ class Clock:
                 e = Event()
                 await e.wait()
             finally:
-                clkobj.stop()
+                self._stop_gpi()
         else:
+            await self._run_py(start_high)
+
+    def _seed(self) -> int:
+        if self.seed is None:
+            return random.getrandbits(64)
+        return self.seed
+
+    def _start_gpi(
+        self, start_high: bool, group: Optional[GpiClockGroup] = None
+    ) -> None:
+        clkobj = clock_create(self.signal._handle)
+        if group is not None:
+            group.add(clkobj)
+        clkobj.set_enabled(self._enabled)
+        clkobj.start(
+            self.period,
+            self._t_high,
+            start_high,
+            self.phase,
+            self.jitter,
+            self._seed() & 0xFFFFFFFFFFFFFFFF,
+        )
+        self._clkobj = clkobj
+
+    def _stop_gpi(self) -> None:
+        if self._clkobj is not None:
+            self._clkobj.stop()
+            self._cycles = self._clkobj.cycles()
+            self._clkobj = None
+            self._stop_cycle_triggers()
+
+    async def _run_py(self, start_high: bool) -> None:
+        self._rng_state = (self._seed() & _MASK64) if self.jitter else None
+        jitter = self.jitter
+        signal = self.signal
+        self._cycles = 0
+        self._timing = self._next_timing
+        # the value of the clock waveform before gating, until the next edge
+        self._high = not start_high
+        self._next_nominal = self._next_edge = get_sim_time() + self.phase
+        self._running = True
+        try:
+            if self.phase:
+                signal.value = 0 if start_high or not self._enabled else 1
+                await Timer(self.phase)
+            period, t_high = self._timing
+            # pre-construct triggers for performance
             timer_high = Timer(t_high)
-            timer_low = Timer(self.period - t_high)
-            if start_high:
-                self.signal.value = 1
-                await timer_high
+            timer_low = Timer(period - t_high)
             while True:
-                self.signal.value = 0
-                await timer_low
-                self.signal.value = 1
-                await timer_high
+                high = self._high = not self._high
+                if high:
+                    self._cycles += 1
+                    if self._next_timing != self._timing:
+                        self._timing = period, t_high = self._next_timing
+                        timer_high = Timer(t_high)
+                        timer_low = Timer(period - t_high)
+                    signal.value = 1 if self._enabled else 0
+                else:
+                    signal.value = 0
+                now = self._next_edge
+                self._next_nominal += t_high if high else period - t_high
+                if self._rng_state is None:
+                    self._next_edge = self._next_nominal
+                    await (timer_high if high else timer_low)
+                else:
+                    # edges are moved around their nominal time, so they do not drift
+                    self._rng_state = (self._rng_state + _RNG_INCREMENT) & _MASK64
+                    self._next_edge = self._next_nominal + _jitter_offset(
+                        self._rng_state, jitter
+                    )
+                    await Timer(self._next_edge - now)
+        finally:
+            self._running = False
+            self._stop_cycle_triggers()
 
     def __str__(self) -> str:
         return type(self).__qualname__ + f"({self.frequency:3.1f} MHz)"
@@ -191,3 +451,132 @@ class Clock:
         return logging.getLogger(
             f"cocotb.{type(self).__qualname__}.{self.signal._name}"
         )
+
+
+class ClockGroup:
+    r"""Driver of several clocks from a single simulator callback.
+
+    The edges of the :class:`~cocotb.simulator.GpiClock`\ s of the *clocks*
+    are all driven by one timed callback of the simulator, registered for the next edge of any of the clocks,
+    and none of them wakes up Python.
+    This is faster than starting the clocks separately when many related clocks are needed,
+    like in a System-on-Chip testbench.
+    Clocks using the Python implementation are started as separate tasks.
+
+    Example:
+
+    .. code-block:: python
+
+        clocks = ClockGroup(
+            [
+                Clock(dut.core_clk, 1, "ns", impl="gpi"),
+                Clock(dut.bus_clk, 4, "ns", impl="gpi", phase=1),
+                Clock(dut.ref_clk, 10, "ns", impl="gpi", jitter=0.1),
+            ]
+        )
+        await cocotb.start(clocks.start())
+
+    Args:
+        clocks: The clocks to drive.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, clocks: Iterable[Clock]) -> None:
+        self.clocks: List[Clock] = list(clocks)
+
+    async def start(self, start_high: bool = True) -> None:
+        r"""Clocking coroutine driving all the clocks.
+        Start driving your clocks by :func:`cocotb.start`\ ing a call to this.
+
+        Args:
+            start_high: Whether to start the clocks with a ``1``
+                for the first half of their period.
+        """
+        group = clock_group_create()
+        started: List[Clock] = []
+        tasks = []
+        try:
+            for clock in self.clocks:
+                if clock.impl == "gpi":
+                    clock._start_gpi(start_high, group)
+                    started.append(clock)
+                else:
+                    tasks.append(cocotb.start_soon(clock.start(start_high)))
+            e = Event()
+            await e.wait()
+        finally:
+            for clock in started:
+                clock._stop_gpi()
+            for task in tasks:
+                task.kill()
+
+
+class AtCycle(GPITrigger):
+    r"""Fires at the rising edge of a running *clock* starting cycle *cycle*.
+
+    The cycles are counted like :attr:`Clock.cycles`.
+    Unlike :class:`~cocotb.triggers.ClockCycles`, which wakes up Python on every edge of the clock,
+    this trigger fires from a single timed callback at the time :meth:`Clock.cycle_time` predicts,
+    like :class:`~cocotb.triggers.AtTime`.
+    The callback is registered again if the period of the clock is changed while waiting,
+    and the trigger never fires if the clock is stopped before that cycle.
+
+    As the callback is not ordered with the one driving the clock,
+    the value of the clock signal is not defined when the trigger fires.
+
+    Example:
+
+    .. code-block:: python
+
+        clock = Clock(dut.clk, 10, "ns", impl="gpi")
+        cocotb.start_soon(clock.start())
+        await AtCycle(clock, clock.cycles + 1000)
+
+    Args:
+        clock: The clock whose cycles are counted.
+        cycle: The cycle to wait for.
+
+    Raises:
+        RuntimeError: When awaited, if the clock is not running.
+        ValueError: When awaited, if *cycle* has already started.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, clock: Clock, cycle: int) -> None:
+        super().__init__()
+        self.clock = clock
+        self.cycle = cycle
+        self._callback: Optional[Callable[[Trigger], None]] = None
+
+    def _register(self) -> None:
+        time = self.clock._cycle_time(self.cycle)
+        if time <= get_sim_time():
+            raise ValueError(f"Cycle {self.cycle} has already started")
+        self._cbhdl = _timer_heap.call_at(time, self._callback, self)
+        self.clock._cycle_triggers.add(self)
+
+    def _deregister(self) -> None:
+        if self._cbhdl is not None:
+            self._cbhdl.deregister()
+            self._cbhdl = None
+        self.clock._cycle_triggers.discard(self)
+
+    def _reschedule(self) -> None:
+        self._deregister()
+        self._register()
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        """Register for a timed callback at the predicted time of the cycle."""
+        if self._cbhdl is None:
+            self._callback = callback
+            self._register()
+        super()._prime(callback)
+
+    def _cleanup(self) -> None:
+        self.clock._cycle_triggers.discard(self)
+        return super()._cleanup()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} of cycle {self.cycle} of {self.clock} at {_pointer_str(self)}>"
@@ -29,14 +29,24 @@
 Everything related to logging
 """
 
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
 import sys
+import threading
 import typing
+from collections import deque
 
 from cocotb import _ANSI, simulator
 from cocotb._utils import want_color_output
-from cocotb.utils import get_sim_time, get_time_from_sim_steps
+from cocotb.utils import (
+    _get_simulator_precision,
+    get_sim_time,
+    get_time_from_sim_steps,
+)
 
 try:
     _suppress = int(os.environ.get("COCOTB_REDUCED_LOG_FMT", "1"))
@@ -57,6 +67,14 @@ logging.addLevelName(5, "TRACE")
 # Default log level if not overwritten by the user.
 _COCOTB_LOG_LEVEL_DEFAULT = "INFO"
 
+_async = os.environ.get("COCOTB_LOG_ASYNC", "0") not in ("", "0")
+
+# formats and writes the records of the root logger in a background thread, if enabled
+_writer: "typing.Optional[_Writer]" = None
+
+_structured_filename = os.environ.get("COCOTB_LOG_STRUCTURED") or None
+_structured_handler: "typing.Optional[StructuredLogHandler]" = None
+
 
 def default_config():
     """Apply the default cocotb log formatting to the root logger.
@@ -75,11 +93,17 @@ def default_config():
     manually resetting the root logger instance.
     An example of this can be found in the section on :ref:`rotating-logger`.
 
+    If :envvar:`COCOTB_LOG_ASYNC` is set, log records are formatted and written to stdout
+    by a background thread instead, see :class:`SimTimeQueueHandler`.
+    If :envvar:`COCOTB_LOG_STRUCTURED` is set, log records are also written to a :class:`StructuredLogHandler`.
+
     .. versionadded:: 1.4
+
+    .. versionchanged:: 2.0
+        Added :envvar:`COCOTB_LOG_ASYNC` and :envvar:`COCOTB_LOG_STRUCTURED`.
     """
     # construct an appropriate handler
     hdlr = logging.StreamHandler(sys.stdout)
-    hdlr.addFilter(SimTimeContextFilter())
     if want_color_output():
         hdlr.setFormatter(SimColourLogFormatter())
     else:
@@ -87,7 +111,23 @@ def default_config():
 
     logging.setLoggerClass(SimBaseLog)  # For backwards compatibility
     logging.basicConfig()
-    logging.getLogger().handlers = [hdlr]  # overwrite default handlers
+    if _async:
+        global _writer
+        _stop_writer()
+        # cache the precision, so that the writer thread does not ask the simulator for it
+        _get_simulator_precision()
+        # the records already have their simulation time when they reach hdlr
+        _writer = _Writer(hdlr)
+        handlers: typing.List[logging.Handler] = [SimTimeQueueHandler(_writer)]
+    else:
+        hdlr.addFilter(SimTimeContextFilter())
+        handlers = [hdlr]
+    if _structured_filename is not None:
+        global _structured_handler
+        if _structured_handler is None:
+            _structured_handler = StructuredLogHandler(_structured_filename)
+        handlers.append(_structured_handler)
+    logging.getLogger().handlers = handlers  # overwrite default handlers
 
     # apply level settings for cocotb
     log = logging.getLogger("cocotb")
@@ -114,12 +154,25 @@ def default_config():
 
 
 class SimBaseLog(logging.getLoggerClass()):
-    """This class only exists for backwards compatibility"""
+    """The class of the loggers made once :func:`default_config` is called.
+
+    Changing the level of a logger, or disabling it, clears the log levels cached by the GPI.
+    """
 
     def setLevel(self, level: typing.Union[int, str]) -> None:
         super().setLevel(level)
         if self.name == "gpi":
             simulator.log_level(self.getEffectiveLevel())
+        simulator.clear_log_level_cache()
+
+    @property
+    def disabled(self) -> bool:
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, disabled: bool) -> None:
+        self._disabled = disabled
+        simulator.clear_log_level_cache()
 
 
 # this used to be a class, hence the unusual capitalization
@@ -156,6 +209,237 @@ class SimTimeContextFilter(logging.Filter):
         return True
 
 
+# types of message arguments which can be formatted later, from another thread or process
+_plain_types = (str, int, float, bool, type(None))
+
+_exc_formatter = logging.Formatter()
+
+
+def _has_plain_args(record: logging.LogRecord) -> bool:
+    """Whether the message of *record* can be formatted later, from its template and arguments."""
+    if type(record.msg) is not str:
+        return False
+    args = record.args
+    if not args:
+        return True
+    # a mapping, for %(name)s templates
+    if type(args) is not tuple:
+        return False
+    return all(type(arg) in _plain_types for arg in args)
+
+
+class SimTimeQueueHandler(logging.handlers.QueueHandler):
+    """Handler putting log records in a queue, to be formatted and written by another thread.
+
+    The handler only records the simulation time in the record,
+    like :class:`SimTimeContextFilter` does, and puts the record in *queue*.
+    Formatting and writing is left to whatever consumes the queue,
+    like a :class:`~logging.handlers.QueueListener`,
+    so that it is done off the thread running the simulation.
+
+    The message arguments of the record are kept for the other thread to format,
+    unless they may change or be unsafe to access from another thread,
+    like a simulator object, in which case the message is formatted immediately.
+
+    .. versionadded:: 2.0
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        try:
+            record.created_sim_time = get_sim_time()
+        except RecursionError:
+            record.created_sim_time = None
+
+        if not _has_plain_args(record):
+            record.msg = record.getMessage()
+            record.args = None
+
+        # tracebacks refer to frames which keep running
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _Writer:
+    """Formats and writes queued records with *handler*, in batches, from a background thread.
+
+    Waking up for each record would cost more than formatting it,
+    so the thread wakes up every *interval_s* seconds, or when :meth:`flush` is called.
+    """
+
+    def __init__(
+        self, handler: logging.StreamHandler, interval_s: float = 0.01
+    ) -> None:
+        self.handler = handler
+        self.interval_s = interval_s
+        self.queue: typing.Deque[typing.Union[logging.LogRecord, threading.Event]] = (
+            deque()
+        )
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        self.queue.append(record)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+            self._write_queued()
+        self._write_queued()
+
+    def _write_queued(self) -> None:
+        handler = self.handler
+        lines: typing.List[str] = []
+        records: typing.List[logging.LogRecord] = []
+        written: typing.List[threading.Event] = []
+        while self.queue:
+            item = self.queue.popleft()
+            if isinstance(item, threading.Event):
+                written.append(item)
+            elif item.levelno >= handler.level:
+                try:
+                    lines.append(handler.format(item) + handler.terminator)
+                except Exception:
+                    handler.handleError(item)
+                else:
+                    records.append(item)
+        if lines:
+            # like StreamHandler.emit, but a single write and flush for the batch
+            try:
+                handler.stream.write("".join(lines))
+                handler.flush()
+            except Exception:
+                # none of the batch is known to be written, report each record as failed
+                for record in records:
+                    handler.handleError(record)
+        for event in written:
+            event.set()
+
+    def flush(self) -> None:
+        """Wait until the records queued so far are written."""
+        written = threading.Event()
+        self.queue.append(written)
+        self._wake.set()
+        written.wait()
+
+    def stop(self) -> None:
+        """Write the remaining records and stop the thread."""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+
+
+class StructuredLogHandler(logging.Handler):
+    """Handler writing log records to *filename* in a compact, structured form.
+
+    Each record is written as a line of JSON holding its simulation time in steps,
+    its level, its message template and its arguments,
+    with the names of loggers and the locations of log calls written once and referred to by number.
+    Formatting the message is left to the reader,
+    unless its arguments are not plain strings or numbers.
+    If *filename* ends with ``.gz``, the file is compressed.
+
+    Use ``python -m cocotb_tools.render_log`` to render the file as cocotb would have printed it.
+
+    This handler is added to the root logger by :func:`default_config`
+    if :envvar:`COCOTB_LOG_STRUCTURED` is set.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, filename: str) -> None:
+        super().__init__()
+        self.filename = filename
+        if filename.endswith(".gz"):
+            self._file: typing.TextIO = gzip.open(filename, "wt", encoding="utf-8")
+        else:
+            self._file = open(filename, "w", encoding="utf-8")
+        self._loggers: typing.Dict[str, int] = {}
+        self._sites: typing.Dict[typing.Tuple[str, int, str], int] = {}
+        self._write(
+            {
+                "format": "cocotb-log",
+                "version": 1,
+                "precision": _get_simulator_precision(),
+            }
+        )
+
+    # json.dumps makes a new encoder on each call when given options
+    _encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _write(self, obj: typing.Any) -> None:
+        self._file.write(self._encode(obj) + "\n")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            sim_time = getattr(record, "created_sim_time", None)
+            if sim_time is None:
+                sim_time = get_sim_time()
+
+            logger = self._loggers.get(record.name)
+            if logger is None:
+                logger = self._loggers[record.name] = len(self._loggers)
+                self._write({"logger": logger, "name": record.name})
+            site_key = (record.filename, record.lineno, record.funcName)
+            site = self._sites.get(site_key)
+            if site is None:
+                site = self._sites[site_key] = len(self._sites)
+                self._write(
+                    {
+                        "site": site,
+                        "file": record.filename,
+                        "line": record.lineno,
+                        "func": record.funcName,
+                    }
+                )
+
+            if _has_plain_args(record):
+                msg, args = record.msg, record.args or ()
+            else:
+                msg, args = record.getMessage(), ()
+            entry = [sim_time, logger, site, record.levelno, msg, args]
+            if record.exc_info and not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            if record.exc_text:
+                entry.append(record.exc_text)
+            self._write(entry)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self._file.close()
+        super().close()
+
+
+def _flush() -> None:
+    """Write out the records logged so far which are not written yet."""
+    if _writer is not None:
+        _writer.flush()
+    if _structured_handler is not None:
+        _structured_handler.flush()
+
+
+@atexit.register
+def _stop_writer() -> None:
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
 class SimLogFormatter(logging.Formatter):
     """Log formatter to provide consistent log message handling.
 
@@ -183,12 +467,15 @@ class SimLogFormatter(logging.Formatter):
             return ".." + string[(chars - 2) * -1 :]
         return string.rjust(chars)
 
+    def _time_ns(self, sim_time):
+        return get_time_from_sim_steps(sim_time, "ns")
+
     def _format(self, level, record, msg, coloured=False):
         sim_time = getattr(record, "created_sim_time", None)
         if sim_time is None:
             sim_time_str = "  -.--ns"
         else:
-            time_ns = get_time_from_sim_steps(sim_time, "ns")
+            time_ns = self._time_ns(sim_time)
             sim_time_str = f"{time_ns:6.2f}ns"
         prefix = (
             sim_time_str.rjust(11)
@@ -265,8 +552,22 @@ class SimColourLogFormatter(SimLogFormatter):
         return self._format(level, record, msg, coloured=True)
 
 
-def _filter_from_c(logger_name, level):
-    return logging.getLogger(logger_name).isEnabledFor(level)
+# threshold of a disabled logger, above any level
+_DISABLED = 2**31 - 1
+
+
+def _log_threshold_from_c(logger_name):
+    """Return the lowest level of the messages to pass from the GPI to :func:`_log_from_c`.
+
+    The GPI caches the result until :func:`cocotb.simulator.clear_log_level_cache` is called,
+    which :class:`SimBaseLog` does whenever the level of a logger changes or a logger is disabled.
+    :func:`logging.disable` is not taken into account here,
+    :func:`_log_from_c` still drops the messages it disables.
+    """
+    logger = logging.getLogger(logger_name)
+    if logger.disabled:
+        return _DISABLED
+    return min(logger.getEffectiveLevel(), _DISABLED)
 
 
 def _log_from_c(logger_name, level, filename, lineno, msg, function_name):
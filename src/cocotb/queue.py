@@ -4,10 +4,20 @@
 import asyncio.queues
 import collections
 import heapq
-from typing import Generic, TypeVar
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
 
 import cocotb
-from cocotb.triggers import Event, _pointer_str
+from cocotb.task import Task
+from cocotb.triggers import _park, _pointer_str
 
 
 class QueueFull(asyncio.queues.QueueFull):
@@ -21,6 +31,10 @@ class QueueEmpty(asyncio.queues.QueueEmpty):
 T = TypeVar("T")
 
 
+# marks a woken task which was not handed an item
+_WOKEN = object()
+
+
 class Queue(Generic[T]):
     """A queue, useful for coordinating producer and consumer coroutines.
 
@@ -32,10 +46,20 @@ class Queue(Generic[T]):
     def __init__(self, maxsize: int = 0):
         self._maxsize = maxsize
 
-        self._getters = collections.deque()
-        self._putters = collections.deque()
+        self._getters: Deque[Task[Any]] = collections.deque()
+        self._putters: Deque[Task[Any]] = collections.deque()
+        # the woken tasks which have not resumed yet,
+        # mapped to the item they were handed or _WOKEN
+        self._woken: Dict[Task[Any], Any] = {}
 
         self._init(maxsize)
+        # without a bound or an overridden ordering, the item put can be handed
+        # to the getter woken for it
+        self._direct_handoff = (
+            maxsize <= 0
+            and type(self)._put is Queue._put
+            and type(self)._get is Queue._get
+        )
 
     def _init(self, maxsize):
         self._queue = collections.deque()
@@ -46,12 +70,29 @@ class Queue(Generic[T]):
     def _get(self):
         return self._queue.popleft()
 
-    def _wakeup_next(self, waiters):
-        while waiters:
-            event, task = waiters.popleft()
-            if not task.done():
-                event.set()
-                break
+    def _unpark(self, task: Task[Any], item: Any) -> None:
+        self._woken[task] = item
+        cocotb._scheduler_inst._unpark(task)
+
+    def _cancel_wait(self, task: Task[Any], waiters: Deque[Task[Any]]) -> None:
+        """Take *task*, which stopped waiting in *waiters* with an exception, out of the queue."""
+        if task not in self._woken:
+            # still waiting
+            waiters.remove(task)
+            return
+        # the task was killed after being woken, but before taking its turn,
+        # so give its item back and its turn to the next waiter
+        item = self._woken.pop(task)
+        if waiters is self._getters:
+            if item is not _WOKEN:
+                if self._getters:
+                    self._unpark(self._getters.popleft(), item)
+                else:
+                    self._queue.appendleft(item)
+            elif self._getters and not self.empty():
+                self._unpark(self._getters.popleft(), _WOKEN)
+        elif self._putters and not self.full():
+            self._unpark(self._putters.popleft(), _WOKEN)
 
     def __repr__(self):
         return f"<{type(self).__name__} {self._format()} at {_pointer_str(self)}>"
@@ -104,9 +145,14 @@ class Queue(Generic[T]):
         slot is available before adding the item.
         """
         while self.full():
-            event = Event(f"{type(self).__name__} put")
-            self._putters.append((event, cocotb._scheduler_inst._current_task))
-            await event.wait()
+            task = cocotb._scheduler_inst._current_task
+            self._putters.append(task)
+            try:
+                await _park
+            except BaseException:
+                self._cancel_wait(task, self._putters)
+                raise
+            del self._woken[task]
         self.put_nowait(item)
 
     def put_nowait(self, item: T) -> None:
@@ -116,8 +162,34 @@ class Queue(Generic[T]):
         """
         if self.full():
             raise QueueFull()
-        self._put(item)
-        self._wakeup_next(self._getters)
+        if self._direct_handoff and self._getters:
+            self._unpark(self._getters.popleft(), item)
+        else:
+            self._put(item)
+            if self._getters:
+                self._unpark(self._getters.popleft(), _WOKEN)
+
+    async def put_many(self, items: Iterable[T]) -> None:
+        """Put all *items* into the queue, in order.
+
+        If the queue becomes full, wait until a free
+        slot is available before adding the next item.
+
+        .. versionadded:: 2.0
+        """
+        task = None
+        for item in items:
+            while self.full():
+                if task is None:
+                    task = cocotb._scheduler_inst._current_task
+                self._putters.append(task)
+                try:
+                    await _park
+                except BaseException:
+                    self._cancel_wait(task, self._putters)
+                    raise
+                del self._woken[task]
+            self.put_nowait(item)
 
     async def get(self) -> T:
         """Remove and return an item from the queue.
@@ -125,9 +197,17 @@ class Queue(Generic[T]):
         If the queue is empty, wait until an item is available.
         """
         while self.empty():
-            event = Event(f"{type(self).__name__} get")
-            self._getters.append((event, cocotb._scheduler_inst._current_task))
-            await event.wait()
+            task = cocotb._scheduler_inst._current_task
+            self._getters.append(task)
+            try:
+                await _park
+            except BaseException:
+                self._cancel_wait(task, self._getters)
+                raise
+            # with a direct handoff, the item was handed to this task when it was woken
+            item = self._woken.pop(task)
+            if item is not _WOKEN:
+                return item
         return self.get_nowait()
 
     def get_nowait(self) -> T:
@@ -139,9 +219,27 @@ class Queue(Generic[T]):
         if self.empty():
             raise QueueEmpty()
         item = self._get()
-        self._wakeup_next(self._putters)
+        if self._putters:
+            self._unpark(self._putters.popleft(), _WOKEN)
         return item
 
+    async def get_many(self, max_items: Optional[int] = None) -> List[T]:
+        """Remove and return all items available in the queue, up to *max_items*.
+
+        If the queue is empty, wait until an item is available.
+
+        Raises:
+            ValueError: If *max_items* is less than 1.
+
+        .. versionadded:: 2.0
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        items = [await self.get()]
+        while not self.empty() and (max_items is None or len(items) < max_items):
+            items.append(self.get_nowait())
+        return items
+
 
 class PriorityQueue(Queue):
     r"""A subclass of :class:`Queue`; retrieves entries in priority order (smallest item first).
@@ -30,15 +30,17 @@
 import functools
 import hashlib
 import inspect
+import json
 import logging
 import os
-import pdb
 import random
 import re
+import sys
 import time
 import warnings
 from enum import auto
 from importlib import import_module
+from importlib.util import find_spec
 from itertools import product
 from typing import (
     Any,
@@ -49,6 +51,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -57,9 +60,15 @@ from typing import (
 )
 
 import cocotb
+import cocotb._asyncio_bridge
+import cocotb._import_cache
+import cocotb._persistent
+import cocotb._process_pool
 import cocotb._profiling
+import cocotb._sampling_profiler
 import cocotb._scheduler
 import cocotb._write_scheduler
+import cocotb.logging
 from cocotb import _ANSI, simulator
 from cocotb._exceptions import InternalError
 from cocotb._outcomes import Error, Outcome
@@ -79,19 +88,25 @@ _pdb_on_exception = "COCOTB_PDB_ON_EXCEPTION" in os.environ
 
 _logger = logging.getLogger(__name__)
 
-_Failed: Type[BaseException]
-try:
-    import pytest
-except ModuleNotFoundError:
-    _Failed = AssertionError
-else:
-    try:
-        with pytest.raises(Exception):
-            pass
-    except BaseException as _raises_e:
-        _Failed = type(_raises_e)
-    else:
-        assert False, "pytest.raises doesn't raise an exception when it fails"
+_Failed: Union[Type[BaseException], None] = None
+
+
+def _is_pytest_failure(e: BaseException) -> bool:
+    """Return whether *e* was raised by a failing check of pytest, like :func:`pytest.raises`."""
+    global _Failed
+    if _Failed is None:
+        pytest = sys.modules.get("pytest")
+        if pytest is None:
+            # pytest is not imported until a test or the assertion rewriting needs it
+            return False
+        try:
+            with pytest.raises(Exception):
+                pass
+        except BaseException as raises_e:
+            _Failed = type(raises_e)
+        else:
+            assert False, "pytest.raises doesn't raise an exception when it fails"
+    return isinstance(e, _Failed)
 
 
 # TODO remove SimFailure once we have functionality in place to abort the test without
@@ -140,6 +155,9 @@ class Test:
         stage:
             Order tests logically into stages.
             Tests from earlier stages are run before tests from later stages.
+
+        profile:
+            Profile the test with a sampling profiler, see :envvar:`COCOTB_SAMPLING_PROFILE`.
     """
 
     def __init__(
@@ -155,6 +173,7 @@ class Test:
         expect_error: Union[Type[Exception], Sequence[Type[Exception]]] = (),
         skip: bool = False,
         stage: int = 0,
+        profile: bool = False,
         _expect_sim_failure: bool = False,
     ) -> None:
         if timeout_time is not None:
@@ -186,6 +205,7 @@ class Test:
         self._expect_sim_failure = _expect_sim_failure
         self.skip = skip
         self.stage = stage
+        self.profile = profile
         self.name = self.func.__qualname__ if name is None else name
         self.module = self.func.__module__ if module is None else module
         self.doc = self.func.__doc__ if doc is None else doc
@@ -195,6 +215,161 @@ class Test:
         self.fullname = f"{self.module}.{self.name}"
 
 
+class _TestStub:
+    """Stand-in for a :class:`Test` which is only created if the test is run.
+
+    Used for the variants of parametrized tests, of which there can be very many,
+    while most of them are usually filtered out.
+    Also used for tests of modules that were not imported because the discovery cache
+    showed that none of their tests pass the filters; those can never be created.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        module: str,
+        doc: Optional[str],
+        skip: bool,
+        stage: int,
+        func: Optional[Callable[..., Any]] = None,
+        location: Optional[Tuple[str, int]] = None,
+        create: Optional[Callable[[], Test]] = None,
+    ) -> None:
+        self.name = name
+        self.module = module
+        self.fullname = f"{module}.{name}"
+        self.doc = doc
+        self.skip = skip
+        self.stage = stage
+        self._func = func
+        self._location = location
+        self._create = create
+
+    @property
+    def location(self) -> Tuple[str, int]:
+        """The file and line number of the test function."""
+        if self._location is None:
+            assert self._func is not None
+            self._location = _get_func_location(self._func)
+        return self._location
+
+    def create(self) -> Test:
+        """Create the :class:`Test` this stands in for."""
+        if self._create is None:
+            raise InternalError(f"Test {self.fullname} was not imported")
+        return self._create()
+
+
+def _get_func_location(func: Callable[..., Any]) -> Tuple[str, int]:
+    """Return the file and line number of a test function, looking through decorators."""
+    return _get_unwrapped_func_location(inspect.unwrap(func))
+
+
+# finding the line number tokenizes the source, which is costly for many parametrized tests of the same function
+@functools.lru_cache(maxsize=None)
+def _get_unwrapped_func_location(func: Callable[..., Any]) -> Tuple[str, int]:
+    file = inspect.getfile(func)
+    try:
+        lineno = inspect.getsourcelines(func)[1]
+    except OSError:
+        lineno = 1
+    return file, lineno
+
+
+class _DiscoveryCache:
+    """The tests found in each test module, keyed by a hash of the module's source file.
+
+    See :envvar:`COCOTB_DISCOVERY_CACHE`.
+    """
+
+    _version = 1
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._modules: Dict[str, Dict[str, Any]] = {}
+        self._changed = False
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self._version:
+            self._modules = data["modules"]
+
+    @staticmethod
+    def _hash_module(module_name: str) -> Optional[Tuple[str, str]]:
+        try:
+            spec = find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+            return None
+        with open(spec.origin, "rb") as f:
+            return spec.origin, hashlib.sha1(f.read()).hexdigest()
+
+    def lookup(self, module_name: str) -> Optional[List[_TestStub]]:
+        """Return stubs of the tests in a module, or ``None`` if the module changed or is not in the cache."""
+        entry = self._modules.get(module_name)
+        if entry is None:
+            return None
+        if self._hash_module(module_name) != (entry["file"], entry["sha1"]):
+            return None
+        return [
+            _TestStub(
+                name=test["name"],
+                module=test["module"],
+                doc=None,
+                skip=test["skip"],
+                stage=test["stage"],
+                location=(test["file"], test["lineno"]),
+            )
+            for test in entry["tests"]
+        ]
+
+    def update(self, module_name: str, tests: Sequence[Union[Test, _TestStub]]) -> None:
+        """Record the tests found in a module."""
+        module_hash = self._hash_module(module_name)
+        if module_hash is None:
+            return
+        entries = []
+        for test in tests:
+            if isinstance(test, _TestStub):
+                file, lineno = test.location
+            else:
+                file, lineno = _get_func_location(test.func)
+            entries.append(
+                {
+                    "name": test.name,
+                    "module": test.module,
+                    "skip": test.skip,
+                    "stage": test.stage,
+                    "file": file,
+                    "lineno": lineno,
+                }
+            )
+        self._modules[module_name] = {
+            "file": module_hash[0],
+            "sha1": module_hash[1],
+            "tests": entries,
+        }
+        self._changed = True
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        # replace the file atomically, as regressions may be running in parallel
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, "w") as f:
+                json.dump({"version": self._version, "modules": self._modules}, f)
+            os.replace(tmp_filename, self.filename)
+        except OSError as e:
+            _logger.warning(
+                "Failed to write test discovery cache %s: %s", self.filename, e
+            )
+
+
 def _format_doc(docstring: Union[str, None]) -> str:
     if docstring is None:
         return ""
@@ -238,7 +413,7 @@ class RegressionManager:
     _timer1 = Timer(1)
 
     def __init__(self) -> None:
-        self._test: Test
+        self._test: Union[Test, _TestStub]
         self._test_task: Task[None]
         self._test_outcome: Union[None, Outcome[Any]]
         self._test_start_time: float
@@ -257,11 +432,15 @@ class RegressionManager:
         self.failures = 0
         """The current number of failed tests."""
         self._tearing_down = False
-        self._test_queue: List[Test] = []
+        self._test_queue: List[Union[Test, _TestStub]] = []
         self._filters: List[re.Pattern[str]] = []
         self._mode = RegressionMode.REGRESSION
         self._included: List[bool]
         self._sim_failure: Union[SimFailure, None] = None
+        self._test_profile: Union[Dict[str, Any], None] = None
+        self._sampling_profiler: Union[
+            cocotb._sampling_profiler.SamplingProfiler, None
+        ] = None
 
         # Setup XUnit
         ###################
@@ -285,7 +464,24 @@ class RegressionManager:
         Raises:
             RuntimeError: If no tests are found in any of the provided modules.
         """
+        cache_filename = os.getenv("COCOTB_DISCOVERY_CACHE")
+        cache = _DiscoveryCache(cache_filename) if cache_filename else None
+
         for module_name in modules:
+            cached_tests = None if cache is None else cache.lookup(module_name)
+            if (
+                cached_tests is not None
+                and self._filters
+                and not any(self._is_included(test) for test in cached_tests)
+            ):
+                self.log.debug(
+                    "Not importing module %r, none of its tests pass the filters",
+                    module_name,
+                )
+                for test in cached_tests:
+                    self.register_test(test)
+                continue
+
             mod = import_module(module_name)
 
             if not hasattr(mod, "__cocotb_tests__"):
@@ -296,6 +492,12 @@ class RegressionManager:
             for test in mod.__cocotb_tests__:
                 self.register_test(test)
 
+            if cache is not None and cached_tests is None:
+                cache.update(module_name, mod.__cocotb_tests__)
+
+        if cache is not None:
+            cache.save()
+
         # error if no tests were discovered
         if not self._test_queue:
             modules_str = ", ".join(repr(m) for m in modules)
@@ -317,6 +519,9 @@ class RegressionManager:
             compiled_filter = re.compile(filter)
             self._filters.append(compiled_filter)
 
+    def _is_included(self, test: Union[Test, _TestStub]) -> bool:
+        return any(filter.search(test.fullname) for filter in self._filters)
+
     def set_mode(self, mode: RegressionMode) -> None:
         """Set the regression mode.
 
@@ -328,7 +533,7 @@ class RegressionManager:
         """
         self._mode = mode
 
-    def register_test(self, test: Test) -> None:
+    def register_test(self, test: Union[Test, _TestStub]) -> None:
         """Register a test with the :class:`RegressionManager`.
 
         Should be called before :meth:`start_regression` is called.
@@ -344,7 +549,12 @@ class RegressionManager:
         """Configure pytest to rewrite assertions for better failure messages.
 
         Must be called before all modules containing tests are imported.
+        Assertions are rewritten in the files matching :envvar:`COCOTB_REWRITE_ASSERTION_FILES`.
         """
+        python_files = os.getenv("COCOTB_REWRITE_ASSERTION_FILES", "*.py").strip()
+        if not python_files:
+            # importing pytest is a large part of the start-up time
+            return
         try:
             import pytest
         except ImportError:
@@ -359,7 +569,7 @@ class RegressionManager:
             from _pytest.config import Config
 
             pytest_conf = Config.fromdictargs(
-                {}, ["--capture=no", "-o", "python_files=*.py"]
+                {}, ["--capture=no", "-o", f"python_files={python_files}"]
             )
             install_importhook(pytest_conf)
         except Exception:
@@ -376,11 +586,7 @@ class RegressionManager:
 
         # mark tests for running
         if self._filters:
-            self._included = [False] * len(self._test_queue)
-            for i, test in enumerate(self._test_queue):
-                for filter in self._filters:
-                    if filter.search(test.fullname):
-                        self._included[i] = True
+            self._included = [self._is_included(test) for test in self._test_queue]
         else:
             self._included = [True] * len(self._test_queue)
 
@@ -419,6 +625,10 @@ class RegressionManager:
                 self._record_test_skipped()
                 continue
 
+            # the test is going to be run, so create it if it was stubbed out
+            if isinstance(self._test, _TestStub):
+                self._test = self._test.create()
+
             # if the test should be run, but the simulator has failed, record and continue
             if self._sim_failure is not None:
                 self._record_sim_failure()
@@ -444,6 +654,13 @@ class RegressionManager:
             self._test_outcome = None
             self._test_start_sim_time = get_sim_time("ns")
             self._test_start_time = time.time()
+            if cocotb._profiling.report is not None:
+                cocotb._profiling.report.start_test()
+            if cocotb._profiling.instrumentation is not None:
+                cocotb._scheduler_inst.instrument(cocotb._profiling.instrumentation)
+            if self._test.profile or cocotb._sampling_profiler.output_dir is not None:
+                self._sampling_profiler = cocotb._sampling_profiler.SamplingProfiler()
+                self._sampling_profiler.start()
 
             if self._first_test:
                 self._first_test = False
@@ -454,23 +671,28 @@ class RegressionManager:
         return self._tear_down()
 
     def _schedule_next_test(self, trigger: Optional[Trigger] = None) -> None:
-        if trigger is not None:
-            # Invalidate get_sim_time cache
-            # Must be first as it affects all logging calls.
-            # TODO move to GPITrigger
-            _get_sim_time.cache_clear()
+        with cocotb._profiling.profiling_context:
+            if trigger is not None:
+                # Invalidate get_sim_time cache
+                # Must be first as it affects all logging calls.
+                # TODO move to GPITrigger
+                _get_sim_time.cache_clear()
 
-            # TODO move to Timer object
-            cocotb.sim_phase = cocotb.SimPhase.NORMAL
-            trigger._cleanup()
+                instrumentation = cocotb._scheduler_inst._instrumentation
+                if instrumentation is not None:
+                    instrumentation.gpi_callback(trigger)
 
-        cocotb._write_scheduler.start_write_scheduler()
+                # TODO move to Timer object
+                cocotb.sim_phase = cocotb.SimPhase.NORMAL
+                trigger._cleanup()
 
-        self._test_task._add_done_callback(
-            lambda _: cocotb._scheduler_inst.shutdown_soon()
-        )
-        cocotb._scheduler_inst._schedule_task(self._test_task)
-        cocotb._scheduler_inst._event_loop()
+            cocotb._write_scheduler.start_write_scheduler()
+
+            self._test_task._add_done_callback(
+                lambda _: cocotb._scheduler_inst.shutdown_soon()
+            )
+            cocotb._scheduler_inst._schedule_task(self._test_task)
+            cocotb._scheduler_inst._event_loop()
 
     def _tear_down(self) -> None:
         """Called by :meth:`_execute` when there are no more tests to run to finalize the regression."""
@@ -487,8 +709,20 @@ class RegressionManager:
 
         # Generate output reports
         self.xunit.write()
+        if cocotb._profiling.report is not None:
+            cocotb._profiling.report.write()
+        cocotb._import_cache.save()
+
+        # In persistent mode, keep the simulator alive and run the next batch of tests if the runner submits one
+        if self._sim_failure is None and cocotb._persistent.enabled():
+            env = cocotb._persistent.request_next_batch(self.xunit.filename)
+            if env is not None:
+                cocotb._start_next_batch(env)
+                return
 
         # Setup simulator finalization
+        cocotb._process_pool._shutdown()
+        cocotb.logging._flush()
         simulator.stop_simulator()
         cocotb._profiling.finalize()
         cocotb._stop_user_coverage()
@@ -505,10 +739,28 @@ class RegressionManager:
         wall_time_s = time.time() - self._test_start_time
         sim_time_ns = get_sim_time("ns") - self._test_start_sim_time
         test = self._test
+        if cocotb._profiling.report is not None:
+            self._test_profile = cocotb._profiling.report.end_test(
+                test.fullname, wall_time_s, sim_time_ns
+            )
+        if self._sampling_profiler is not None:
+            self._sampling_profiler.stop()
+            self._sampling_profiler.write(
+                cocotb._sampling_profiler.profile_filename(test.fullname)
+            )
+            self._sampling_profiler = None
+        if cocotb._profiling.trace is not None:
+            cocotb._profiling.trace.flush()
 
         # clean up write scheduler
         cocotb._write_scheduler.stop_write_scheduler()
 
+        # discard results of run_in_process which the test did not wait for
+        cocotb._process_pool._cancel_pending()
+
+        # cancel asyncio code the test left running
+        cocotb._asyncio_bridge._close()
+
         # score test
         if self._test_outcome is not None:
             outcome = self._test_outcome
@@ -552,7 +804,9 @@ class RegressionManager:
                 msg="passed but we expected a failure",
             )
 
-        elif isinstance(result, (AssertionError, _Failed)) and test.expect_fail:
+        elif (
+            isinstance(result, AssertionError) or _is_pytest_failure(result)
+        ) and test.expect_fail:
             self._record_test_passed(
                 wall_time_s=wall_time_s,
                 sim_time_ns=sim_time_ns,
@@ -585,16 +839,20 @@ class RegressionManager:
             )
 
             if _pdb_on_exception:
+                import pdb
+
                 pdb.post_mortem(result.__traceback__)
 
+        # the result of the test must be in the log before anything else happens
+        cocotb.logging._flush()
+
         # continue test loop, assuming sim failure or not
         return self._execute()
 
-    def _get_lineno(self, test: Test) -> None:
-        try:
-            return inspect.getsourcelines(test.func)[1]
-        except OSError:
-            return 1
+    def _get_location(self, test: Union[Test, _TestStub]) -> Tuple[str, int]:
+        if isinstance(test, _TestStub):
+            return test.location
+        return _get_func_location(test.func)
 
     def _log_test_start(self) -> None:
         """Called by :meth:`_execute` to log that a test is starting."""
@@ -614,11 +872,11 @@ class RegressionManager:
         """Called by :meth:`_execute` when a test is excluded by filters."""
 
         # write out xunit results
-        lineno = self._get_lineno(self._test)
+        file, lineno = self._get_location(self._test)
         self.xunit.add_testcase(
             name=self._test.name,
             classname=self._test.module,
-            file=inspect.getfile(self._test.func),
+            file=file,
             lineno=repr(lineno),
             time=repr(0),
             sim_time_ns=repr(0),
@@ -645,11 +903,11 @@ class RegressionManager:
         )
 
         # write out xunit results
-        lineno = self._get_lineno(self._test)
+        file, lineno = self._get_location(self._test)
         self.xunit.add_testcase(
             name=self._test.name,
             classname=self._test.module,
-            file=inspect.getfile(self._test.func),
+            file=file,
             lineno=repr(lineno),
             time=repr(0),
             sim_time_ns=repr(0),
@@ -688,11 +946,11 @@ class RegressionManager:
         )
 
         # write out xunit results
-        lineno = self._get_lineno(self._test)
+        file, lineno = self._get_location(self._test)
         self.xunit.add_testcase(
             name=self._test.name,
             classname=self._test.module,
-            file=inspect.getfile(self._test.func),
+            file=file,
             lineno=repr(lineno),
             time=repr(0),
             sim_time_ns=repr(0),
@@ -743,16 +1001,17 @@ class RegressionManager:
 
         # write out xunit results
         ratio_time = self._safe_divide(sim_time_ns, wall_time_s)
-        lineno = self._get_lineno(self._test)
+        file, lineno = self._get_location(self._test)
         self.xunit.add_testcase(
             name=self._test.name,
             classname=self._test.module,
-            file=inspect.getfile(self._test.func),
+            file=file,
             lineno=repr(lineno),
             time=repr(wall_time_s),
             sim_time_ns=repr(sim_time_ns),
             ratio_time=repr(ratio_time),
         )
+        self._record_test_profile()
 
         # update running passed/failed/skipped counts
         self.passed += 1
@@ -793,16 +1052,17 @@ class RegressionManager:
 
         # write out xunit results
         ratio_time = self._safe_divide(sim_time_ns, wall_time_s)
-        lineno = self._get_lineno(self._test)
+        file, lineno = self._get_location(self._test)
         self.xunit.add_testcase(
             name=self._test.name,
             classname=self._test.module,
-            file=inspect.getfile(self._test.func),
+            file=file,
             lineno=repr(lineno),
             time=repr(wall_time_s),
             sim_time_ns=repr(sim_time_ns),
             ratio_time=repr(ratio_time),
         )
+        self._record_test_profile()
         self.xunit.add_failure(
             message=f"Test failed with RANDOM_SEED={cocotb._random_seed}"
         )
@@ -822,6 +1082,20 @@ class RegressionManager:
             }
         )
 
+    def _record_test_profile(self) -> None:
+        """Add the statistics collected for the current test by :envvar:`COCOTB_PROFILING_REPORT` to the xUnit results."""
+        if self._test_profile is None:
+            return
+        for name, value in self._test_profile.items():
+            if isinstance(value, dict):
+                for key, count in value.items():
+                    self.xunit.add_testcase_property(
+                        name=f"{name}.{key}", value=repr(count)
+                    )
+            else:
+                self.xunit.add_testcase_property(name=name, value=repr(value))
+        self._test_profile = None
+
     def _record_sim_failure(self) -> None:
         if self._test._expect_sim_failure:
             self._record_test_passed(
@@ -0,0 +1,133 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sampling of signals by many monitors at once."""
+
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import cocotb
+import cocotb.task
+from cocotb import simulator
+from cocotb.handle import LogicObject
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
+from cocotb.types import LogicArray
+
+SampleCallback = Callable[..., None]
+
+
+class Sampler:
+    r"""Call functions with the final values of signals in the time steps of the edges of a clock.
+
+    Monitors usually wake up on every clock edge to sample their signals once their values are final,
+    with ``await RisingEdge(clk)`` then ``await ReadOnly()``.
+    With many monitors, each of them wakes up twice per cycle.
+    A sampler instead wakes up once per edge and once in the :class:`~cocotb.triggers.ReadOnly` phase,
+    reads the values of the signals of all its callbacks with a single call to the simulator,
+    and calls the callbacks in the order they were added in.
+
+    The sampler is started when the first callback is added,
+    and stops at the next edge once all callbacks are removed.
+    Like other :term:`task`\ s, it stops at the end of the test,
+    and is started again when a callback is added in a later test.
+    An exception raised by a callback fails the test.
+
+    Several samplers, even of different clocks, share the :class:`~cocotb.triggers.ReadOnly` phase of a time step.
+
+    Example:
+
+    .. code-block:: python
+
+        sampler = Sampler(dut.clk)
+        transactions = []
+
+
+        def sample(valid, data):
+            if valid.is_resolvable and valid == 1:
+                transactions.append(data.to_unsigned())
+
+
+        sampler.add(sample, dut.stream_in_valid, dut.stream_in_data)
+
+    Args:
+        clock: The clock signal.
+        rising: If ``True``, sample in the time steps of the rising edges of *clock*;
+            otherwise in those of its falling edges.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, clock: LogicObject, rising: bool = True) -> None:
+        self.clock = clock
+        self.rising = rising
+        self._callbacks: List[Tuple[SampleCallback, Tuple[LogicObject, ...]]] = []
+        # the signals of all callbacks, without duplicates, and which of them each callback gets
+        self._handles: List[simulator.gpi_sim_hdl] = []
+        self._entries: Tuple[Tuple[SampleCallback, Tuple[int, ...]], ...] = ()
+        self._task: Optional[cocotb.task.Task[None]] = None
+
+    def add(self, callback: SampleCallback, *signals: LogicObject) -> None:
+        """Call *callback* with the :class:`~cocotb.types.LogicArray` values of *signals* in each sampled time step.
+
+        The callback is called in the :class:`~cocotb.triggers.ReadOnly` phase,
+        so it cannot write to signals.
+
+        Raises:
+            TypeError: If one of the *signals* is not a :class:`~cocotb.handle.LogicObject`.
+        """
+        for signal in signals:
+            if not isinstance(signal, LogicObject):
+                raise TypeError(
+                    f"Only LogicObjects can be sampled, not {type(signal).__qualname__}"
+                )
+        self._callbacks.append((callback, signals))
+        self._update()
+        if self._task is None or self._task.done():
+            self._task = cocotb.start_soon(self._run())
+
+    def remove(self, callback: SampleCallback) -> None:
+        """Stop calling *callback*.
+
+        If *callback* was added several times, the last one added is removed.
+
+        Raises:
+            ValueError: If *callback* was not added.
+        """
+        for i in reversed(range(len(self._callbacks))):
+            if self._callbacks[i][0] == callback:
+                del self._callbacks[i]
+                break
+        else:
+            raise ValueError(f"{callback!r} was not added to {self!r}")
+        self._update()
+
+    def _update(self) -> None:
+        index: Dict[LogicObject, int] = {}
+        entries = []
+        for callback, signals in self._callbacks:
+            entries.append(
+                (callback, tuple(index.setdefault(s, len(index)) for s in signals))
+            )
+        self._handles = [s._handle for s in index]
+        self._entries = tuple(entries)
+
+    async def _run(self) -> None:
+        edge: Union[RisingEdge, FallingEdge]
+        edge = RisingEdge(self.clock) if self.rising else FallingEdge(self.clock)
+        read_only = ReadOnly()
+        from_handle = LogicArray._from_handle
+        while True:
+            await edge
+            if not self._entries:
+                break
+            await read_only
+            values = [
+                from_handle(v) for v in simulator.get_signal_val_binstrs(self._handles)
+            ]
+            # callbacks added or removed by a callback take effect in the next time step
+            for callback, indexes in self._entries:
+                callback(*[values[i] for i in indexes])
+
+    def __repr__(self) -> str:
+        edge = "rising" if self.rising else "falling"
+        return f"<{type(self).__qualname__} of the {edge} edges of {self.clock._path}>"
@@ -18,8 +18,17 @@ extern "C" {
 
 PYGPILOG_EXPORT void py_gpi_logger_set_level(int level);
 
+/** Forget the log levels cached for each logger.
+    Must be called when the level of a Python logger may have changed.
+ */
+PYGPILOG_EXPORT void py_gpi_logger_clear_level_cache();
+
+/** Log GPI messages with the Python function *handler*.
+    *threshold* is called with the name of a logger,
+    and returns the lowest level of the messages the logger handles.
+ */
 PYGPILOG_EXPORT void py_gpi_logger_initialize(PyObject* handler,
-                                              PyObject* filter);
+                                              PyObject* threshold);
 
 PYGPILOG_EXPORT void py_gpi_logger_finalize();
 
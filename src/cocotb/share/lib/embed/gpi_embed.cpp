@@ -308,16 +308,17 @@ extern "C" COCOTB_EXPORT int _embed_sim_init(int argc,
     }
     DEFER(Py_DECREF(log_func));
 
-    auto filter_func = PyObject_GetAttrString(entry_module, "_filter_from_c");
-    if (!filter_func) {
+    auto threshold_func =
+        PyObject_GetAttrString(entry_module, "_log_threshold_from_c");
+    if (!threshold_func) {
         // LCOV_EXCL_START
         PyErr_Print();
         return -1;
         // LCOV_EXCL_STOP
     }
-    DEFER(Py_DECREF(filter_func));
+    DEFER(Py_DECREF(threshold_func));
 
-    py_gpi_logger_initialize(log_func, filter_func);
+    py_gpi_logger_initialize(log_func, threshold_func);
 
     pEventFn = PyObject_GetAttrString(entry_module, "_sim_event");
     if (!pEventFn) {
@@ -7,16 +7,45 @@
 #include <gpi_logging.h>     // all things GPI logging
 #include <py_gpi_logging.h>  // this library
 
-#include <cstdarg>  // va_list, va_copy, va_end
-#include <cstdio>   // fprintf, vsnprintf
-#include <vector>   // std::vector
+#include <atomic>         // std::atomic
+#include <cstdarg>        // va_list, va_copy, va_end
+#include <cstdio>         // fprintf, vsnprintf
+#include <string>         // std::string
+#include <unordered_map>  // std::unordered_map
+#include <vector>         // std::vector
 
 static PyObject *pLogHandler = nullptr;
 
-static PyObject *pLogFilter = nullptr;
+static PyObject *pLogThreshold = nullptr;
 
 static int py_gpi_log_level = GPIInfo;
 
+// The lowest level enabled for each logger, as last returned by pLogThreshold,
+// so that disabled messages are dropped without calling into Python.
+// Entries of an older generation are stale, the generation is bumped by
+// py_gpi_logger_clear_level_cache() whenever Python changes a log level.
+struct LevelCacheEntry {
+    int threshold;
+    unsigned generation;
+};
+static std::unordered_map<std::string, LevelCacheEntry> level_cache;
+static std::atomic<unsigned> level_cache_generation(0);
+// the last looked up entry, GPI logs nearly always go to the same logger
+static std::string last_name;
+static LevelCacheEntry *last_entry = nullptr;
+
+static LevelCacheEntry *find_level(const char *name) {
+    if (!last_entry || last_name != name) {
+        auto it = level_cache.find(name);
+        if (it == level_cache.end()) {
+            return nullptr;
+        }
+        last_name = it->first;
+        last_entry = &it->second;
+    }
+    return last_entry;
+}
+
 static void fallback_handler(const char *name, int level, const char *pathname,
                              const char *funcname, long lineno,
                              const char *msg) {
@@ -34,6 +63,14 @@ static void py_gpi_log_handler(void *, const char *name, int level,
         return;
     }
 
+    unsigned generation =
+        level_cache_generation.load(std::memory_order_relaxed);
+    LevelCacheEntry *cached = find_level(name);
+    if (cached && cached->generation == generation &&
+        level < cached->threshold) {
+        return;
+    }
+
     va_list argp_copy;
     va_copy(argp_copy, argp);
     DEFER(va_end(argp_copy));
@@ -79,6 +116,37 @@ static void py_gpi_log_handler(void *, const char *name, int level,
         }
     }
 
+    // the level cache is refreshed after formatting, so that errors can fall
+    // back to the native logger with the message
+    if (!cached || cached->generation != generation) {
+        PyObject *threshold_ret =
+            PyObject_CallFunction(pLogThreshold, "s", name);  // New reference
+        if (threshold_ret == NULL) {
+            // LCOV_EXCL_START
+            PyErr_Print();
+            return fallback_handler(name, level, pathname, funcname, lineno,
+                                    log_buff.data());
+            // LCOV_EXCL_STOP
+        }
+        long threshold = PyLong_AsLong(threshold_ret);
+        Py_DECREF(threshold_ret);
+        if (threshold == -1 && PyErr_Occurred()) {
+            // LCOV_EXCL_START
+            PyErr_Print();
+            return fallback_handler(name, level, pathname, funcname, lineno,
+                                    log_buff.data());
+            // LCOV_EXCL_STOP
+        }
+        cached = &level_cache[name];
+        cached->threshold = (int)threshold;
+        cached->generation = generation;
+        last_name = name;
+        last_entry = cached;
+        if (level < cached->threshold) {
+            return;
+        }
+    }
+
     PyObject *level_arg = PyLong_FromLong(level);  // New reference
     if (level_arg == NULL) {
         // LCOV_EXCL_START
@@ -99,31 +167,6 @@ static void py_gpi_log_handler(void *, const char *name, int level,
     }
     DEFER(Py_DECREF(logger_name_arg));
 
-    // check if log level is enabled
-    PyObject *filter_ret = PyObject_CallFunctionObjArgs(
-        pLogFilter, logger_name_arg, level_arg, NULL);
-    if (filter_ret == NULL) {
-        // LCOV_EXCL_START
-        PyErr_Print();
-        return fallback_handler(name, level, pathname, funcname, lineno,
-                                log_buff.data());
-        // LCOV_EXCL_STOP
-    }
-
-    int is_enabled = PyObject_IsTrue(filter_ret);
-    Py_DECREF(filter_ret);
-    if (is_enabled < 0) {
-        // LCOV_EXCL_START
-        PyErr_Print();
-        return fallback_handler(name, level, pathname, funcname, lineno,
-                                log_buff.data());
-        // LCOV_EXCL_STOP
-    }
-
-    if (!is_enabled) {
-        return;
-    }
-
     PyObject *filename_arg = PyUnicode_FromString(pathname);  // New reference
     if (filename_arg == NULL) {
         // LCOV_EXCL_START
@@ -181,18 +224,27 @@ static void py_gpi_log_handler(void *, const char *name, int level,
 extern "C" void py_gpi_logger_set_level(int level) {
     py_gpi_log_level = level;
     gpi_native_logger_set_level(level);
+    py_gpi_logger_clear_level_cache();
+}
+
+extern "C" void py_gpi_logger_clear_level_cache() {
+    level_cache_generation.fetch_add(1, std::memory_order_relaxed);
 }
 
-extern "C" void py_gpi_logger_initialize(PyObject *handler, PyObject *filter) {
+extern "C" void py_gpi_logger_initialize(PyObject *handler,
+                                         PyObject *threshold) {
     Py_INCREF(handler);
-    Py_INCREF(filter);
+    Py_INCREF(threshold);
     pLogHandler = handler;
-    pLogFilter = filter;
+    pLogThreshold = threshold;
     gpi_set_log_handler(py_gpi_log_handler, nullptr);
 }
 
 extern "C" void py_gpi_logger_finalize() {
     gpi_clear_log_handler();
     Py_XDECREF(pLogHandler);
-    Py_XDECREF(pLogFilter);
+    Py_XDECREF(pLogThreshold);
+    level_cache.clear();
+    last_name.clear();
+    last_entry = nullptr;
 }
@@ -35,12 +35,14 @@
  */
 
 #include <Python.h>
-#include <cocotb_utils.h>    // to_python to_simulator
-#include <py_gpi_logging.h>  // py_gpi_logger_set_level
+#include <cocotb_utils.h>  // to_python to_simulator
+#include <py_gpi_logging.h>  // py_gpi_logger_set_level, py_gpi_logger_clear_level_cache
 
+#include <algorithm>
 #include <cerrno>
 #include <limits>
 #include <type_traits>
+#include <vector>
 
 #include "gpi.h"
 
@@ -74,6 +76,8 @@ struct PythonCallback {
 
 class GpiClock;
 using gpi_clk_hdl = GpiClock *;
+class GpiClockGroup;
+using gpi_clk_group_hdl = GpiClockGroup *;
 
 /* define the extension types as templates */
 namespace {
@@ -164,6 +168,8 @@ template <>
 PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type;
 template <>
 PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type;
+template <>
+PyTypeObject gpi_hdl_Object<gpi_clk_group_hdl>::py_type;
 }  // namespace
 
 typedef int (*gpi_function_t)(void *);
@@ -714,6 +720,58 @@ static PyObject *get_sim_time(PyObject *, PyObject *) {
     return pTuple;
 }
 
+static PyObject *get_signal_val_binstrs(PyObject *, PyObject *args) {
+    PyObject *pHandles;
+
+    if (!PyArg_ParseTuple(args, "O:get_signal_val_binstrs", &pHandles)) {
+        return NULL;
+    }
+
+    PyObject *fast = PySequence_Fast(
+        pHandles, "get_signal_val_binstrs() argument must be a sequence");
+    if (fast == NULL) {
+        return NULL;
+    }
+    DEFER(Py_DECREF(fast));
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(fast);
+    PyObject **items = PySequence_Fast_ITEMS(fast);
+    PyObject *result = PyList_New(n);
+    if (result == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (Py_TYPE(items[i]) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            PyErr_Format(PyExc_TypeError,
+                         "get_signal_val_binstrs() items must be %s, not %s",
+                         gpi_hdl_Object<gpi_sim_hdl>::py_type.tp_name,
+                         Py_TYPE(items[i])->tp_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        const char *binstr = gpi_get_signal_value_binstr(
+            ((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl);
+        if (binstr == NULL) {
+            // LCOV_EXCL_START
+            PyErr_SetString(
+                PyExc_RuntimeError,
+                "Simulator yielded a null pointer instead of binstr");
+            Py_DECREF(result);
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        PyObject *value = PyUnicode_FromString(binstr);
+        if (value == NULL) {
+            // LCOV_EXCL_START
+            Py_DECREF(result);
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        PyList_SET_ITEM(result, i, value);
+    }
+    return result;
+}
+
 static PyObject *get_precision(PyObject *, PyObject *) {
     if (!gpi_has_registered_impl()) {
         char const *msg =
@@ -801,87 +859,350 @@ static PyObject *log_level(PyObject *, PyObject *args) {
     Py_RETURN_NONE;
 }
 
+static PyObject *clear_log_level_cache(PyObject *, PyObject *) {
+    py_gpi_logger_clear_level_cache();
+
+    Py_RETURN_NONE;
+}
+
+class GpiClockGroup;
+
 class GpiClock {
   public:
     GpiClock(GpiObjHdl *clk_sig) : clk_signal(clk_sig) {}
 
-    ~GpiClock() { stop(); }
+    ~GpiClock();
 
     // Start the clock. Returns nonzero in case of failure:
     //  - EBUSY if the clock was already started (stop first)
     //  - EINVAL if the parameters are invalid
     //  - EAGAIN if registering the toggle callback failed
-    int start(uint64_t period_steps, uint64_t high_steps, bool start_high);
+    int start(uint64_t period_steps, uint64_t high_steps, bool start_high,
+              uint64_t phase_steps, uint64_t jitter_steps, uint64_t seed);
 
     int stop();
 
+    // Change the period from the next rising edge on.
+    // Returns EINVAL if the parameters are invalid.
+    int set_period(uint64_t period_steps, uint64_t high_steps);
+
+    // Gate the clock. A disabled clock stays low from its next falling edge
+    // on, and rises again at the first rising edge after being enabled.
+    void set_enabled(bool enabled) { clk_enabled = enabled; }
+
+    bool is_running() const { return running; }
+
+    // The number of rising edges since the clock was started, including the
+    // edges suppressed by gating.
+    uint64_t get_cycles() const { return cycles; }
+
+    // The absolute time of the next edge.
+    uint64_t get_next_edge() const { return next_edge; }
+
+    // The absolute time of the rising edge counted as cycle `cycle`, which
+    // must be a later cycle, given the current period and jitter.
+    uint64_t cycle_time(uint64_t cycle) const;
+
   private:
+    friend class GpiClockGroup;
+
     GpiObjHdl *clk_signal = nullptr;
-    GpiCbHdl *clk_toggle_cb_hdl = nullptr;
+    // The group sharing the timed callback of this clock. A clock which was
+    // not added to a group gets a group of its own when started.
+    GpiClockGroup *group = nullptr;
+    GpiClockGroup *own_group = nullptr;
+    bool running = false;
 
     uint64_t period = 0;
     uint64_t t_high = 0;
+    uint64_t next_period = 0;
+    uint64_t next_t_high = 0;
+    uint64_t jitter = 0;
+    uint64_t rng_state = 0;
+    bool clk_enabled = true;
 
+    // the value of the clock waveform before gating
     int clk_val = 0;
+    // absolute times of the next edge, without and with jitter
+    uint64_t next_nominal = 0;
+    uint64_t next_edge = 0;
+    uint64_t cycles = 0;
+
+    static bool valid_timing(uint64_t period_steps, uint64_t high_steps,
+                             uint64_t jitter_steps);
+    uint64_t jittered(uint64_t nominal, uint64_t prev_edge,
+                      uint64_t &state) const;
+    void drive();
+    void toggle(uint64_t now);
+};
+
+// Drives the edges of any number of clocks from a single timed callback.
+class GpiClockGroup {
+  public:
+    ~GpiClockGroup();
+
+    // Add a clock to this group. Returns EBUSY if the clock is running or
+    // belongs to another group.
+    int add(GpiClock *clk);
+
+    void remove(GpiClock *clk);
+
+    // Register the timed callback for the earliest edge of the running
+    // clocks. Returns EAGAIN if registering the callback failed.
+    int reschedule(uint64_t now);
 
-    int toggle(bool initialSet);
-    static int toggle_cb(void *gpi_clk);
+  private:
+    std::vector<GpiClock *> clocks;
+    GpiCbHdl *toggle_cb_hdl = nullptr;
+    // absolute time the callback is registered for
+    uint64_t cb_time = 0;
+
+    static int toggle_cb(void *gpi_clk_group);
 };
 
-int GpiClock::start(uint64_t period_steps, uint64_t high_steps,
-                    bool start_high) {
-    if (clk_toggle_cb_hdl) {
-        return EBUSY;
+static uint64_t sim_time_now() {
+    uint32_t high, low;
+    gpi_get_sim_time(&high, &low);
+    return (static_cast<uint64_t>(high) << 32) | low;
+}
+
+GpiClock::~GpiClock() {
+    stop();
+    if (group) {
+        group->remove(this);
     }
+    delete own_group;
+}
+
+bool GpiClock::valid_timing(uint64_t period_steps, uint64_t high_steps,
+                            uint64_t jitter_steps) {
     if ((period_steps < 2) || (high_steps < 1) ||
         (high_steps >= period_steps)) {
+        return false;
+    }
+    // edges moved by the jitter must stay in order
+    uint64_t shortest = std::min(high_steps, period_steps - high_steps);
+    return jitter_steps < (shortest + 1) / 2;
+}
+
+int GpiClock::start(uint64_t period_steps, uint64_t high_steps, bool start_high,
+                    uint64_t phase_steps, uint64_t jitter_steps,
+                    uint64_t seed) {
+    if (running) {
+        return EBUSY;
+    }
+    if (!valid_timing(period_steps, high_steps, jitter_steps)) {
         return EINVAL;
     }
+    if (!group) {
+        if (!own_group) {
+            own_group = new GpiClockGroup();
+        }
+        own_group->add(this);
+    }
+
+    period = next_period = period_steps;
+    t_high = next_t_high = high_steps;
+    jitter = jitter_steps;
+    rng_state = seed;
+    cycles = 0;
 
-    period = period_steps;
-    t_high = high_steps;
+    uint64_t now = sim_time_now();
+    if (phase_steps) {
+        // hold the opposite value until the waveform starts
+        clk_val = !start_high;
+        drive();
+        next_nominal = next_edge = now + phase_steps;
+    } else {
+        clk_val = !start_high;
+        next_nominal = now;
+        toggle(now);
+    }
 
-    clk_val = start_high;
-    return toggle(true);
+    running = true;
+    int ret = group->reschedule(now);
+    if (ret) {
+        running = false;
+    }
+    return ret;
 }
 
 int GpiClock::stop() {
-    if (!clk_toggle_cb_hdl) {
+    if (!running) {
         return -1;
     }
-    gpi_deregister_callback(clk_toggle_cb_hdl);
-    clk_toggle_cb_hdl = nullptr;
+    running = false;
+    group->reschedule(sim_time_now());
     return 0;
 }
 
-int GpiClock::toggle(bool initialSet) {
-    if (!initialSet) {
-        clk_val = !clk_val;
+int GpiClock::set_period(uint64_t period_steps, uint64_t high_steps) {
+    if (!valid_timing(period_steps, high_steps, jitter)) {
+        return EINVAL;
     }
-    gpi_set_signal_value_int(clk_signal, clk_val, GPI_DEPOSIT);
+    next_period = period_steps;
+    next_t_high = high_steps;
+    return 0;
+}
 
-    uint64_t to_next_edge = clk_val ? t_high : (period - t_high);
+// the increment of the splitmix64 state for each edge
+static const uint64_t rng_increment = 0x9e3779b97f4a7c15ULL;
+
+uint64_t GpiClock::jittered(uint64_t nominal, uint64_t prev_edge,
+                            uint64_t &state) const {
+    uint64_t edge = nominal;
+    if (jitter) {
+        // splitmix64
+        uint64_t z = (state += rng_increment);
+        z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+        z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+        z = z ^ (z >> 31);
+        edge = nominal - jitter + z % (2 * jitter + 1);
+    }
+    // an edge moved by the jitter of a shorter period after a period change
+    // must still be after the previous edge
+    if (edge <= prev_edge) {
+        edge = prev_edge + 1;
+    }
+    return edge;
+}
 
-    clk_toggle_cb_hdl =
-        gpi_register_timed_callback(&GpiClock::toggle_cb, this, to_next_edge);
-    if (!clk_toggle_cb_hdl) {
-        // LCOV_EXCL_START
-        if (!initialSet) {
-            // Failing when called from start() will be reported via
-            // exception, but log in case of later failure that would
-            // otherwise be silent.
-            LOG_ERROR("Clock will be stopped: failed to register toggle cb");
+uint64_t GpiClock::cycle_time(uint64_t cycle) const {
+    uint64_t state = rng_state;
+    uint64_t nominal = next_nominal;
+    uint64_t edge = next_edge;
+    if (clk_val) {
+        // the next edge is falling, the next rising edge ends this period
+        nominal += period - t_high;
+        edge = jittered(nominal, edge, state);
+    }
+    // `edge` is the rising edge of cycle `cycles + 1`, from which on the
+    // pending period applies
+    uint64_t periods = cycle - cycles - 1;
+    if (!jitter) {
+        return nominal + periods * next_period;
+    }
+    if (!periods) {
+        return edge;
+    }
+    // Each edge draws the next value of the splitmix64 state, so the state of
+    // the rising edge `2 * periods` edges later is computed directly rather
+    // than by replaying the edges in between. Valid timing keeps these edges
+    // in order, so none of them is moved by the check against the previous
+    // edge.
+    state += (2 * periods - 1) * rng_increment;
+    return jittered(nominal + periods * next_period, edge, state);
+}
+
+void GpiClock::drive() {
+    gpi_set_signal_value_int(clk_signal, clk_val && clk_enabled, GPI_DEPOSIT);
+}
+
+void GpiClock::toggle(uint64_t now) {
+    clk_val = !clk_val;
+    if (clk_val) {
+        // a new period starts
+        period = next_period;
+        t_high = next_t_high;
+        cycles++;
+    }
+    drive();
+
+    next_nominal += clk_val ? t_high : (period - t_high);
+    next_edge = jittered(next_nominal, now, rng_state);
+}
+
+GpiClockGroup::~GpiClockGroup() {
+    if (toggle_cb_hdl) {
+        gpi_deregister_callback(toggle_cb_hdl);
+    }
+    for (auto clk : clocks) {
+        clk->running = false;
+        clk->group = nullptr;
+    }
+}
+
+int GpiClockGroup::add(GpiClock *clk) {
+    if (clk->group == this) {
+        return 0;
+    }
+    if (clk->running) {
+        return EBUSY;
+    }
+    if (clk->group == clk->own_group && clk->own_group) {
+        // leave the group of its own it got when started alone
+        clk->own_group->remove(clk);
+    }
+    if (clk->group) {
+        return EBUSY;
+    }
+    clk->group = this;
+    clocks.push_back(clk);
+    return 0;
+}
+
+void GpiClockGroup::remove(GpiClock *clk) {
+    clocks.erase(std::remove(clocks.begin(), clocks.end(), clk), clocks.end());
+    clk->group = nullptr;
+}
+
+int GpiClockGroup::reschedule(uint64_t now) {
+    bool any_running = false;
+    uint64_t earliest = std::numeric_limits<uint64_t>::max();
+    for (auto clk : clocks) {
+        if (clk->running) {
+            any_running = true;
+            earliest = std::min(earliest, clk->next_edge);
         }
+    }
+
+    if (toggle_cb_hdl) {
+        if (any_running && cb_time <= earliest) {
+            // finds no edge to drive if earlier than the edges, but then
+            // registers the callback for the earliest edge
+            return 0;
+        }
+        gpi_deregister_callback(toggle_cb_hdl);
+        toggle_cb_hdl = nullptr;
+    }
+    if (!any_running) {
+        return 0;
+    }
+
+    toggle_cb_hdl = gpi_register_timed_callback(&GpiClockGroup::toggle_cb, this,
+                                                earliest - now);
+    if (!toggle_cb_hdl) {
+        // LCOV_EXCL_START
         return EAGAIN;
         // LCOV_EXCL_STOP
     }
-
+    cb_time = earliest;
     return 0;
 }
 
-int GpiClock::toggle_cb(void *gpi_clk) {
-    GpiClock *clk_obj = (GpiClock *)gpi_clk;
-    return clk_obj->toggle(false);
+int GpiClockGroup::toggle_cb(void *gpi_clk_group) {
+    GpiClockGroup *group = (GpiClockGroup *)gpi_clk_group;
+    // the callback has fired, so it is no longer registered
+    group->toggle_cb_hdl = nullptr;
+
+    uint64_t now = group->cb_time;
+    for (auto clk : group->clocks) {
+        if (clk->running && clk->next_edge <= now) {
+            clk->toggle(now);
+        }
+    }
+
+    if (group->reschedule(now)) {
+        // LCOV_EXCL_START
+        // Failing when called from start() will be reported via exception,
+        // but log in case of later failure that would otherwise be silent.
+        LOG_ERROR("Clocks will be stopped: failed to register toggle cb");
+        for (auto clk : group->clocks) {
+            clk->running = false;
+        }
+        // LCOV_EXCL_STOP
+    }
+    return 0;
 }
 
 // Create a new clock object
@@ -938,12 +1259,14 @@ static void clock_dealloc(PyObject *self) {
 static PyObject *clk_start(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args) {
     unsigned long long period, t_high;
     int start_high;
+    unsigned long long phase = 0, jitter = 0, seed = 0;
 
-    if (!PyArg_ParseTuple(args, "KKp:start", &period, &t_high, &start_high)) {
+    if (!PyArg_ParseTuple(args, "KKp|KKK:start", &period, &t_high, &start_high,
+                          &phase, &jitter, &seed)) {
         return NULL;
     }
 
-    int ret = self->hdl->start(period, t_high, start_high);
+    int ret = self->hdl->start(period, t_high, start_high, phase, jitter, seed);
 
     if (ret != 0) {
         if (ret == EINVAL) {
@@ -969,6 +1292,109 @@ static PyObject *clk_stop(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *) {
     Py_RETURN_NONE;
 }
 
+static PyObject *clk_set_period(gpi_hdl_Object<gpi_clk_hdl> *self,
+                                PyObject *args) {
+    unsigned long long period, t_high;
+
+    if (!PyArg_ParseTuple(args, "KK:set_period", &period, &t_high)) {
+        return NULL;
+    }
+
+    if (self->hdl->set_period(period, t_high) != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Failed to set clock period: invalid arguments!\n");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *clk_cycles(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *) {
+    return PyLong_FromUnsignedLongLong(self->hdl->get_cycles());
+}
+
+static PyObject *clk_next_edge(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *) {
+    if (!self->hdl->is_running()) {
+        PyErr_SetString(PyExc_RuntimeError, "Clock is not running");
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(self->hdl->get_next_edge());
+}
+
+static PyObject *clk_cycle_time(gpi_hdl_Object<gpi_clk_hdl> *self,
+                                PyObject *args) {
+    unsigned long long cycle;
+
+    if (!PyArg_ParseTuple(args, "K:cycle_time", &cycle)) {
+        return NULL;
+    }
+
+    if (!self->hdl->is_running()) {
+        PyErr_SetString(PyExc_RuntimeError, "Clock is not running");
+        return NULL;
+    }
+    if (cycle <= self->hdl->get_cycles()) {
+        PyErr_Format(PyExc_ValueError, "Cycle %llu has already started", cycle);
+        return NULL;
+    }
+
+    return PyLong_FromUnsignedLongLong(self->hdl->cycle_time(cycle));
+}
+
+static PyObject *clk_set_enabled(gpi_hdl_Object<gpi_clk_hdl> *self,
+                                 PyObject *args) {
+    int enabled;
+
+    if (!PyArg_ParseTuple(args, "p:set_enabled", &enabled)) {
+        return NULL;
+    }
+
+    self->hdl->set_enabled(enabled);
+
+    Py_RETURN_NONE;
+}
+
+// Create a new clock group object
+static PyObject *clock_group_create(PyObject *, PyObject *) {
+    if (!gpi_has_registered_impl()) {
+        // LCOV_EXCL_START
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+
+    return gpi_hdl_New(new GpiClockGroup());
+}
+
+static void clock_group_dealloc(PyObject *self) {
+    GpiClockGroup *gpi_clk_group =
+        ((gpi_hdl_Object<gpi_clk_group_hdl> *)self)->hdl;
+
+    delete gpi_clk_group;
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *clk_group_add(gpi_hdl_Object<gpi_clk_group_hdl> *self,
+                               PyObject *args) {
+    PyObject *pClk;
+
+    if (!PyArg_ParseTuple(args, "O!:add", &gpi_hdl_Object<gpi_clk_hdl>::py_type,
+                          &pClk)) {
+        return NULL;
+    }
+    GpiClock *gpi_clk = ((gpi_hdl_Object<gpi_clk_hdl> *)pClk)->hdl;
+
+    if (self->hdl->add(gpi_clk) != 0) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Failed to add clock: clock is running or belongs to "
+                        "another group!\n");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
 static int add_module_constants(PyObject *simulator) {
     // Make the GPI constants accessible from the C world
     if (PyModule_AddIntConstant(simulator, "UNKNOWN", GPI_UNKNOWN) < 0 ||
@@ -1038,6 +1464,15 @@ static int add_module_types(PyObject *simulator) {
         // LCOV_EXCL_STOP
     }
 
+    typ = (PyObject *)&gpi_hdl_Object<gpi_clk_group_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "GpiClockGroup", typ) < 0) {
+        // LCOV_EXCL_START
+        Py_DECREF(typ);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
     return 0;
 }
 
@@ -1106,6 +1541,13 @@ static PyMethodDef SimulatorMethods[] = {
                "--\n\n"
                "log_level(level: int) -> None\n"
                "Set the log level for GPI.")},
+    {"clear_log_level_cache", clear_log_level_cache, METH_NOARGS,
+     PyDoc_STR("clear_log_level_cache()\n"
+               "--\n\n"
+               "clear_log_level_cache() -> None\n"
+               "Make GPI forget the log levels of Python loggers it cached.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
     {"is_running", is_running, METH_NOARGS,
      PyDoc_STR("is_running()\n"
                "--\n\n"
@@ -1121,6 +1563,15 @@ static PyMethodDef SimulatorMethods[] = {
                "\n"
                "Time is represented as a tuple of 32 bit integers ([low32, "
                "high32]) comprising a single 64 bit integer.")},
+    {"get_signal_val_binstrs", get_signal_val_binstrs, METH_VARARGS,
+     PyDoc_STR("get_signal_val_binstrs(handles, /)\n"
+               "--\n\n"
+               "get_signal_val_binstrs(handles: Sequence[gpi_sim_hdl]) -> "
+               "List[str]\n"
+               "Get the values of logic vector signals as strings, like "
+               ":meth:`gpi_sim_hdl.get_signal_val_binstr`, in one call.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
     {"get_precision", get_precision, METH_NOARGS,
      PyDoc_STR("get_precision()\n"
                "--\n\n"
@@ -1147,6 +1598,13 @@ static PyMethodDef SimulatorMethods[] = {
                "Create a clock driver on a signal.\n"
                "\n"
                ".. versionadded:: 2.0")},
+    {"clock_group_create", clock_group_create, METH_NOARGS,
+     PyDoc_STR("clock_group_create()\n"
+               "--\n\n"
+               "clock_group_create() -> cocotb.simulator.GpiClockGroup\n"
+               "Create a group of clock drivers sharing one timed callback.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 
@@ -1183,6 +1641,11 @@ PyMODINIT_FUNC PyInit_simulator(void) {
         return NULL;
         // LCOV_EXCL_STOP
     }
+    if (PyType_Ready(&gpi_hdl_Object<gpi_clk_group_hdl>::py_type) < 0) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
 
     PyObject *simulator = PyModule_Create(&moduledef);
     if (simulator == NULL) {
@@ -1367,9 +1830,11 @@ PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type = []() -> PyTypeObject {
 static PyMethodDef gpi_clk_methods[] = {
     {"start", (PyCFunction)clk_start, METH_VARARGS,
      PyDoc_STR(
-         "start($self, period_steps, high_steps, start_high)\n"
+         "start($self, period_steps, high_steps, start_high, phase_steps=0, "
+         "jitter_steps=0, seed=0)\n"
          "--\n\n"
-         "start(period_steps: int, high_steps: int, start_high: bool) -> None\n"
+         "start(period_steps: int, high_steps: int, start_high: bool, "
+         "phase_steps: int = 0, jitter_steps: int = 0, seed: int = 0) -> None\n"
          "Start this clock now.\n"
          "\n"
          "The clock will have a period of *period_steps* time steps, "
@@ -1378,13 +1843,24 @@ static PyMethodDef gpi_clk_methods[] = {
          "state, "
          "otherwise start at the beginning of the low state.\n"
          "\n"
+         "If *phase_steps* is not 0, the clock holds the opposite state for "
+         "*phase_steps* time steps before starting. "
+         "If *jitter_steps* is not 0, every later edge is moved by a random "
+         "number of time steps between -*jitter_steps* and *jitter_steps*, "
+         "drawn from a generator seeded with *seed*.\n"
+         "\n"
+         ".. versionchanged:: 2.0\n"
+         "    Added the *phase_steps*, *jitter_steps* and *seed* arguments.\n"
+         "\n"
          "Raises:\n"
          "    TypeError: If there are an incorrect number of arguments or "
          "they are of the wrong type.\n"
          "    ValueError: If *period_steps* and *high_steps* are such that in "
          "one "
          "period the duration of the low or high state would be less "
-         "than one time step, or *high_steps* is greater than *period_steps*.\n"
+         "than one time step, or *high_steps* is greater than *period_steps*, "
+         "or twice *jitter_steps* is not less than the duration of the low "
+         "and high states.\n"
          "    RuntimeError: If the clock was already started, or the "
          "GPI callback could not be registered.")},
     {"stop", (PyCFunction)clk_stop, METH_NOARGS,
@@ -1392,6 +1868,60 @@ static PyMethodDef gpi_clk_methods[] = {
                "--\n\n"
                "stop() -> None\n"
                "Stop this clock now.")},
+    {"set_period", (PyCFunction)clk_set_period, METH_VARARGS,
+     PyDoc_STR(
+         "set_period($self, period_steps, high_steps)\n"
+         "--\n\n"
+         "set_period(period_steps: int, high_steps: int) -> None\n"
+         "Change the period of this clock from its next rising edge on.\n"
+         "\n"
+         "Raises:\n"
+         "    ValueError: If the arguments are invalid, as for :meth:`start`.\n"
+         "\n"
+         ".. versionadded:: 2.0")},
+    {"set_enabled", (PyCFunction)clk_set_enabled, METH_VARARGS,
+     PyDoc_STR("set_enabled($self, enabled)\n"
+               "--\n\n"
+               "set_enabled(enabled: bool) -> None\n"
+               "Gate this clock.\n"
+               "\n"
+               "A disabled clock stays low from its next falling edge on, "
+               "and rises again at its first rising edge after being "
+               "enabled.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"cycles", (PyCFunction)clk_cycles, METH_NOARGS,
+     PyDoc_STR("cycles($self)\n"
+               "--\n\n"
+               "cycles() -> int\n"
+               "Get the number of rising edges since this clock was started, "
+               "including the edges suppressed by gating.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"next_edge", (PyCFunction)clk_next_edge, METH_NOARGS,
+     PyDoc_STR("next_edge($self)\n"
+               "--\n\n"
+               "next_edge() -> int\n"
+               "Get the absolute time, in time steps, of the next edge of "
+               "this clock.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the clock is not running.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"cycle_time", (PyCFunction)clk_cycle_time, METH_VARARGS,
+     PyDoc_STR("cycle_time($self, cycle)\n"
+               "--\n\n"
+               "cycle_time(cycle: int) -> int\n"
+               "Get the absolute time, in time steps, of the rising edge "
+               "which makes :meth:`cycles` return *cycle*, "
+               "if the period of this clock is not changed until then.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the clock is not running.\n"
+               "    ValueError: If *cycle* has already started.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 
@@ -1404,3 +1934,27 @@ PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type = []() -> PyTypeObject {
     type.tp_dealloc = clock_dealloc;
     return type;
 }();
+
+static PyMethodDef gpi_clk_group_methods[] = {
+    {"add", (PyCFunction)clk_group_add, METH_VARARGS,
+     PyDoc_STR("add($self, clock)\n"
+               "--\n\n"
+               "add(clock: cocotb.simulator.GpiClock) -> None\n"
+               "Drive the edges of a stopped clock with the callback of this "
+               "group.\n"
+               "\n"
+               "Raises:\n"
+               "    RuntimeError: If the clock is running or belongs to "
+               "another group.")},
+    {NULL, NULL, 0, NULL} /* Sentinel */
+};
+
+template <>
+PyTypeObject gpi_hdl_Object<gpi_clk_group_hdl>::py_type = []() -> PyTypeObject {
+    auto type = fill_common_slots<gpi_clk_group_hdl>();
+    type.tp_name = "cocotb.simulator.GpiClockGroup";
+    type.tp_doc = "C++ group of clocks driven from a single GPI callback.";
+    type.tp_methods = gpi_clk_group_methods;
+    type.tp_dealloc = clock_group_dealloc;
+    return type;
+}();
@@ -4,7 +4,7 @@
 
 # generated with mypy's stubgen script
 
-from typing import Any
+from typing import Any, Sequence
 
 DRIVERS: int
 ENUM: int
@@ -71,10 +71,12 @@ class gpi_sim_hdl:
 def get_precision() -> int: ...
 def get_root_handle(name: str | None) -> gpi_sim_hdl | None: ...
 def get_sim_time() -> tuple[int, int]: ...
+def get_signal_val_binstrs(handles: Sequence[gpi_sim_hdl], /) -> list[str]: ...
 def get_simulator_product() -> str: ...
 def get_simulator_version() -> str: ...
 def is_running() -> bool: ...
 def log_level(level: int) -> None: ...
+def clear_log_level_cache() -> None: ...
 def package_iterate() -> gpi_iterator_hdl: ...
 def register_nextstep_callback(func, *args: Any) -> gpi_cb_hdl: ...
 def register_readonly_callback(func, *args: Any) -> gpi_cb_hdl: ...
@@ -85,9 +87,25 @@ def register_value_change_callback(
 ) -> gpi_cb_hdl: ...
 def stop_simulator() -> None: ...
 
-class cpp_clock:
-    def __init__(self, signal: gpi_sim_hdl) -> None: ...
-    def start(self, period_steps: int, high_steps: int, start_high: bool) -> None: ...
+class GpiClock:
+    def start(
+        self,
+        period_steps: int,
+        high_steps: int,
+        start_high: bool,
+        phase_steps: int = 0,
+        jitter_steps: int = 0,
+        seed: int = 0,
+    ) -> None: ...
     def stop(self) -> None: ...
+    def set_period(self, period_steps: int, high_steps: int) -> None: ...
+    def set_enabled(self, enabled: bool) -> None: ...
+    def cycles(self) -> int: ...
+    def next_edge(self) -> int: ...
+    def cycle_time(self, cycle: int) -> int: ...
 
-def clock_create(hdl: gpi_sim_hdl) -> cpp_clock: ...
+class GpiClockGroup:
+    def add(self, clock: GpiClock) -> None: ...
+
+def clock_create(hdl: gpi_sim_hdl) -> GpiClock: ...
+def clock_group_create() -> GpiClockGroup: ...
@@ -8,13 +8,24 @@ import os
 import warnings
 from asyncio import CancelledError, InvalidStateError
 from enum import auto
-from typing import Any, Callable, Coroutine, Generator, Generic, List, Optional, TypeVar
+from types import CoroutineType
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Generator,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import cocotb
 import cocotb.triggers
 from cocotb._deprecation import deprecated
 from cocotb._outcomes import Error, Outcome, Value
-from cocotb._py_compat import cached_property
 from cocotb._utils import DocEnum, extract_coro_stack, remove_traceback_frames
 
 #: Task result type
@@ -24,6 +35,11 @@ ResultType = TypeVar("ResultType")
 # make any calls by testing a boolean flag first
 _debug = "COCOTB_SCHEDULER_DEBUG" in os.environ
 
+# The number of tasks created, used by the scheduler for debug.
+# Not a class attribute of Task, as assigning to a class attribute invalidates
+# the attribute lookup caches of the class.
+_id_count = 0
+
 
 class Task(Generic[ResultType]):
     """Concurrently executing task.
@@ -51,10 +67,47 @@ class Task(Generic[ResultType]):
         FINISHED = (auto(), "Task has finished with a value or Exception")
         CANCELLED = (auto(), "Task was cancelled before it finished")
 
+    # Many short-lived tasks are created by triggers like First and with_timeout,
+    # so Tasks are kept cheap to create: the name and logger are only made when asked for.
+    # "__dict__" keeps arbitrary attributes working, the dict is only created once one is set.
+    __slots__ = (
+        "__dict__",
+        "_coro",
+        "_state",
+        "_outcome",
+        "_trigger",
+        "_cancelled_error",
+        "_done_callbacks",
+        "_priority",
+        "_task_id",
+        "_log",
+    )
+
     _name: str = "Task"  # class name of schedulable task
-    _id_count = 0  # used by the scheduler for debug
 
     def __init__(self, inst):
+        # the isinstance check against the ABC is slow, and nearly all coroutines are native
+        if type(inst) is not CoroutineType:
+            self._check_coro(inst)
+
+        self._coro: Coroutine = inst
+        self._state: Task._State = Task._State.UNSTARTED
+        self._outcome: Optional[Outcome[ResultType]] = None
+        self._trigger: Union[
+            cocotb.triggers.Trigger, cocotb.triggers._TriggerSet, None
+        ] = None
+        self._cancelled_error: Optional[CancelledError] = None
+        # most tasks never get a callback, they share the empty tuple until they do
+        self._done_callbacks: Union[Tuple[()], List[Callable[[Task[Any]], Any]]] = ()
+        self._priority = 0
+        self._log: Optional[logging.Logger] = None
+
+        global _id_count
+        self._task_id = _id_count
+        _id_count += 1
+
+    @staticmethod
+    def _check_coro(inst: Any) -> None:
         if inspect.iscoroutinefunction(inst):
             raise TypeError(
                 f"Coroutine function {inst} should be called prior to being "
@@ -68,25 +121,54 @@ class Task(Generic[ResultType]):
         elif not isinstance(inst, collections.abc.Coroutine):
             raise TypeError(f"{inst} isn't a valid coroutine!")
 
-        self._coro: Coroutine = inst
-        self._state: Task._State = Task._State.UNSTARTED
-        self._outcome: Optional[Outcome[ResultType]] = None
-        self._trigger: Optional[cocotb.triggers.Trigger] = None
-        self._cancelled_error: Optional[CancelledError] = None
-        self._done_callbacks: List[Callable[[Task[Any]], Any]] = []
+    @property
+    def __name__(self) -> str:
+        return f"{self._name} {self._task_id}"
+
+    def __getattr__(self, name: str) -> Any:
+        # a __qualname__ property can't be defined in the class body, which sets the
+        # class's own __qualname__, so it is looked up here once the usual lookup fails
+        if name == "__qualname__":
+            return self.__name__
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def priority(self) -> int:
+        """The priority of the Task, ``0`` by default.
+
+        Of the tasks ready to resume at the same time, for example because they await the same trigger,
+        tasks of higher priority are resumed first.
+        Tasks of the same priority are resumed in the order they became ready.
+
+        This can be used to have monitors sample signals before drivers change them,
+        without awaiting :class:`~cocotb.triggers.ReadOnly` or :class:`~cocotb.triggers.ReadWrite`,
+        each of which costs a callback from the simulator.
 
-        self._task_id = self._id_count
-        type(self)._id_count += 1
-        self.__name__ = f"{type(self)._name} {self._task_id}"
-        self.__qualname__ = self.__name__
+        The priority of a Task can not be changed while it is scheduled to resume.
 
-    @cached_property
+        .. versionadded:: 2.0
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int) -> None:
+        if self._state is Task._State.SCHEDULED:
+            raise RuntimeError(
+                f"Can't change the priority of {self} while it is scheduled"
+            )
+        self._priority = priority
+
+    @property
     def log(self) -> logging.Logger:
         # Creating a logger is expensive, only do it if we actually plan to
         # log anything
-        return logging.getLogger(
-            f"cocotb.{self.__qualname__}.{self._coro.__qualname__}"
-        )
+        if self._log is None:
+            self._log = logging.getLogger(
+                f"cocotb.{self.__name__}.{self._coro.__qualname__}"
+            )
+        return self._log
 
     def __str__(self) -> str:
         return f"<{self.__name__}>"
@@ -282,7 +364,10 @@ class Task(Generic[ResultType]):
         """
         if self.done():
             callback(self)
-        self._done_callbacks.append(callback)
+        if self._done_callbacks:
+            self._done_callbacks.append(callback)
+        else:
+            self._done_callbacks = [callback]
 
     def __await__(self) -> Generator[Any, Any, ResultType]:
         # It's tempting to use `return (yield from self._coro)` here,
@@ -307,9 +392,14 @@ class _RunningTest(Task[None]):
         Moved to the ``cocotb.task`` module.
     """
 
+    __slots__ = ("_test_name",)
+
     _name: str = "Test"
 
     def __init__(self, inst: Coroutine[Any, Any, None], name: str) -> None:
         super().__init__(inst)
-        self.__name__ = f"{type(self)._name} {name}"
-        self.__qualname__ = self.__name__
+        self._test_name = name
+
+    @property
+    def __name__(self) -> str:
+        return f"{self._name} {self._test_name}"
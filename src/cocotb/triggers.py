@@ -40,8 +40,10 @@ from typing import (
     Coroutine,
     Generator,
     Generic,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -51,7 +53,7 @@ from typing import (
 
 import cocotb.handle
 import cocotb.task
-from cocotb import simulator
+from cocotb import _timer_heap, simulator
 from cocotb._deprecation import deprecated
 from cocotb._outcomes import Error, Outcome, Value
 from cocotb._py_compat import cached_property
@@ -137,7 +139,7 @@ class GPITrigger(Trigger):
         # if simulator is not None:
         #    self.cbhdl = simulator.create_callback(self)
         # else:
-        self._cbhdl: Optional[simulator.gpi_cb_hdl] = None
+        self._cbhdl: Union[simulator.gpi_cb_hdl, _timer_heap.TimerHandle, None] = None
 
     def _unprime(self) -> None:
         """Disable a primed trigger, can be re-primed."""
@@ -218,6 +220,11 @@ class Timer(GPITrigger):
 
     .. versionchanged:: 2.0
         Passing ``0`` as the *time* argument now raises a :exc:`ValueError`.
+
+    .. versionchanged:: 2.0
+        Timers do not each register a callback with the simulator,
+        a single callback is registered for the earliest of them.
+        Timers expiring in the same time step fire in the order they were awaited in.
     """
 
     round_mode: str = "error"
@@ -244,11 +251,7 @@ class Timer(GPITrigger):
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
         """Register for a timed callback."""
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_timed_callback(
-                self._sim_steps, callback, self
-            )
-            if self._cbhdl is None:
-                raise RuntimeError(f"Unable set up {str(self)} Trigger")
+            self._cbhdl = _timer_heap.call_later(self._sim_steps, callback, self)
         super()._prime(callback)
 
     def __repr__(self) -> str:
@@ -259,6 +262,57 @@ class Timer(GPITrigger):
         )
 
 
+class AtTime(GPITrigger):
+    r"""Fire at the specified absolute simulation time.
+
+    Like :class:`Timer`, but waits until a time instead of for a duration,
+    so tasks do not have to compute ``Timer(target - get_sim_time())``.
+
+    Args:
+        time: The simulation time to fire at, as returned by :func:`~cocotb.utils.get_sim_time`.
+        units: The unit of the time value, like for :class:`Timer`.
+        round_mode: How to handle time values that sit between time steps, like for :class:`Timer`.
+
+    Raises:
+        ValueError: When awaited, if *time* is not after the current simulation time.
+
+    Usage:
+
+        >>> deadline = get_sim_time(units="ns") + 100
+        >>> await AtTime(deadline, units="ns")
+
+    .. versionadded:: 2.0
+    """
+
+    round_mode: str = "error"
+    """The default rounding mode."""
+
+    def __init__(
+        self,
+        time: Union[float, Fraction, Decimal],
+        units: str = "step",
+        *,
+        round_mode: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        if round_mode is None:
+            round_mode = type(self).round_mode
+        self._sim_steps = get_sim_steps(time, units, round_mode=round_mode)
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        """Register for a timed callback."""
+        if self._cbhdl is None:
+            self._cbhdl = _timer_heap.call_at(self._sim_steps, callback, self)
+        super()._prime(callback)
+
+    def __repr__(self) -> str:
+        return "<{} {:1.2f}ps at {}>".format(
+            type(self).__qualname__,
+            get_time_from_sim_steps(self._sim_steps, units="ps"),
+            _pointer_str(self),
+        )
+
+
 # TODO: In Python < 3.8 the metaclass of typing objects doesn't work well with other metaclasses.
 # TODO: This can be removed once Python 3.8 becomes standard.
 class _ParameterizedSingletonGPITriggerMetaclass(
@@ -507,7 +561,10 @@ class Event:
         self._pending_events.append(trigger)
 
     def _unprime_trigger(self, trigger: _Event) -> None:
-        self._pending_events.remove(trigger)
+        # may already have been removed by set(), if another trigger that fired
+        # during set() unprimed it
+        if trigger in self._pending_events:
+            self._pending_events.remove(trigger)
 
     def set(self) -> None:
         """Set the Event and unblock all Tasks blocked on this Event."""
@@ -812,6 +869,55 @@ class Waitable(Awaitable[T]):
         return self._wait().__await__()
 
 
+class _TriggerSet:
+    r"""Wait on several :class:`Trigger`\ s at once, directly in the scheduler.
+
+    The awaiting task is registered with every trigger in the set,
+    and resumed with the trigger that fired once the first trigger fires,
+    or, if *wait_all* is ``True``, once all of them have fired.
+    Triggers that are still pending are unprimed when the task is resumed.
+
+    Only triggers whose ``await`` returns the trigger itself can be waited on this way.
+    """
+
+    __slots__ = ("pending", "wait_all")
+
+    def __init__(self, triggers: Iterable[Trigger], wait_all: bool) -> None:
+        # the triggers the task is still registered with, without duplicates
+        self.pending: List[Trigger] = list(dict.fromkeys(triggers))
+        self.wait_all = wait_all
+
+    def __await__(self) -> Generator[Any, Any, Trigger]:
+        return (yield self)
+
+    def __repr__(self) -> str:
+        return "{}({}, wait_all={!r})".format(
+            type(self).__qualname__,
+            ", ".join(repr(t) for t in self.pending),
+            self.wait_all,
+        )
+
+
+class _Park:
+    """Suspend the awaiting task until it is resumed directly by the scheduler.
+
+    Nothing is primed: the task is only resumed by :meth:`!Scheduler._unpark`,
+    which lets primitives like :class:`~cocotb.queue.Queue` wake a blocked task
+    without a :class:`Trigger` per blocked call.
+    """
+
+    __slots__ = ()
+
+    def __await__(self) -> Generator[Any, Any, None]:
+        return (yield self)
+
+    def __repr__(self) -> str:
+        return "_park"
+
+
+_park = _Park()
+
+
 class _AggregateWaitable(Waitable[T]):
     """Base class for :class:`Combine` and :class:`First`."""
 
@@ -829,6 +935,13 @@ class _AggregateWaitable(Waitable[T]):
                     f"All triggers must be instances of Trigger! Got: {type(t).__qualname__}"
                 )
 
+        # Triggers which return themselves when awaited can be waited on by the
+        # scheduler directly, everything else needs a helper task.
+        self._native = bool(self._triggers) and all(
+            isinstance(t, Trigger) and type(t).__await__ is Trigger.__await__
+            for t in self._triggers
+        )
+
     def __repr__(self) -> str:
         # no _pointer_str here, since this is not a trigger, so identity
         # doesn't matter.
@@ -865,6 +978,15 @@ class Combine(_AggregateWaitable["Combine"]):
         TypeError: When an unsupported *trigger* object is passed.
     """
 
+    def __await__(self) -> Generator[Any, Any, "Combine"]:
+        if self._native:
+            return self._wait_native().__await__()
+        return self._wait().__await__()
+
+    async def _wait_native(self) -> "Combine":
+        await _TriggerSet(cast(Tuple[Trigger, ...], self._triggers), wait_all=True)
+        return self
+
     async def _wait(self) -> "Combine":
         waiters: List[cocotb.task.Task[Any]] = []
         e = _InternalEvent(self)
@@ -917,6 +1039,13 @@ class First(_AggregateWaitable[Any]):
         coroutines.
     """
 
+    def __await__(self) -> Generator[Any, Any, Any]:
+        if self._native:
+            return _TriggerSet(
+                cast(Tuple[Trigger, ...], self._triggers), wait_all=False
+            ).__await__()
+        return self._wait().__await__()
+
     async def _wait(self) -> Any:
         waiters: List[cocotb.task.Task[Any]] = []
         e = _InternalEvent(self)
@@ -1063,6 +1192,10 @@ async def with_timeout(
     If timeout occurs, the trigger is cancelled
     and :exc:`SimTimeoutError` is raised.
 
+    The timeout does not register a callback with the simulator of its own,
+    and cancelling it when the awaited object completes in time does not call the simulator,
+    so guarding every transaction of a bus with a timeout is cheap.
+
     Usage:
 
     .. code-block:: python
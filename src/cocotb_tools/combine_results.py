@@ -4,11 +4,25 @@ Simple script to combine JUnit test results into a single XML file.
 """
 
 import argparse
+import multiprocessing
 import os
 import re
 import sys
-from typing import Iterable, Pattern
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+from cocotb._xunit_reporter import _serialize_attrib
 
 
 def _find_all(name: Pattern, path: str) -> Iterable[str]:
@@ -18,6 +32,99 @@ def _find_all(name: Pattern, path: str) -> Iterable[str]:
                 yield os.path.join(root, file)
 
 
+class _Failure(NamedTuple):
+    classname: Optional[str]
+    name: Optional[str]
+    file: Optional[str]
+    lineno: Optional[str]
+
+
+class _Testsuite(NamedTuple):
+    """A testsuite read from a results file, already serialized for the combined output."""
+
+    name: Optional[str]
+    package: Optional[str]
+    start_tag: str
+    text: str
+    children: str
+    tail: str
+    testcase_count: int
+    failures: List[_Failure]
+
+
+def _serialize(elem: ET.Element, write: Callable[[str], object]) -> None:
+    """Serialize *elem* like :func:`xml.etree.ElementTree.tostring`, which is much slower."""
+    tag = elem.tag
+    if not isinstance(tag, str) or tag.startswith("{"):
+        # leave namespaces and other special cases to ElementTree
+        write(ET.tostring(elem, encoding="unicode"))
+        return
+    if elem.text or len(elem):
+        write(f"<{tag}{_serialize_attrib(elem.attrib)}>")
+        if elem.text:
+            write(escape(elem.text))
+        for child in elem:
+            _serialize(child, write)
+        write(f"</{tag}>")
+    else:
+        write(f"<{tag}{_serialize_attrib(elem.attrib)} />")
+    if elem.tail:
+        write(escape(elem.tail))
+
+
+def _read_testsuites(fname: str) -> List[_Testsuite]:
+    """Read and serialize the testsuites of a results file.
+
+    The file is parsed incrementally and each testsuite is serialized and discarded as soon as it has been read,
+    so that the combined results only need to hold on to text.
+    """
+    testsuites: List[_Testsuite] = []
+    parents: List[ET.Element] = []
+    for event, elem in ET.iterparse(fname, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag != "testsuite":
+            continue
+        if parents:
+            parents[-1].remove(elem)
+
+        testcase_count = 0
+        failures: List[_Failure] = []
+        for testcase in elem.iter("testcase"):
+            testcase_count += 1
+            for _ in testcase.iter("failure"):
+                failures.append(
+                    _Failure(
+                        testcase.get("classname"),
+                        testcase.get("name"),
+                        testcase.get("file"),
+                        testcase.get("lineno"),
+                    )
+                )
+
+        # Only the children are copied when testsuites are merged, so serialize them separately
+        # from the text and tail of the testsuite itself.
+        children: List[str] = []
+        for child in elem:
+            _serialize(child, children.append)
+
+        testsuites.append(
+            _Testsuite(
+                name=elem.get("name"),
+                package=elem.get("package"),
+                start_tag=f"<testsuite{_serialize_attrib(elem.attrib)}>",
+                text=escape(elem.text or ""),
+                children="".join(children),
+                tail=escape(elem.tail or ""),
+                testcase_count=testcase_count,
+                failures=failures,
+            )
+        )
+    return testsuites
+
+
 def _get_parser() -> argparse.ArgumentParser:
     """Return the cmdline parser"""
     parser = argparse.ArgumentParser(
@@ -51,68 +158,80 @@ def _get_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enables verbose output.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to read input files.",
+    )
     return parser
 
 
-def main() -> int:
+def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = _get_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     rc = 0
 
-    result = ET.Element("testsuites", name=args.output_testsuites_name)
+    # the testsuites of the combined results, with all testsuites of the same name and package merged
+    result: Dict[Tuple[Optional[str], Optional[str]], List[_Testsuite]] = {}
 
     input_pattern = re.compile(args.input_filename)
 
-    for directory in args.directories:
-        if args.verbose:
-            print(f"Searching in {directory} for results.xml files.")
-        for fname in _find_all(input_pattern, directory):
+    def find_files() -> Iterable[str]:
+        for directory in args.directories:
             if args.verbose:
-                print(f"Reading file {fname}.")
-            tree = ET.parse(fname)
-            for ts in tree.iter("testsuite"):
+                print(f"Searching in {directory} for results.xml files.")
+            for fname in _find_all(input_pattern, directory):
                 if args.verbose:
-                    print(
-                        "Testsuite name: {!r}, package: {!r}".format(
-                            ts.get("name"), ts.get("package")
+                    print(f"Reading file {fname}.")
+                yield fname
+
+    pool = None
+    files_testsuites: Iterable[List[_Testsuite]]
+    if args.jobs > 1:
+        pool = multiprocessing.Pool(args.jobs)
+        files_testsuites = pool.imap(_read_testsuites, find_files(), chunksize=16)
+    else:
+        files_testsuites = map(_read_testsuites, find_files())
+
+    try:
+        for file_testsuites in files_testsuites:
+            for ts in file_testsuites:
+                if args.verbose:
+                    print(f"Testsuite name: {ts.name!r}, package: {ts.package!r}")
+                existing = result.get((ts.name, ts.package))
+                if existing is not None:
+                    if args.verbose:
+                        print(
+                            "Testsuite already exists in combined results. Extending it."
                         )
-                    )
-                for existing in result:
-                    if (existing.get("name") == ts.get("name")) and (
-                        existing.get("package") == ts.get("package")
-                    ):
-                        if args.verbose:
-                            print(
-                                "Testsuite already exists in combined results. Extending it."
-                            )
-                        existing.extend(list(ts))
-                        break
+                    existing.append(ts)
                 else:
                     if args.verbose:
                         print(
                             "Testsuite does not already exist in combined results. Adding it."
                         )
-                    result.append(ts)
+                    result[ts.name, ts.package] = [ts]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
     testsuite_count = 0
     testcase_count = 0
-    for testsuite in result.iter("testsuite"):
+    for (name, package), testsuites in result.items():
         testsuite_count += 1
-        for testcase in testsuite.iter("testcase"):
-            testcase_count += 1
-            for failure in testcase.iter("failure"):
+        for ts in testsuites:
+            testcase_count += ts.testcase_count
+            for failure in ts.failures:
                 rc = 1
                 print(
-                    "Failure in testsuite: '{}' classname: '{}' testcase: '{}' with parameters '{}'".format(
-                        testsuite.get("name"),
-                        testcase.get("classname"),
-                        testcase.get("name"),
-                        testsuite.get("package"),
-                    )
+                    f"Failure in testsuite: '{name}' classname: '{failure.classname}' testcase: '{failure.name}' with parameters '{package}'"
                 )
                 if os.getenv("GITHUB_ACTIONS") is not None:
                     # Get test file relative to root of repo
-                    file = testcase.get("file")
+                    file = failure.file
                     assert (
                         file is not None
                     )  # if this file was output by cocotb, it has this attribute
@@ -124,22 +243,46 @@ def main() -> int:
                     )
                     relative_file = file.replace(repo_root, "")
                     print(
-                        "::error file={},line={}::Test {}:{} failed".format(
-                            relative_file,
-                            testcase.get("lineno"),
-                            testcase.get("classname"),
-                            testcase.get("name"),
-                        )
+                        f"::error file={relative_file},line={failure.lineno}::Test {failure.classname}:{failure.name} failed"
                     )
 
     print(f"Ran a total of {testsuite_count} TestSuites and {testcase_count} TestCases")
 
     if args.verbose:
         print(f"Writing combined results to {args.output_file}")
-    ET.ElementTree(result).write(args.output_file, encoding="UTF-8")
+    _write_combined_results(args.output_file, args.output_testsuites_name, result)
     return rc
 
 
+def _write_combined_results(
+    filename: str,
+    testsuites_name: str,
+    result: Dict[Tuple[Optional[str], Optional[str]], List[_Testsuite]],
+) -> None:
+    """Write the combined results in the same format as :meth:`xml.etree.ElementTree.ElementTree.write`."""
+    root = ET.tostring(
+        ET.Element("testsuites", name=testsuites_name), encoding="unicode"
+    )
+    with open(filename, "w", encoding="UTF-8", errors="xmlcharrefreplace") as f:
+        if not result:
+            f.write(root)
+            return
+        f.write(root[: -len(" />")] + ">")
+        for testsuites in result.values():
+            # the merged testsuite keeps the attributes, text and tail of its first occurrence
+            first = testsuites[0]
+            children = "".join(ts.children for ts in testsuites)
+            if first.text or children:
+                f.write(first.start_tag)
+                f.write(first.text)
+                f.write(children)
+                f.write("</testsuite>")
+            else:
+                f.write(first.start_tag[: -len(">")] + " />")
+            f.write(first.tail)
+        f.write("</testsuites>")
+
+
 if __name__ == "__main__":
     rc = main()
     sys.exit(rc)
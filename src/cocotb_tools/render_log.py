@@ -0,0 +1,169 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Render structured logs written with COCOTB_LOG_STRUCTURED as cocotb prints them.
+
+Logs of several runs, like the shards of a regression, are merged by simulation time.
+"""
+
+import argparse
+import gzip
+import heapq
+import json
+import logging
+import sys
+from typing import IO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from cocotb.logging import SimLogFormatter
+
+
+class _Formatter(SimLogFormatter):
+    # the simulation time of the rendered records is in femtoseconds
+    def _time_ns(self, sim_time: int) -> float:
+        return sim_time / 1e6
+
+
+def _open(filename: str) -> IO[str]:
+    if filename == "-":
+        return sys.stdin
+    if filename.endswith(".gz"):
+        return gzip.open(filename, "rt", encoding="utf-8")
+    return open(filename, encoding="utf-8")
+
+
+def _read(filename: str) -> Iterator[logging.LogRecord]:
+    """Yield the records of a structured log, with their simulation time in femtoseconds."""
+    fs_per_step = 1
+    loggers: Dict[int, str] = {}
+    sites: Dict[int, Tuple[str, int, str]] = {}
+    with _open(filename) as f:
+        lines = enumerate(f, 1)
+        while True:
+            # the end of a log cut short by a crash is missing
+            try:
+                lineno, line = next(lines)
+            except (StopIteration, EOFError):
+                return
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                if line.endswith("\n"):
+                    raise ValueError(f"{filename}:{lineno}: not a structured log line")
+                return
+            if isinstance(entry, list):
+                sim_time, logger, site, level, msg, args, *exc_text = entry
+                pathname, line_number, func = sites[site]
+                record = logging.LogRecord(
+                    loggers[logger],
+                    level,
+                    pathname,
+                    line_number,
+                    msg,
+                    tuple(args),
+                    None,
+                    func,
+                )
+                record.created_sim_time = sim_time * fs_per_step
+                if exc_text:
+                    record.exc_text = exc_text[0]
+                yield record
+            elif "logger" in entry:
+                loggers[entry["logger"]] = entry["name"]
+            elif "site" in entry:
+                sites[entry["site"]] = (entry["file"], entry["line"], entry["func"])
+            elif entry.get("format") == "cocotb-log":
+                fs_per_step = 10 ** (entry["precision"] + 15)
+            else:
+                raise ValueError(f"{filename}:{lineno}: not a structured log line")
+
+
+def _wanted(
+    record: logging.LogRecord,
+    start_fs: Optional[float],
+    end_fs: Optional[float],
+    loggers: Optional[List[str]],
+    level: int,
+) -> bool:
+    if record.levelno < level:
+        return False
+    if start_fs is not None and record.created_sim_time < start_fs:
+        return False
+    if end_fs is not None and record.created_sim_time > end_fs:
+        return False
+    if loggers is not None:
+        name = record.name
+        return any(
+            name == logger or name.startswith(logger + ".") for logger in loggers
+        )
+    return True
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the cmdline parser"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Structured log files, compressed if ending with '.gz'. '-' reads stdin.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-file",
+        help="File to write the rendered log to, instead of stdout.",
+    )
+    parser.add_argument(
+        "--start",
+        type=float,
+        help="Only render records logged at or after this simulation time, in ns.",
+    )
+    parser.add_argument(
+        "--end",
+        type=float,
+        help="Only render records logged at or before this simulation time, in ns.",
+    )
+    parser.add_argument(
+        "--logger",
+        action="append",
+        help="Only render records of this logger and its children. Can be given several times.",
+    )
+    parser.add_argument(
+        "--level",
+        default="NOTSET",
+        help="Only render records of this level or above.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+
+    level = logging.getLevelName(args.level.upper())
+    if not isinstance(level, int):
+        parser.error(f"unknown level {args.level!r}")
+    start_fs = None if args.start is None else args.start * 1e6
+    end_fs = None if args.end is None else args.end * 1e6
+
+    records = heapq.merge(
+        *(_read(filename) for filename in args.files),
+        key=lambda record: record.created_sim_time,
+    )
+    formatter = _Formatter()
+    out = sys.stdout if args.output_file is None else open(args.output_file, "w")
+    try:
+        for record in records:
+            if _wanted(record, start_fs, end_fs, args.logger, level):
+                out.write(formatter.format(record))
+                out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    rc = main()
+    sys.exit(rc)
@@ -9,12 +9,15 @@
 # TODO: support timescale on all simulators
 # TODO: support custom dependencies
 
+import atexit
+import json
 import logging
 import multiprocessing
 import os
 import re
 import shlex
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
@@ -23,6 +26,7 @@ from abc import ABC, abstractmethod
 from contextlib import suppress
 from pathlib import Path
 from typing import (
+    Any,
     Dict,
     Iterable,
     List,
@@ -80,6 +84,105 @@ def _shlex_join(split_command: Iterable[str]) -> str:
     return " ".join(shlex.quote(arg) for arg in split_command)
 
 
+# Environment variables which may differ between batches of tests run in one persistent simulator
+_PERSISTENT_BATCH_ENV_VARS = (
+    "COCOTB_TEST_MODULES",
+    "COCOTB_TESTCASE",
+    "COCOTB_TEST_FILTER",
+    "COCOTB_RANDOM_SEED",
+    "COCOTB_RESULTS_FILE",
+    "PYTEST_CURRENT_TEST",
+)
+
+
+class _PersistentSimulator:
+    """A simulator process which is kept alive to run several batches of tests.
+
+    The simulator connects back to a local socket once a batch of tests has completed
+    and then waits for the runner to either submit the environment of the next batch or to ask it to exit.
+    See :mod:`cocotb._persistent` for the other side of the connection.
+    """
+
+    def __init__(
+        self,
+        cmd: _Command,
+        cwd: PathLike,
+        env: Mapping[str, str],
+        log_file: Optional[PathLike],
+        key: Tuple[Any, ...],
+    ) -> None:
+        self.key = key
+        self._server = socket.socket()
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        self._server.settimeout(0.1)
+        host, port = self._server.getsockname()[:2]
+        self._connection: Optional[socket.socket] = None
+        self._reader: Optional[TextIO] = None
+
+        self._log: Optional[TextIO] = None
+        if log_file is not None:
+            # appended to, as preparation commands may have written to the file already
+            self._log = open(log_file, "a")
+
+        env = dict(env)
+        env["COCOTB_PERSISTENT_SERVER"] = f"{host}:{port}"
+        self.process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=self._log,
+            stderr=None if self._log is None else subprocess.STDOUT,
+        )
+        atexit.register(self.close)
+
+    def wait_batch(self) -> Optional[int]:
+        """Wait until the current batch of tests completes.
+
+        Returns:
+            ``None`` if the simulator is ready to run another batch,
+            the exit code of the simulator if it exited instead.
+        """
+        if self._connection is None:
+            while True:
+                try:
+                    self._connection, _ = self._server.accept()
+                except socket.timeout:
+                    if self.process.poll() is not None:
+                        self.close()
+                        return self.process.returncode
+                else:
+                    break
+            self._connection.settimeout(None)
+            self._reader = self._connection.makefile("r", encoding="utf-8")
+
+        assert self._reader is not None
+        if not self._reader.readline():
+            self.close()
+            return self.process.returncode
+        return None
+
+    def submit(self, env: Mapping[str, Optional[str]]) -> None:
+        """Start the next batch of tests with the given environment variable values."""
+        assert self._connection is not None
+        msg = json.dumps({"env": dict(env)}) + "\n"
+        self._connection.sendall(msg.encode("utf-8"))
+
+    def close(self) -> None:
+        """Ask the simulator to exit and wait for it to do so."""
+        atexit.unregister(self.close)
+        if self._connection is not None:
+            with suppress(OSError):
+                self._connection.sendall(b'{"stop": true}\n')
+            self._connection.close()
+            self._connection = None
+        self._server.close()
+        self.process.wait()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
 class VHDL(str):
     """Tags source files and build arguments to :meth:`Runner.build() <cocotb_tools.runner.Runner.build>` as VHDL-specific."""
 
@@ -102,6 +205,8 @@ class Runner(ABC):
 
         self.log = logging.getLogger(type(self).__qualname__)
 
+        self._persistent_sim: Optional[_PersistentSimulator] = None
+
     @abstractmethod
     def _simulator_in_path(self) -> None:
         """Raise exception if the simulator executable does not exist in :envvar:`PATH`.
@@ -317,6 +422,8 @@ class Runner(ABC):
         timescale: Optional[Tuple[str, str]] = None,
         log_file: Optional[PathLike] = None,
         test_filter: Optional[str] = None,
+        persistent: bool = False,
+        import_cache: bool = False,
     ) -> Path:
         """Run the tests.
 
@@ -351,6 +458,24 @@ class Runner(ABC):
             log_file: File to write the test log to.
             test_filter: Regular expression which matches test names.
                 Only matched tests are run if this argument if given.
+            persistent: Keep the simulator process alive after the tests complete,
+                and run the tests of later calls with *persistent* set in the same process.
+                This avoids the cost of starting the simulator and initializing cocotb for every call.
+                The simulator is only reused if everything but *test_module*, *testcase*,
+                *test_filter*, *seed*, and *results_xml* is the same as in the previous call;
+                otherwise it is restarted.
+                Python state is reset between calls, but the state of the design is *not*,
+                so tests must bring the design into a known state themselves, e.g. by applying a reset.
+                Test modules are not re-imported.
+
+                .. versionadded:: 2.0
+            import_cache: Load the pure-Python modules imported by the tests from a zip file of their bytecode
+                in *build_dir*, see :envvar:`COCOTB_IMPORT_CACHE`.
+                Unless :envvar:`COCOTB_REWRITE_ASSERTION_FILES` is set,
+                assertions are then only rewritten in the test modules and the files matching ``test_*.py``,
+                so that the other modules can be cached.
+
+                .. versionadded:: 2.0
 
         Returns:
             The absolute location of the results XML file which can be
@@ -409,6 +534,17 @@ class Runner(ABC):
         if seed is not None:
             self.env["COCOTB_RANDOM_SEED"] = str(seed)
 
+        if import_cache:
+            self.env["COCOTB_IMPORT_CACHE"] = str(self.build_dir / "import_cache.zip")
+            # modules with rewritten assertions are not cached, and by default all are
+            test_files = [
+                f"{module.rpartition('.')[2]}.py"
+                for module in self.test_module.split(",")
+            ]
+            self.env.setdefault(
+                "COCOTB_REWRITE_ASSERTION_FILES", " ".join(["test_*.py", *test_files])
+            )
+
         self.log_file = log_file
         self.waves = waves
         self.gui = gui
@@ -445,7 +581,10 @@ class Runner(ABC):
         cmds: Sequence[_Command] = self._test_command()
         simulator_exit_code: int = 0
         try:
-            self._execute(cmds, cwd=self.test_dir)
+            if persistent:
+                self._execute_persistent(cmds, cwd=self.test_dir)
+            else:
+                self._execute(cmds, cwd=self.test_dir)
         except subprocess.CalledProcessError as e:
             # It is possible for the simulator to fail but still leave results.
             self.log.error("Simulation failed: %d", e.returncode)
@@ -510,6 +649,55 @@ class Runner(ABC):
                 cmd, cwd=cwd, env=self.env, check=True, stdout=stdout, stderr=stderr
             )
 
+    def _execute_persistent(self, cmds: Sequence[_Command], cwd: PathLike) -> None:
+        """Run a batch of tests in a persistent simulator, (re)starting it if required."""
+        __tracebackhide__ = True  # Hide the traceback when using PyTest.
+
+        batch_env = {name: self.env.get(name) for name in _PERSISTENT_BATCH_ENV_VARS}
+        key = (
+            tuple(tuple(cmd) for cmd in cmds),
+            str(cwd),
+            self.log_file,
+            frozenset(
+                (name, value)
+                for name, value in self.env.items()
+                if name not in _PERSISTENT_BATCH_ENV_VARS
+            ),
+        )
+
+        sim = self._persistent_sim
+        if sim is not None and sim.process.poll() is not None:
+            sim.close()
+            sim = None
+        elif sim is not None and sim.key != key:
+            self.log.info("Configuration changed, restarting persistent simulator")
+            sim.close()
+            sim = None
+
+        if sim is not None:
+            self.log.info("Running tests in persistent simulator")
+            sim.submit(batch_env)
+        else:
+            # everything but the last command prepares the simulation
+            if len(cmds) > 1:
+                self._execute(cmds[:-1], cwd)
+            elif self.log_file is not None:
+                open(self.log_file, "w").close()
+            self.log.info(
+                "Starting persistent simulator %s in directory %s",
+                _shlex_join(cmds[-1]),
+                cwd,
+            )
+            sim = _PersistentSimulator(cmds[-1], cwd, self.env, self.log_file, key)
+
+        returncode = sim.wait_batch()
+        if returncode is None:
+            self._persistent_sim = sim
+        else:
+            self._persistent_sim = None
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmds[-1])
+
     def rm_build_folder(self, build_dir: Path) -> None:
         if os.path.isdir(build_dir):
             self.log.info("Removing: %s", build_dir)
@@ -2,13 +2,21 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import First, NullTrigger, RisingEdge, Timer, with_timeout
+from cocotb_tools import combine_results
 from cocotb_tools.runner import get_runner
 
 
-def build_and_run_matrix_multiplier(benchmark, sim):
+def build_and_run_matrix_multiplier(benchmark, sim, persistent=False):
     hdl_toplevel_lang = "verilog"
     build_args = []
     test_args = []
@@ -47,6 +55,7 @@ def build_and_run_matrix_multiplier(benchmark, sim):
             test_module="test_matrix_multiplier",
             test_args=test_args,
             seed=123456789,
+            persistent=persistent,
         )
 
 
@@ -56,3 +65,159 @@ def test_matrix_multiplier_icarus(benchmark):
 
 def test_matrix_multiplier_nvc(benchmark):
     build_and_run_matrix_multiplier(benchmark, "nvc")
+
+
+def test_matrix_multiplier_icarus_persistent(benchmark):
+    build_and_run_matrix_multiplier(benchmark, "icarus", persistent=True)
+
+
+def test_matrix_multiplier_nvc_persistent(benchmark):
+    build_and_run_matrix_multiplier(benchmark, "nvc", persistent=True)
+
+
+@cocotb.test()
+async def bench_with_timeout(dut):
+    """Wait on every clock edge with a timeout, like a transaction monitor."""
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+    tasks_before = cocotb.task._id_count
+    for _ in range(20000):
+        await with_timeout(RisingEdge(dut.clk), 100, "ns")
+        await First(RisingEdge(dut.clk), Timer(100, "ns"))
+    dut._log.info("Started %d tasks", cocotb.task._id_count - tasks_before)
+
+
+def test_with_timeout_icarus(benchmark):
+    tests_dir = Path(__file__).resolve().parent
+    runner = get_runner("icarus")
+    runner.build(
+        hdl_toplevel="sample_module",
+        sources=[tests_dir / "designs" / "sample_module" / "sample_module.sv"],
+        build_dir="sim_build_with_timeout",
+    )
+
+    @benchmark
+    def run_test():
+        runner.test(
+            hdl_toplevel="sample_module",
+            test_module="benchmark",
+            testcase="bench_with_timeout",
+            seed=123456789,
+        )
+
+
+async def _noop():
+    pass
+
+
+@cocotb.test()
+async def bench_start_soon(dut):
+    """Start many short-lived tasks, like First, Combine and with_timeout on coroutines do."""
+    for _ in range(200):
+        for _ in range(1000):
+            cocotb.start_soon(_noop())
+        # the tasks run before the test resumes
+        await NullTrigger()
+
+
+def test_start_soon_icarus(benchmark):
+    tests_dir = Path(__file__).resolve().parent
+    runner = get_runner("icarus")
+    runner.build(
+        hdl_toplevel="sample_module",
+        sources=[tests_dir / "designs" / "sample_module" / "sample_module.sv"],
+        build_dir="sim_build_start_soon",
+    )
+
+    @benchmark
+    def run_test():
+        runner.test(
+            hdl_toplevel="sample_module",
+            test_module="benchmark",
+            testcase="bench_start_soon",
+            seed=123456789,
+        )
+
+
+def test_combine_results(benchmark, tmp_path):
+    # many small results files as written by parametrized runs, with a testsuite per run
+    results_dir = tmp_path / "results"
+    for i in range(10000):
+        run_dir = results_dir / f"run{i}"
+        run_dir.mkdir(parents=True)
+        (run_dir / "results.xml").write_text(
+            '<testsuites name="results">\n'
+            f'  <testsuite name="all" package="run{i % 1000}">\n'
+            f'    <property name="random_seed" value="{i}" />\n'
+            '    <testcase name="test_a" classname="test_mod" file="test_mod.py" lineno="1" time="0.1" />\n'
+            '    <testcase name="test_b" classname="test_mod" file="test_mod.py" lineno="9" time="0.1" />\n'
+            "  </testsuite>\n"
+            "</testsuites>\n"
+        )
+
+    @benchmark
+    def run_combine_results():
+        combine_results.main(
+            [str(results_dir), "-o", str(tmp_path / "combined_results.xml")]
+        )
+
+
+def test_import_cocotb(benchmark):
+    # importing cocotb is a large part of the run time of short tests
+    cmd = [sys.executable, "-X", "importtime", "-c", "import cocotb"]
+
+    @benchmark
+    def import_cocotb():
+        subprocess.run(cmd, check=True, stderr=subprocess.DEVNULL)
+
+    # the cumulative import times in us of the slowest modules, as reported by -X importtime
+    stderr = subprocess.run(
+        cmd,
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,  # noqa: UP021 | text needs Python 3.7
+    ).stderr
+    times = {}
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    slowest = sorted(times, key=times.get, reverse=True)[:20]
+    benchmark.extra_info["import_time_us"] = {
+        module: times[module] for module in slowest
+    }
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_import_cache(benchmark, tmp_path, cached):
+    # a verification library of many modules, imported by the tests
+    package = tmp_path / "vip"
+    package.mkdir()
+    for i in range(300):
+        (package / f"agent{i}.py").write_text(
+            "import enum\n\n\n"
+            f"class Agent{i}:\n"
+            + "".join(
+                f"    def method{j}(self, x):\n        return x + {j}\n\n"
+                for j in range(20)
+            )
+            + f"\n\nclass Kind{i}(enum.Enum):\n    A = 1\n    B = 2\n"
+        )
+    (package / "__init__.py").write_text(
+        "".join(f"from .agent{i} import *\n" for i in range(300))
+    )
+
+    env = dict(os.environ)
+    # search many directories, like a regression with many source trees
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(tmp_path / f"missing{i}") for i in range(20)] + [str(tmp_path)]
+    )
+    env["COCOTB_REWRITE_ASSERTION_FILES"] = "test_*.py"
+    if cached:
+        env["COCOTB_IMPORT_CACHE"] = str(tmp_path / "import_cache.zip")
+    code = "import cocotb._import_cache as c; c.install(); import vip; c.save()"
+    cmd = [sys.executable, "-c", code]
+    # write the bytecode, to the cache or to __pycache__
+    subprocess.run(cmd, check=True, env=env)
+
+    @benchmark
+    def import_vip():
+        subprocess.run(cmd, check=True, env=env)
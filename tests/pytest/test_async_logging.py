@@ -0,0 +1,110 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+import logging
+import queue
+from logging.handlers import QueueListener
+
+import cocotb.logging
+from cocotb.logging import SimTimeQueueHandler
+
+
+class Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.created_sim_time, self.format(record)))
+
+
+class Mutable:
+    def __init__(self):
+        self.value = 1
+
+    def __str__(self):
+        return str(self.value)
+
+
+def test_sim_time_queue_handler(monkeypatch):
+    monkeypatch.setattr(cocotb.logging, "get_sim_time", lambda: 42)
+    q = queue.Queue()
+    collect = Collect()
+    listener = QueueListener(q, collect)
+    logger = logging.getLogger("test_sim_time_queue_handler")
+    logger.propagate = False
+    logger.addHandler(SimTimeQueueHandler(q))
+
+    # queued, but not formatted
+    logger.warning("%d %s", 1, "two")
+    record = q.queue[0]
+    assert record.created_sim_time == 42
+    assert record.args == (1, "two")
+
+    # objects which may change are formatted immediately
+    obj = Mutable()
+    logger.warning("obj=%s", obj)
+    obj.value = 2
+
+    try:
+        raise ValueError("oops")
+    except ValueError:
+        logger.exception("failed")
+    assert q.queue[-1].exc_info is None
+
+    listener.start()
+    q.join()
+    listener.stop()
+
+    assert [msg for _, msg in collect.records[:2]] == ["1 two", "obj=1"]
+    assert all(sim_time == 42 for sim_time, _ in collect.records)
+    assert collect.records[2][1].startswith("failed\nTraceback")
+    assert "ValueError: oops" in collect.records[2][1]
+
+
+def test_writer_flush(monkeypatch):
+    monkeypatch.setattr(cocotb.logging, "get_sim_time", lambda: 0)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    # never wakes up on its own
+    writer = cocotb.logging._Writer(handler, interval_s=60)
+    logger = logging.getLogger("test_writer_flush")
+    logger.propagate = False
+    logger.addHandler(SimTimeQueueHandler(writer))
+    try:
+        logger.warning("first")
+        logger.error("second %d", 2)
+        writer.flush()
+        assert stream.getvalue() == "WARNING first\nERROR second 2\n"
+
+        logger.warning("third")
+    finally:
+        writer.stop()
+    assert stream.getvalue().endswith("WARNING third\n")
+
+
+def test_writer_write_error(monkeypatch):
+    monkeypatch.setattr(cocotb.logging, "get_sim_time", lambda: 0)
+
+    class BrokenStream(io.StringIO):
+        def write(self, s):
+            raise OSError("disk full")
+
+    handler = logging.StreamHandler(BrokenStream())
+    failed = []
+    handler.handleError = failed.append
+    writer = cocotb.logging._Writer(handler, interval_s=60)
+    logger = logging.getLogger("test_writer_write_error")
+    logger.propagate = False
+    logger.addHandler(SimTimeQueueHandler(writer))
+    try:
+        logger.warning("first")
+        logger.warning("second")
+        writer.flush()
+    finally:
+        writer.stop()
+    # the failure is reported against the records of the batch, not the flush request
+    assert [record.getMessage() for record in failed] == ["first", "second"]
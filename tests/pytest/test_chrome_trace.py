@@ -0,0 +1,87 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gzip
+import json
+import zlib
+from types import SimpleNamespace
+
+import pytest
+
+import cocotb._chrome_trace
+from cocotb._chrome_trace import ChromeTrace
+
+
+class Timer:
+    pass
+
+
+def make_task(task_id, coro_name):
+    return SimpleNamespace(
+        _task_id=task_id,
+        __name__=f"Task {task_id}",
+        _coro=SimpleNamespace(__qualname__=coro_name),
+        _trigger=None,
+    )
+
+
+@pytest.mark.parametrize("filename", ["trace.json", "trace.json.gz"])
+def test_chrome_trace(tmp_path, monkeypatch, filename):
+    # 1 ps precision
+    monkeypatch.setattr(cocotb._chrome_trace, "_get_simulator_precision", lambda: -12)
+    path = tmp_path / filename
+    trace = ChromeTrace(str(path))
+
+    task = make_task(0, "driver")
+    timer = Timer()
+    trace(("resume", 0, task))
+    task._trigger = timer
+    trace(("suspend", 0, task))
+    trace(("gpi", 5000, timer))
+    trace(("resume", 5000, task))
+    task._trigger = None
+    trace(("suspend", 5000, task))
+    trace.close()
+
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(path, "rt") as f:
+        events = json.load(f)
+
+    thread_names = {
+        (e["pid"], e["tid"]): e["args"]["name"]
+        for e in events
+        if e["name"] == "thread_name"
+    }
+    assert thread_names[1, 1] == thread_names[2, 1] == "Task 0 driver"
+
+    resumptions = [e for e in events if e["ph"] == "X" and e["pid"] == 1]
+    assert [e["name"] for e in resumptions] == ["driver", "driver"]
+    assert all(e["dur"] >= 0 for e in resumptions)
+
+    (wait,) = [e for e in events if e["ph"] == "X" and e["pid"] == 2]
+    assert wait["name"] == "Timer"
+    assert wait["ts"] == 0
+    assert wait["dur"] == pytest.approx(0.005)
+
+    (callback,) = [e for e in events if e["ph"] == "i"]
+    assert callback["args"]["sim_time_us"] == pytest.approx(0.005)
+
+
+def test_chrome_trace_flush(tmp_path):
+    path = tmp_path / "trace.json.gz"
+    trace = ChromeTrace(str(path))
+    trace(("resume", 0, make_task(0, "driver")))
+    trace.flush()
+
+    # the events so far can be decompressed before the trace is closed
+    text = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(path.read_bytes())
+    trace.close()
+    events = json.loads(text.decode() + "]")
+    assert events[-1]["args"]["name"] == "Task 0 driver"
+
+
+def test_chrome_trace_unused(tmp_path):
+    trace = ChromeTrace(str(tmp_path / "trace.json"))
+    trace.close()
+    assert not (tmp_path / "trace.json").exists()
@@ -0,0 +1,73 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from cocotb_tools import combine_results
+
+
+def write_results(path, package, testcases):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    xunit = ET.Element("testsuites", name="results")
+    testsuite = ET.SubElement(xunit, "testsuite", name="all", package=package)
+    ET.SubElement(testsuite, "property", name="random_seed", value="1")
+    for name, failed in testcases:
+        testcase = ET.SubElement(
+            testsuite,
+            "testcase",
+            name=name,
+            classname="test_mod",
+            file="test_mod.py",
+            lineno="1",
+        )
+        if failed:
+            ET.SubElement(testcase, "failure", message="failed & <escaped>")
+    ET.ElementTree(xunit).write(path, encoding="UTF-8")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_combine_results(tmp_path, capsys, jobs):
+    write_results(tmp_path / "a" / "results.xml", "pkg_a", [("test_1", False)])
+    write_results(tmp_path / "b" / "results.xml", "pkg_b", [("test_2", True)])
+    write_results(tmp_path / "c" / "results.xml", "pkg_a", [("test_3", False)])
+    (tmp_path / "c" / "other.xml").write_text("not matched by the input filename")
+    output_file = tmp_path / "combined.xml"
+
+    rc = combine_results.main(
+        [str(tmp_path), "-o", str(output_file), "--jobs", str(jobs)]
+    )
+
+    assert rc == 1
+    out = capsys.readouterr().out
+    assert (
+        "Failure in testsuite: 'all' classname: 'test_mod' testcase: 'test_2' with parameters 'pkg_b'"
+        in out
+    )
+    assert "Ran a total of 2 TestSuites and 3 TestCases" in out
+
+    root = ET.parse(output_file).getroot()
+    assert root.get("name") == "results"
+    testsuites = {ts.get("package"): ts for ts in root}
+    assert len(root) == len(testsuites) == 2
+    assert sorted(tc.get("name") for tc in testsuites["pkg_a"].iter("testcase")) == [
+        "test_1",
+        "test_3",
+    ]
+    assert len(testsuites["pkg_a"].findall("property")) == 2
+    failure = testsuites["pkg_b"].find("testcase/failure")
+    assert failure.get("message") == "failed & <escaped>"
+
+
+def test_combine_results_no_input(tmp_path):
+    output_file = tmp_path / "combined.xml"
+    rc = combine_results.main(
+        [str(tmp_path), "-o", str(output_file), "--output-testsuites-name", "empty"]
+    )
+    assert rc == 0
+    root = ET.parse(output_file).getroot()
+    assert root.tag == "testsuites"
+    assert root.get("name") == "empty"
+    assert len(root) == 0
@@ -0,0 +1,73 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import subprocess
+import sys
+import zipfile
+
+
+def test_import_cache(tmp_path):
+    (tmp_path / "vip").mkdir()
+    (tmp_path / "vip" / "__init__.py").write_text("from .agent import Agent\n")
+    (tmp_path / "vip" / "agent.py").write_text(
+        "class Agent:\n    def fail(self):\n        raise ValueError('boom')\n"
+    )
+    (tmp_path / "data_pkg").mkdir()
+    (tmp_path / "data_pkg" / "__init__.py").write_text("")
+    (tmp_path / "data_pkg" / "table.csv").write_text("1,2\n")
+    (tmp_path / "test_mod.py").write_text("import vip, data_pkg\n")
+
+    cache = tmp_path / "import_cache.zip"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(tmp_path)
+    env["COCOTB_IMPORT_CACHE"] = str(cache)
+    env["COCOTB_REWRITE_ASSERTION_FILES"] = "test_*.py"
+    code = (
+        "import traceback, cocotb._import_cache as c\n"
+        "c.install()\n"
+        "import test_mod, vip\n"
+        "print(vip.__file__)\n"
+        "try:\n"
+        "    vip.Agent().fail()\n"
+        "except ValueError:\n"
+        "    print(traceback.format_exc())\n"
+        "c.save()\n"
+    )
+
+    def run():
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,  # noqa: UP021 | text needs Python 3.7
+        ).stdout
+
+    # written by the first run, packages with data files and rewritten modules are left out
+    assert run().startswith(str(tmp_path / "vip"))
+    with zipfile.ZipFile(cache) as zf:
+        assert sorted(n for n in zf.namelist() if n.endswith(".pyc")) == [
+            "vip/__init__.pyc",
+            "vip/agent.pyc",
+        ]
+
+    # used by the next run, with tracebacks showing the sources
+    out = run()
+    assert out.startswith(str(cache / "vip"))
+    assert "raise ValueError('boom')" in out
+
+    # not used once a source changed
+    (tmp_path / "vip" / "extra.py").write_text("")
+    assert run().startswith(str(tmp_path / "vip"))
+    assert run().startswith(str(cache / "vip"))
+
+    # not used once another copy of a cached package comes first on sys.path
+    other = tmp_path / "other"
+    (other / "vip").mkdir(parents=True)
+    for f in ["__init__.py", "agent.py"]:
+        (other / "vip" / f).write_text((tmp_path / "vip" / f).read_text())
+    env["PYTHONPATH"] = os.pathsep.join([str(other), str(tmp_path)])
+    assert run().startswith(str(other / "vip"))
+    assert run().startswith(str(cache / "vip"))
@@ -0,0 +1,68 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from types import SimpleNamespace
+
+import cocotb._instrumentation
+from cocotb._instrumentation import SchedulerInstrumentation
+
+
+class Timer:
+    pass
+
+
+class Event:
+    pass
+
+
+class FakeTask:
+    def __init__(self, coro_name):
+        self._coro = SimpleNamespace(__qualname__=coro_name)
+
+
+def test_scheduler_instrumentation(monkeypatch):
+    monkeypatch.setattr(cocotb._instrumentation, "_get_sim_time", lambda: 42)
+    records = []
+    instrumentation = SchedulerInstrumentation(task_cpu_time=True, hook=records.append)
+
+    timer = Timer()
+    task = FakeTask("driver")
+    instrumentation.trigger_primed(timer)
+    instrumentation.trigger_primed(Event())
+    instrumentation.gpi_callback(timer)
+    instrumentation.trigger_fired(timer)
+    resumed_at = instrumentation.task_resuming(task)
+    instrumentation.task_suspended(task, resumed_at)
+    instrumentation.event_loop_done(1)
+    instrumentation.event_loop_done(3)
+
+    counters = instrumentation.as_dict()
+    assert counters["gpi_callbacks"] == {"Timer": 1}
+    assert counters["triggers_primed"] == {"Event": 1, "Timer": 1}
+    assert counters["triggers_fired"] == {"Timer": 1}
+    assert counters["triggers_unprimed"] == {}
+    assert counters["tasks_resumed"] == 1
+    assert counters["event_loops"] == 2
+    assert counters["event_loop_iterations"] == 4
+    assert counters["max_event_loop_iterations"] == 3
+    assert list(counters["task_cpu_time_s"]) == ["driver"]
+
+    assert [(event, time) for event, time, _ in records] == [
+        ("prime", 42),
+        ("prime", 42),
+        ("gpi", 42),
+        ("fire", 42),
+        ("resume", 42),
+        ("suspend", 42),
+    ]
+    assert records[-1][2] is task
+
+    instrumentation.reset()
+    assert instrumentation.as_dict()["tasks_resumed"] == 0
+
+
+def test_scheduler_instrumentation_defaults():
+    instrumentation = SchedulerInstrumentation()
+    instrumentation.gpi_callback(Timer())
+    assert "task_cpu_time_s" not in instrumentation.as_dict()
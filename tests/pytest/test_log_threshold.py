@@ -0,0 +1,50 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import logging
+
+import cocotb.logging
+from cocotb.logging import _DISABLED, SimBaseLog, _log_threshold_from_c
+
+
+def test_log_threshold():
+    logger = logging.getLogger("test_log_threshold")
+    child = logging.getLogger("test_log_threshold.child")
+    try:
+        logger.setLevel(logging.INFO)
+        assert _log_threshold_from_c("test_log_threshold") == logging.INFO
+        assert _log_threshold_from_c("test_log_threshold.child") == logging.INFO
+
+        child.setLevel(logging.DEBUG)
+        assert _log_threshold_from_c("test_log_threshold.child") == logging.DEBUG
+
+        # logging.disable is applied by _log_from_c, never cached
+        logging.disable(logging.INFO)
+        assert _log_threshold_from_c("test_log_threshold.child") == logging.DEBUG
+        logging.disable(logging.NOTSET)
+
+        child.disabled = True
+        assert _log_threshold_from_c("test_log_threshold.child") == _DISABLED
+    finally:
+        logging.disable(logging.NOTSET)
+        child.disabled = False
+        child.setLevel(logging.NOTSET)
+        logger.setLevel(logging.NOTSET)
+
+
+def test_sim_base_log_clears_level_cache(monkeypatch):
+    cleared = []
+    monkeypatch.setattr(
+        cocotb.logging.simulator,
+        "clear_log_level_cache",
+        lambda: cleared.append(None),
+    )
+    logger = SimBaseLog("test_sim_base_log_clears_level_cache")
+    cleared.clear()
+
+    logger.setLevel(logging.INFO)
+    assert len(cleared) == 1
+    logger.disabled = True
+    assert len(cleared) == 2
+    assert logger.disabled
@@ -49,3 +49,34 @@ def test_parametrize_bad_args():
         cocotb.parametrize((("not valid", "valid"), [(1, 2), (3, 4)]))
     with pytest.raises(ValueError):
         cocotb.parametrize((("a", "b"), [(1, 2, "too", "many", "args"), (3, 4)]))
+
+
+def test_parametrize_creates_tests_lazily():
+    async def my_test(dut, a, b):
+        """My docstring."""
+        await dut(a, b)
+
+    stubs = list(cocotb.parametrize(a=[1, 2], b=["x", "y"])(my_test).generate_tests())
+    assert [stub.name.split(".")[-1] for stub in stubs] == [
+        "my_test/a=1/b=x",
+        "my_test/a=1/b=y",
+        "my_test/a=2/b=x",
+        "my_test/a=2/b=y",
+    ]
+    assert all(stub.doc == "My docstring." for stub in stubs)
+    assert stubs[0].location[1] == my_test.__code__.co_firstlineno
+
+    test = stubs[1].create()
+    assert test.name == stubs[1].name
+    assert test.fullname == stubs[1].fullname
+    assert test.doc == "My docstring."
+
+    calls = []
+
+    async def dut(a, b):
+        calls.append((a, b))
+
+    coro = test.func(dut)
+    with pytest.raises(StopIteration):
+        coro.send(None)
+    assert calls == [(1, "y")]
@@ -0,0 +1,54 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+
+import pytest
+
+from cocotb._profiling import ProfilingReport
+
+
+class Timer:
+    pass
+
+
+class ReadWrite:
+    pass
+
+
+def test_profiling_report(tmp_path):
+    filename = tmp_path / "profile.json"
+    report = ProfilingReport(str(filename))
+    instrumentation = report.instrumentation
+
+    report.enter()
+    report.start_test()
+    instrumentation.gpi_callback(Timer())
+    instrumentation.tasks_resumed += 2
+    report.exit()
+
+    report.enter()
+    instrumentation.gpi_callback(ReadWrite())
+    instrumentation.gpi_callback(Timer())
+    instrumentation.writes_applied += 3
+    stats = report.end_test("mod.test", wall_time_s=100.0, sim_time_ns=10.0)
+    report.exit()
+
+    assert stats["gpi_callbacks"] == {"ReadWrite": 1, "Timer": 2}
+    assert stats["tasks_resumed"] == 2
+    assert stats["writes_applied"] == 3
+    assert 0 < stats["python_time_s"] < 100.0
+    assert stats["python_time_s"] + stats["simulator_time_s"] == pytest.approx(100.0)
+
+    # counters are reset for the next test, time spent in Python after the end of a test is not accounted to it
+    report.start_test()
+    stats = report.end_test("mod.other", wall_time_s=0.0, sim_time_ns=0.0)
+    assert stats["gpi_callbacks"] == {}
+    assert stats["simulator_time_s"] == 0.0
+
+    report.write()
+    summary = json.loads(filename.read_text())
+    assert [test["test"] for test in summary["tests"]] == ["mod.test", "mod.other"]
+    assert summary["tests"][0]["sim_time_ns"] == 10.0
+    assert report.tests == []
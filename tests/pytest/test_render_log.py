@@ -0,0 +1,103 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import logging
+
+import pytest
+
+import cocotb.logging
+from cocotb.logging import StructuredLogHandler
+from cocotb_tools import render_log
+
+
+class Handle:
+    def __str__(self):
+        return "dut.sig"
+
+
+def write_log(monkeypatch, filename, precision, entries):
+    monkeypatch.setattr(cocotb.logging, "_get_simulator_precision", lambda: precision)
+    handler = StructuredLogHandler(str(filename))
+    logger = logging.getLogger(f"cocotb.{filename.name}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        for sim_time, name, level, msg, *args in entries:
+            monkeypatch.setattr(cocotb.logging, "get_sim_time", lambda: sim_time)
+            logger.getChild(name).log(level, msg, *args)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+@pytest.fixture
+def sim(monkeypatch):
+    monkeypatch.setattr(cocotb.logging, "_suppress", 1)
+
+
+def test_structured_log(sim, monkeypatch, tmp_path):
+    path = tmp_path / "log.jsonl"
+    write_log(
+        monkeypatch,
+        path,
+        -12,
+        [
+            (0, "mon", logging.INFO, "sampled %d", 5),
+            (1000, "mon", logging.INFO, "sampled %d", 6),
+            (2000, "drv", logging.WARNING, "driving %s", Handle()),
+        ],
+    )
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["precision"] == -12
+    records = [line for line in lines if isinstance(line, list)]
+    # the loggers and sites are interned
+    assert sum("logger" in line for line in lines if isinstance(line, dict)) == 2
+    assert [r[0] for r in records] == [0, 1000, 2000]
+    assert records[0][4:6] == ["sampled %d", [5]]
+    # arguments which are not plain values are formatted immediately
+    assert records[2][4:6] == ["driving dut.sig", []]
+
+
+def test_render_log(sim, monkeypatch, tmp_path, capsys):
+    # shards with different precisions
+    write_log(
+        monkeypatch,
+        tmp_path / "a.jsonl.gz",
+        -12,
+        [
+            (1000, "mon", logging.INFO, "a %d", 1),
+            (3000, "mon", logging.DEBUG, "a %d", 3),
+        ],
+    )
+    write_log(
+        monkeypatch,
+        tmp_path / "b.jsonl",
+        -9,
+        [
+            (2, "drv", logging.WARNING, "b %s", "two"),
+            (4, "mon", logging.ERROR, "100%"),
+        ],
+    )
+    files = [str(tmp_path / "a.jsonl.gz"), str(tmp_path / "b.jsonl")]
+
+    assert render_log.main(files) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-2:] for line in lines] == [
+        ["a", "1"],
+        ["b", "two"],
+        ["a", "3"],
+        ["cocotb.b.jsonl.mon", "100%"],
+    ]
+    assert lines[0].split()[:3] == ["1.00ns", "INFO", "cocotb.a.jsonl.gz.mon"]
+    assert lines[3].split()[0] == "4.00ns"
+
+    render_log.main([*files, "--start", "1.5", "--end", "3", "--level", "info"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-1] for line in lines] == ["two"]
+
+    render_log.main([*files, "--logger", "cocotb.a.jsonl.gz"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-1] for line in lines] == ["1", "3"]
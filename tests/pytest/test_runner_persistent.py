@@ -0,0 +1,71 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import sys
+
+import pytest
+
+import cocotb
+from cocotb.triggers import Timer
+from cocotb_tools.runner import get_results, get_runner
+
+pytestmark = pytest.mark.simulator_required
+
+tests_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sim_build = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sim_build")
+sys.path.insert(0, os.path.join(tests_dir, "pytest"))
+
+sim = os.getenv("SIM", "icarus")
+
+
+# Test modules are not re-imported between batches of a persistent simulator,
+# so module state tells us whether the simulator process was reused.
+_batches = 0
+
+
+@cocotb.test()
+async def cocotb_persistent_first(dut):
+    global _batches
+    _batches += 1
+    await Timer(1, "ns")
+
+
+@cocotb.test()
+async def cocotb_persistent_reused(dut):
+    assert _batches == 1
+    await Timer(1, "ns")
+
+
+def test_runner_persistent():
+    hdl_toplevel_lang = os.getenv("HDL_TOPLEVEL_LANG", "verilog")
+    if hdl_toplevel_lang == "verilog":
+        sources = [os.path.join(tests_dir, "designs", "runner", "runner.v")]
+        gpi_interfaces = ["vpi"]
+    else:
+        sources = [os.path.join(tests_dir, "designs", "runner", "runner.vhdl")]
+        gpi_interfaces = [os.getenv("VHDL_GPI_INTERFACE", None)]
+
+    build_args = ["-v93"] if sim == "xcelium" else []
+    build_dir = os.path.join(sim_build, "test_runner_persistent")
+
+    runner = get_runner(sim)
+    runner.build(
+        sources=sources,
+        hdl_toplevel="runner",
+        defines={"DEFINE": 4},
+        includes=[os.path.join(tests_dir, "designs", "basic_hierarchy_module")],
+        build_args=build_args,
+        build_dir=build_dir,
+    )
+
+    for testcase in ("cocotb_persistent_first", "cocotb_persistent_reused"):
+        results_file = runner.test(
+            hdl_toplevel="runner",
+            test_module="test_runner_persistent",
+            gpi_interfaces=gpi_interfaces,
+            testcase=testcase,
+            persistent=True,
+        )
+        assert get_results(results_file) == (2, 0)
@@ -0,0 +1,70 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import time
+from types import SimpleNamespace
+
+import cocotb
+from cocotb._sampling_profiler import SamplingProfiler, profile_filename
+
+
+def busy(profiler, samples=5):
+    # wait for samples rather than for some time, so that a loaded machine taking fewer does not matter
+    end = sum(profiler.samples.values()) + samples
+    while sum(profiler.samples.values()) < end:
+        pass
+
+
+async def busy_coroutine(profiler):
+    busy(profiler)
+
+
+def test_sampling_profiler(tmp_path, monkeypatch):
+    profiler = SamplingProfiler(interval_s=0.001)
+    coro = busy_coroutine(profiler)
+    task = SimpleNamespace(_coro=coro)
+    monkeypatch.setattr(
+        cocotb, "_scheduler_inst", SimpleNamespace(_current_task=None), raising=False
+    )
+
+    profiler.start()
+    busy(profiler)
+    cocotb._scheduler_inst._current_task = task
+    try:
+        coro.send(None)
+    except StopIteration:
+        pass
+    cocotb._scheduler_inst._current_task = None
+    time.sleep(0.05)
+    profiler.stop()
+
+    # the output directory does not need to exist
+    filename = tmp_path / "profiles" / "profile.folded"
+    profiler.write(str(filename))
+    samples = {}
+    for line in filename.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        samples[stack] = int(count)
+
+    # outside of tasks, the whole stack is attributed to cocotb
+    assert any(
+        stack.startswith("[cocotb];") and "busy (test_sampling_profiler.py" in stack
+        for stack in samples
+    )
+    # inside a task, only the frames from its coroutine on are kept
+    assert any(
+        stack.startswith("busy_coroutine;busy_coroutine (test_sampling_profiler.py")
+        and stack.split(";")[-1].startswith("busy (")
+        for stack in samples
+    )
+    # the sampled thread was sleeping in Python, not in the simulator
+    assert "[simulator]" not in samples
+
+
+def test_profile_filename(monkeypatch):
+    monkeypatch.setattr(cocotb._sampling_profiler, "output_dir", "profiles")
+    assert profile_filename("mod.test/x=1") == os.path.join(
+        "profiles", "mod.test_x=1.folded"
+    )
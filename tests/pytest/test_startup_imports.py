@@ -0,0 +1,19 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import subprocess
+import sys
+
+
+def test_startup_imports():
+    # these are only imported when the features needing them are used
+    deferred = ["pytest", "multiprocessing", "pdb", "cProfile"]
+    code = f"import sys, cocotb; print([m for m in {deferred!r} if m in sys.modules])"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,  # noqa: UP021 | text needs Python 3.7
+    ).stdout
+    assert out.strip() == "[]"
@@ -0,0 +1,95 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+
+from cocotb import _timer_heap
+
+
+class FakeCallback:
+    def __init__(self, sim, time, func):
+        self.sim = sim
+        self.time = time
+        self.func = func
+
+    def deregister(self):
+        self.sim.callbacks.remove(self)
+
+
+class FakeSimulator:
+    def __init__(self):
+        self.time = 0
+        self.callbacks = []
+
+    def get_sim_time(self):
+        return 0, self.time
+
+    def register_timed_callback(self, delay, func):
+        cb = FakeCallback(self, self.time + delay, func)
+        self.callbacks.append(cb)
+        return cb
+
+    def run(self):
+        while self.callbacks:
+            cb = min(self.callbacks, key=lambda cb: cb.time)
+            self.callbacks.remove(cb)
+            self.time = cb.time
+            cb.func()
+
+
+@pytest.fixture
+def sim(monkeypatch):
+    sim = FakeSimulator()
+    monkeypatch.setattr(_timer_heap.simulator, "get_sim_time", sim.get_sim_time)
+    monkeypatch.setattr(
+        _timer_heap.simulator, "register_timed_callback", sim.register_timed_callback
+    )
+    monkeypatch.setattr(_timer_heap, "_heap", _timer_heap.TimerHeap())
+    return sim
+
+
+def test_timer_heap(sim):
+    fired = []
+
+    def callback(name):
+        fired.append((sim.time, name))
+        if name == "a":
+            _timer_heap.call_later(5, callback, "c")
+
+    for delay, name in [(10, "b"), (20, "d"), (10, "b2"), (5, "a")]:
+        _timer_heap.call_later(delay, callback, name)
+    cancelled = _timer_heap.call_later(15, callback, "cancelled")
+    # only the earliest deadline is registered with the simulator
+    assert [cb.time for cb in sim.callbacks] == [5]
+    cancelled.deregister()
+    sim.run()
+    assert fired == [(5, "a"), (10, "b"), (10, "b2"), (10, "c"), (20, "d")]
+    assert _timer_heap._heap.registrations == 4
+
+    with pytest.raises(ValueError):
+        _timer_heap.call_at(sim.time, callback, "now")
+
+
+def test_timer_heap_cancel(sim):
+    fired = []
+    # like with_timeout guarding operations which complete in time
+    for _ in range(50):
+        _timer_heap.call_later(100, fired.append, "timeout").deregister()
+        sim.time += 1
+    # the simulator callback is not moved
+    assert _timer_heap._heap.registrations == 1
+    assert len(_timer_heap._heap._heap) == 0
+
+    kept = _timer_heap.call_later(10, fired.append, "kept")
+    for i in range(200):
+        _timer_heap.call_later(100 + i, fired.append, "timeout").deregister()
+    # the cancelled callbacks are dropped
+    assert len(_timer_heap._heap._heap) <= 3 + _timer_heap._COMPACT_MIN
+    kept.deregister()
+    assert len(_timer_heap._heap._heap) == 0
+
+    # the simulator callbacks fire without effect
+    sim.run()
+    assert fired == []
+    assert _timer_heap._heap.registrations == 2
@@ -0,0 +1,90 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from cocotb._xunit_reporter import XUnitReporter
+
+
+def test_xunit_reporter_valid_after_every_record(tmp_path):
+    filename = tmp_path / "results.xml"
+    filename.write_text("from the previous run")
+    xunit = XUnitReporter(filename=str(filename))
+
+    def testcases():
+        return [
+            (tc.get("name"), [child.tag for child in tc])
+            for tc in ET.parse(filename).getroot().iter("testcase")
+        ]
+
+    # the results of the previous run are kept until there are new ones
+    xunit.add_testsuite(name="all", package="all")
+    xunit.add_property(name="random_seed", value="1")
+    assert filename.read_text() == "from the previous run"
+
+    xunit.add_testcase(name="passes", classname="test_mod")
+    assert testcases() == [("passes", [])]
+
+    xunit.add_testcase(name="fails", classname="test_mod")
+    xunit.add_testcase_property(name="task_resumptions", value="3")
+    xunit.add_failure(message='a "message" <with> & special\ncharacters')
+    assert testcases() == [("passes", []), ("fails", ["properties", "failure"])]
+
+    xunit.add_testcase(name="skipped", classname="test_mod")
+    xunit.add_skipped()
+    xunit.write()
+
+    root = ET.parse(filename).getroot()
+    (testsuite,) = root
+    assert testsuite.attrib == {"name": "all", "package": "all"}
+    assert testsuite[0].tag == "property"
+    assert testcases() == [
+        ("passes", []),
+        ("fails", ["properties", "failure"]),
+        ("skipped", ["skipped"]),
+    ]
+    assert (
+        root.find("./testsuite/testcase/failure").get("message")
+        == 'a "message" <with> & special\ncharacters'
+    )
+
+
+def test_xunit_reporter_format(tmp_path):
+    filename = tmp_path / "results.xml"
+    xunit = XUnitReporter(filename=str(filename))
+    xunit.add_testsuite(name="all", package="all")
+    xunit.add_property(name="random_seed", value="1")
+    xunit.add_testcase(name="a", classname="m")
+    xunit.add_testcase(name="b", classname="m")
+    xunit.add_skipped()
+    xunit.add_testsuite(name="other", package="all")
+    xunit.write()
+
+    assert filename.read_text() == (
+        '<testsuites name="results">\n'
+        '  <testsuite name="all" package="all">\n'
+        '    <property name="random_seed" value="1" />\n'
+        '    <testcase name="a" classname="m" />\n'
+        '    <testcase name="b" classname="m">\n'
+        "      <skipped />\n"
+        "    </testcase>\n"
+        "  </testsuite>\n"
+        '  <testsuite name="other" package="all">\n'
+        "  </testsuite>\n"
+        "</testsuites>\n"
+    )
+
+
+def test_xunit_reporter_no_testcase(tmp_path):
+    filename = tmp_path / "results.xml"
+    xunit = XUnitReporter(filename=str(filename))
+    xunit.add_testsuite(name="all", package="all")
+    with pytest.raises(ValueError):
+        xunit.add_failure()
+    with pytest.raises(ValueError):
+        xunit.add_skipped()
+    xunit.write()
+    assert ET.parse(filename).getroot()[0].tag == "testsuite"
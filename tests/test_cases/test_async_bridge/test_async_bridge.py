@@ -24,7 +24,9 @@
 # ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
 import threading
+import time
 
 import pytest
 
@@ -355,3 +357,92 @@ async def test_resume_called_in_parallel(dut):
     v2 = await t2
     assert v1 == 1, v1
     assert v2 == 2, v2
+
+
+@cocotb.test()
+async def test_bridge_reuses_threads(dut):
+    """
+    Benchmark consecutive bridge calls, and test that they reuse the same thread
+    """
+    threads = set()
+
+    @cocotb.bridge
+    def record_thread():
+        threads.add(threading.current_thread())
+
+    num_calls = 1000
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        await record_thread()
+    elapsed = time.perf_counter() - start
+    dut._log.info(
+        "%d bridge calls took %.3f s (%.1f us per call)",
+        num_calls,
+        elapsed,
+        elapsed / num_calls * 1e6,
+    )
+
+    assert len(threads) == 1
+
+
+def square(x):
+    return x * x
+
+
+def raise_value_error(msg):
+    raise ValueError(msg)
+
+
+@cocotb.test()
+async def test_run_in_process(dut):
+    """
+    Test that run_in_process returns results, and that tasks resume in submission order
+    """
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+
+    resumed = []
+
+    async def compute(x):
+        result = await cocotb.run_in_process(square, x)
+        resumed.append(x)
+        return result
+
+    tasks = [cocotb.start_soon(compute(x)) for x in range(10)]
+    results = [await task for task in tasks]
+    assert results == [x * x for x in range(10)]
+    assert resumed == list(range(10))
+
+    with pytest.raises(ValueError, match="from a worker"):
+        await cocotb.run_in_process(raise_value_error, "from a worker")
+
+
+@cocotb.test()
+async def test_asyncio_interop(dut):
+    """
+    Test that cocotb tasks and asyncio code can await each other
+    """
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+
+    # created in the event loop of cocotb, or it is bound to another one before Python 3.10
+    async def make_queue():
+        return asyncio.Queue()
+
+    queue = await cocotb.from_asyncio(make_queue())
+
+    async def producer():
+        for i in range(5):
+            await queue.put(i)
+            await asyncio.sleep(0)
+        start = get_sim_time("ns")
+        await cocotb.to_asyncio(Timer(100, "ns"))
+        return get_sim_time("ns") - start
+
+    producer_done = cocotb.from_asyncio(producer())
+    assert [await cocotb.from_asyncio(queue.get()) for _ in range(5)] == list(range(5))
+    assert await producer_done == 100
+
+    async def fail():
+        raise ValueError("from asyncio")
+
+    with pytest.raises(ValueError, match="from asyncio"):
+        await cocotb.from_asyncio(fail())
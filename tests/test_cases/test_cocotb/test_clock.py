@@ -13,10 +13,10 @@ from math import isclose
 import pytest
 
 import cocotb
-from cocotb.clock import Clock
+from cocotb.clock import AtCycle, Clock, ClockGroup
 from cocotb.simulator import clock_create, get_precision
-from cocotb.triggers import RisingEdge, Timer
-from cocotb.utils import get_sim_time
+from cocotb.triggers import Edge, RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_sim_time
 
 LANGUAGE = os.environ["TOPLEVEL_LANG"].lower().strip()
 
@@ -132,3 +132,157 @@ async def test_clocks_with_other_number_types(dut):
     await Timer(10, "ns")
     with pytest.warns(FutureWarning, match="cause a CancelledError to be thrown"):
         clk2.cancel()
+
+
+async def record_edges(signal, edges):
+    while True:
+        await Edge(signal)
+        edges.append((get_sim_time(units="ns"), int(signal.value)))
+
+
+@cocotb.test()
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_phase_duty_cycle(dut, impl):
+    edges = []
+    monitor = cocotb.start_soon(record_edges(dut.clk, edges))
+    start_ns = get_sim_time(units="ns")
+    clk = Clock(dut.clk, 10, "ns", impl=impl, duty_cycle=0.3, phase=2)
+    clk_gen = cocotb.start_soon(clk.start())
+    await Timer(25, "ns")
+    clk_gen.kill()
+    monitor.kill()
+    rising = [t - start_ns for t, v in edges if v == 1]
+    falling = [t - start_ns for t, v in edges if v == 0]
+    assert rising[:3] == [2, 12, 22]
+    assert [t for t in falling if t > 2][:2] == [5, 15]
+
+
+@cocotb.test()
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_set_period(dut, impl):
+    start_ns = get_sim_time(units="ns")
+    clk = Clock(dut.clk, 10, "ns", impl=impl)
+    clk_gen = cocotb.start_soon(clk.start())
+    await Timer(1, "ns")
+    # applies from the next rising edge
+    clk.set_period(4, "ns")
+    assert clk.period == get_sim_steps(4, "ns")
+    await RisingEdge(dut.clk)
+    assert get_sim_time(units="ns") - start_ns == 10
+    await RisingEdge(dut.clk)
+    assert get_sim_time(units="ns") - start_ns == 14
+    clk_gen.kill()
+
+
+@cocotb.test()
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_gating(dut, impl):
+    edges = []
+    start_ns = get_sim_time(units="ns")
+    clk = Clock(dut.clk, 10, "ns", impl=impl)
+    clk_gen = cocotb.start_soon(clk.start())
+    await Timer(2, "ns")
+    monitor = cocotb.start_soon(record_edges(dut.clk, edges))
+    # completes its high state, then stays low
+    clk.enabled = False
+    await Timer(30, "ns")
+    assert [(t - start_ns, v) for t, v in edges] == [(5, 0)]
+    clk.enabled = True
+    await Timer(10, "ns")
+    assert [(t - start_ns, v) for t, v in edges] == [(5, 0), (40, 1)]
+    clk_gen.kill()
+    monitor.kill()
+
+
+@cocotb.test()
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_jitter(dut, impl):
+    edges = []
+    monitor = cocotb.start_soon(record_edges(dut.clk, edges))
+    start_ns = get_sim_time(units="ns")
+    clk = Clock(dut.clk, 10, "ns", impl=impl, jitter=1, seed=1)
+    clk_gen = cocotb.start_soon(clk.start(start_high=False))
+    await Timer(200, "ns")
+    clk_gen.kill()
+    monitor.kill()
+    rising = [t - start_ns for t, v in edges if v == 1]
+    # the edges do not drift from their ideal times
+    assert len(rising) == 20
+    for i, t in enumerate(rising):
+        assert abs(t - (5 + 10 * i)) <= 1
+    assert any(t != 5 + 10 * i for i, t in enumerate(rising))
+
+
+@cocotb.test(expect_error=ValueError)
+async def test_clock_error_jitter(dut):
+    Clock(dut.clk, 10, "ns", jitter=3)
+
+
+@cocotb.test()
+async def test_clock_group(dut):
+    edges_clk = []
+    edges_valid = []
+    monitors = [
+        cocotb.start_soon(record_edges(dut.clk, edges_clk)),
+        cocotb.start_soon(record_edges(dut.stream_in_valid, edges_valid)),
+    ]
+    start_ns = get_sim_time(units="ns")
+    clk = Clock(dut.clk, 4, "ns", impl="gpi")
+    clocks = ClockGroup([clk, Clock(dut.stream_in_valid, 6, "ns", impl="py", phase=1)])
+    clocks_gen = cocotb.start_soon(clocks.start())
+    await Timer(13, "ns")
+    clk.set_period(2, "ns")
+    await Timer(6, "ns")
+    clocks_gen.kill()
+    monitors[0].kill()
+    monitors[1].kill()
+    assert [t - start_ns for t, v in edges_clk if v == 1 and t > start_ns] == [
+        4,
+        8,
+        12,
+        16,
+        18,
+    ]
+    assert [t - start_ns for t, v in edges_valid if v == 1] == [1, 7, 13]
+
+
+@cocotb.test()
+@cocotb.parametrize(impl=["py", "gpi"], jitter=[0, 1])
+async def test_clock_cycles(dut, impl, jitter):
+    clk = Clock(dut.clk, 10, "ns", impl=impl, jitter=jitter, seed=3)
+    clk_gen = cocotb.start_soon(clk.start())
+    await Timer(1, "ns")
+    assert clk.cycles == 1
+    predicted = clk.cycle_time(4)
+    await AtCycle(clk, 4)
+    assert get_sim_time() == predicted
+    await Timer(1, "ns")
+    assert clk.cycles == 4
+    # the callback is moved when the period changes while waiting
+    predicted = []
+
+    async def change_period():
+        await Timer(1, "ns")
+        clk.set_period(20, "ns")
+        predicted.append(clk.cycle_time(7))
+
+    cocotb.start_soon(change_period())
+    await AtCycle(clk, 7)
+    assert [get_sim_time()] == predicted
+    await Timer(1, "ns")
+    assert clk.cycles == 7
+    assert get_sim_time() < clk.next_edge_time()
+    clk_gen.kill()
+
+
+@cocotb.test()
+async def test_clock_cycles_errors(dut):
+    clk = Clock(dut.clk, 10, "ns")
+    assert clk.cycles == 0
+    with pytest.raises(RuntimeError):
+        await AtCycle(clk, 1)
+    clk_gen = cocotb.start_soon(clk.start())
+    await Timer(1, "ns")
+    with pytest.raises(ValueError):
+        await AtCycle(clk, 1)
+    clk_gen.kill()
@@ -13,7 +13,7 @@ import pytest
 from common import _check_traceback
 
 import cocotb
-from cocotb.triggers import Combine, Event, First, Timer
+from cocotb.triggers import Combine, Event, First, Timer, with_timeout
 from cocotb.utils import get_sim_time
 
 
@@ -239,3 +239,30 @@ async def test_invalid_trigger_types(dut):
 
     with pytest.raises(TypeError):
         await Combine(Timer(1), o)
+
+
+@cocotb.test()
+async def test_first_combine_triggers_without_tasks(dut):
+    """Test that First, Combine and with_timeout on triggers wait without starting tasks"""
+    tasks_before = cocotb.task._id_count
+    timers = [Timer(2, "ns"), Timer(1, "ns")]
+    assert await First(*timers) is timers[1]
+    assert get_sim_time("ns") == 1
+
+    await Combine(Timer(1, "ns"), Timer(3, "ns"), Timer(2, "ns"))
+    assert get_sim_time("ns") == 4
+
+    await with_timeout(Timer(1, "ns"), 2, "ns")
+    with pytest.raises(cocotb.triggers.SimTimeoutError):
+        await with_timeout(Timer(3, "ns"), 2, "ns")
+    assert get_sim_time("ns") == 7
+
+    assert cocotb.task._id_count == tasks_before
+
+    # triggers that fire immediately when primed
+    e = Event()
+    e.set()
+    timer = Timer(1, "ns")
+    assert await First(timer, e.wait()) is not timer
+    await Combine(e.wait(), timer)
+    assert get_sim_time("ns") == 8
@@ -262,3 +262,97 @@ async def test_str_and_repr(_):
     s = repr(q)
     assert "_getters" not in s
     assert str(q)[:-1] in s
+
+
+@cocotb.test
+@cocotb.parametrize(
+    queue_type=[Queue, PriorityQueue, LifoQueue],
+    maxsize=[0, 3],
+)
+async def run_queue_many_test(dut, queue_type, maxsize):
+    q = queue_type(maxsize=maxsize)
+    ref_q = queue_type()
+
+    with pytest.raises(ValueError):
+        await q.get_many(max_items=0)
+
+    putter = cocotb.start_soon(q.put_many(range(10)))
+    for item in range(10):
+        ref_q.put_nowait(item)
+
+    got = []
+    while len(got) < 10:
+        items = await q.get_many(max_items=4)
+        assert 1 <= len(items) <= 4
+        got.extend(items)
+    await putter
+
+    assert q.empty()
+    assert sorted(got) == list(range(10))
+    if maxsize == 0:
+        # nothing was waiting, so items come out in the order of the queue type
+        assert got == [ref_q.get_nowait() for _ in range(10)]
+
+
+@cocotb.test()
+async def test_queue_killed_getter(dut):
+    q = Queue()
+
+    async def getter(lst):
+        lst.append(await q.get())
+
+    got = []
+    killed = cocotb.start_soon(getter(got))
+    await NullTrigger()
+    getters = [cocotb.start_soon(getter(got)) for _ in range(2)]
+    await NullTrigger()
+    killed.kill()
+
+    # the killed getter is skipped, items go to the getters still waiting
+    q.put_nowait(1)
+    q.put_nowait(2)
+    q.put_nowait(3)
+    await Combine(*getters)
+    assert got == [1, 2]
+    assert q.get_nowait() == 3
+
+
+@cocotb.test()
+async def test_queue_getter_killed_after_put(dut):
+    q = Queue()
+
+    async def getter(lst):
+        lst.append(await q.get())
+
+    got = []
+    killed = cocotb.start_soon(getter(got))
+    other = cocotb.start_soon(getter(got))
+    await NullTrigger()
+
+    # the getter is woken, but killed before it resumes to take the item
+    q.put_nowait(1)
+    killed.kill()
+
+    # the item is not lost, the next getter is woken instead
+    await other
+    assert got == [1]
+    assert q.empty()
+
+
+@cocotb.test()
+async def test_queue_putter_killed_after_get(dut):
+    q = Queue(maxsize=1)
+    q.put_nowait(0)
+
+    killed = cocotb.start_soon(q.put(1))
+    other = cocotb.start_soon(q.put(2))
+    await NullTrigger()
+
+    # the putter is woken, but killed before it resumes to put its item
+    assert q.get_nowait() == 0
+    killed.kill()
+
+    # the free slot is not lost, the next putter is woken instead
+    await other
+    assert q.get_nowait() == 2
+    assert q.empty()
@@ -0,0 +1,67 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests for cocotb.sampler.Sampler
+"""
+
+import pytest
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.sampler import Sampler
+from cocotb.triggers import ClockCycles, FallingEdge, ReadOnly, RisingEdge
+
+
+@cocotb.test()
+async def test_sampler(dut):
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+    dut.stream_in_valid.value = 0
+    dut.stream_in_data.value = 0
+
+    expected = []
+
+    async def monitor():
+        while True:
+            await RisingEdge(dut.clk)
+            await ReadOnly()
+            expected.append(
+                (int(dut.stream_in_valid.value), int(dut.stream_in_data.value))
+            )
+
+    order = []
+    data_samples = []
+    both_samples = []
+
+    def sample_data(data):
+        order.append("data")
+        data_samples.append(int(data))
+
+    def sample_both(valid, data):
+        order.append("both")
+        both_samples.append((int(valid), int(data)))
+
+    sampler = Sampler(dut.clk)
+    await FallingEdge(dut.clk)
+    monitor_task = cocotb.start_soon(monitor())
+    sampler.add(sample_data, dut.stream_in_data)
+    sampler.add(sample_both, dut.stream_in_valid, dut.stream_in_data)
+
+    for i in range(1, 6):
+        dut.stream_in_valid.value = i % 2
+        dut.stream_in_data.value = i
+        await FallingEdge(dut.clk)
+
+    assert both_samples == expected
+    assert data_samples == [data for _, data in expected]
+    assert order == ["data", "both"] * len(expected)
+
+    sampler.remove(sample_data)
+    await ClockCycles(dut.clk, 2)
+    assert len(data_samples) == len(expected) - 2
+    monitor_task.kill()
+
+    with pytest.raises(ValueError):
+        sampler.remove(sample_data)
+    with pytest.raises(TypeError):
+        sampler.add(sample_data, dut.stream_in_real)
@@ -909,3 +909,39 @@ async def test_task_done_callback_added_after_done(_) -> None:
     task._add_done_callback(done_callback)
     await NullTrigger()
     assert callback_ran
+
+
+@cocotb.test
+async def test_task_priority(_) -> None:
+    """Tasks ready at the same time are resumed by decreasing priority."""
+    order = []
+    e = Event()
+
+    async def waiter(name: str) -> None:
+        await e.wait()
+        order.append(name)
+
+    cocotb.start_soon(waiter("driver"))
+    cocotb.start_soon(waiter("monitor"), priority=1)
+    cocotb.start_soon(waiter("driver 2"))
+    low = cocotb.create_task(waiter("checker"), priority=-1)
+    assert low.priority == -1
+    cocotb.start_soon(low)
+    await Timer(1, "ns")
+
+    e.set()
+    await Timer(1, "ns")
+    assert order == ["monitor", "driver", "driver 2", "checker"]
+
+    # new tasks of higher priority run before the tasks scheduled before them
+    async def record(name: str) -> None:
+        order.append(name)
+
+    order.clear()
+    cocotb.start_soon(record("driver"))
+    await cocotb.start(record("monitor"), priority=1)
+    assert order == ["monitor", "driver"]
+
+    task = cocotb.start_soon(record("scheduled"))
+    with pytest.raises(RuntimeError):
+        task.priority = 1
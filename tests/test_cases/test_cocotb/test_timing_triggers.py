@@ -5,6 +5,7 @@
 Tests related to timing triggers
 
 * Timer
+* AtTime
 * ReadWrite
 * ReadOnly
 * NextTimeStep
@@ -22,6 +23,7 @@ import cocotb
 from cocotb.clock import Clock
 from cocotb.simulator import get_precision
 from cocotb.triggers import (
+    AtTime,
     First,
     NextTimeStep,
     ReadOnly,
@@ -370,3 +372,29 @@ async def test_readonly_in_readonly(_) -> None:
     await ReadOnly()
     with pytest.raises(RuntimeError):
         await ReadOnly()
+
+
+@cocotb.test
+async def test_at_time(_) -> None:
+    start = get_sim_time(units="ns")
+    order = []
+
+    async def wait(trigger, name):
+        await trigger
+        order.append((get_sim_time(units="ns") - start, name))
+
+    tasks = [
+        cocotb.start_soon(wait(AtTime(start + 10, units="ns"), "at")),
+        cocotb.start_soon(wait(Timer(10, units="ns"), "timer")),
+        cocotb.start_soon(wait(Timer(5, units="ns"), "early")),
+    ]
+    # a cancelled timer does not fire
+    cancelled = cocotb.start_soon(wait(Timer(7, units="ns"), "cancelled"))
+    await Timer(1, units="ns")
+    cancelled.kill()
+    for task in tasks:
+        await task
+    assert order == [(5, "early"), (10, "at"), (10, "timer")]
+
+    with pytest.raises(ValueError):
+        await AtTime(get_sim_time())
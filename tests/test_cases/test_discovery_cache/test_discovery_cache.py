@@ -0,0 +1,14 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import sys
+
+import cocotb
+
+
+@cocotb.test
+async def test_other_tests_imported(_):
+    imported = "other_tests" in sys.modules
+    assert imported != ("EXPECT_NOT_IMPORTED" in os.environ)